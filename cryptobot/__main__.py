@@ -1,98 +1,201 @@
+import atexit
 import os
+import sys
 
-from binance import Client
-from jinja2 import Environment, FileSystemLoader
+# first of all: the imports below are measured too
+from cryptobot.startup_profiler import StartupProfiler, func_is_profiling_requested
+startup_profiler: StartupProfiler | None = StartupProfiler.start() if func_is_profiling_requested(sys.argv, os.environ) else None
 
-from cryptobot.components.settings import SettingsComponent
-from cryptobot.components.telegram_http_transport import TelegramHttpTransportComponent
+from logging import warning
+
+from cryptobot.components.container import Container
+from cryptobot.components.commands_dispatcher import dispatch, parse_args
 from cryptobot.config import get_config
-from cryptobot.components import ServiceComponent, dispatch, parse_args, TelegramComponent, BinanceGateway, \
-    BinanceClientAdapter, BinanceApiAdapter
-from cryptobot.helpers import get_project_root, init_settings_component
-from cryptobot.ports import binance_gateway
-from cryptobot.ports.binance_api_adapter import BinanceApiAdapterPort
-from cryptobot.ports.binance_client_adapter import BinanceClientAdapterPort
-from cryptobot.ports.binance_gateway import BinanceGatewayPort
-from cryptobot.views.view import View
-from cryptobot.views import view_helper
+from cryptobot.helpers import init_settings_component
 
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
+# Every dependency is built on the first access: a `cron` tick or a `hook` gets the db, the view,
+# the telegram and the service, but never imports matplotlib, flask or opens the Binance client for nothing.
+# Heavy packages are imported inside the factories for the same reason.
 
-from peewee import MySQLDatabase
-from cryptobot.models import database_proxy
+# the processes which live long enough for preloading the templates to pay off
+RESIDENT_COMMANDS = ("webserver", "scheduler", "user_stream")
 
+def create_view(di: Container):
+    from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+    from cryptobot.helpers import get_project_root
+    from cryptobot.views.view import View
+    from cryptobot.views import view_helper
 
-def main():
-    config: dict = get_config()
-
-    args = parse_args("Cryptobot CLI")
+    view_config = di['config']["view"]
 
-    args.command = args.command.lower()
+    bytecode_cache = None
+    if view_config["bytecode_cache_enabled"]:
+        bytecode_cache_dir = view_config["bytecode_cache_dir"] or None
+        if bytecode_cache_dir is not None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
 
     environment = Environment(
         loader = FileSystemLoader(
-            get_project_root() + os.sep + config["view"]["views_folder"]
-        )
+            get_project_root() + os.sep + view_config["views_folder"]
+        ),
+        bytecode_cache = bytecode_cache,
     )
 
     environment.globals.update(view_helper.get_globals())
 
     default_vars = {}
 
-    db = MySQLDatabase(
-        config["db"]["name"], # database name
-        user = config["db"]["user"], # database username
-        password = config["db"]["pass"], # database password
-        host = config["db"]["host"],  # database host
-        port = config["db"]["port"]  # database port
-    )
-    database_proxy.initialize(db)
-    if not db.connect():
-        print(f'ERROR: Cannot connect to database {config["db"]["host"]}')
+    return View(environment, default_vars)
 
-    view = View(environment, default_vars)
+def create_db(di: Container):
+    from cryptobot.models import database_proxy, ReconnectPooledMySQLDatabase
 
-    settings_component = SettingsComponent.create(db)
+    # the pool connects on the first query
+    db = ReconnectPooledMySQLDatabase.create(di['config']["db"])
+    database_proxy.initialize(db)
+    return db
 
+def create_telegram_component(di: Container):
+    from cryptobot.components.telegram import TelegramComponent
+    from cryptobot.components.queued_telegram import QueuedTelegramComponent
+    from cryptobot.components.telegram_http_transport import TelegramHttpTransportComponent
+
+    config = di['config']
     telegram_component = TelegramComponent.create(config["telegram"], TelegramHttpTransportComponent())
+    if config["telegram"]["queue"]["enabled"]:
+        # notifications are sent in the background, the queue is drained before the process exits
+        telegram_component = QueuedTelegramComponent.create(telegram_component, config["telegram"]["queue"])
+        atexit.register(telegram_component.close)
+    return telegram_component
+
+def create_binance_gateway(di: Container):
+    from cryptobot.components.binance_api_adapter import BinanceApiAdapter
+    from cryptobot.components.binance_client_adapter import BinanceClientAdapter
+    from cryptobot.components.binance_gateway import BinanceGateway
 
-    binance_client: Client = Client(config['binance']['api']['key'], config['binance']['api']['secret'])
-    binance_client_adapter: BinanceClientAdapterPort = BinanceClientAdapter.create(binance_client=binance_client)
+    config = di['config']
 
-    binance_api_adapter: BinanceApiAdapterPort = BinanceApiAdapter.create(
+    # python-binance Client is created (and pings the API) on the first call through the adapter
+    binance_client_adapter = BinanceClientAdapter.create(
+        binance_api_key=config['binance']['api']['key'],
+        binance_api_secret=config['binance']['api']['secret'],
+    )
+
+    binance_api_adapter = BinanceApiAdapter.create(
         base_url=config['binance']['api']['base_url'],
         binance_api_key=config['binance']['api']['key'],
         binance_api_secret=config['binance']['api']['secret'],
+        connect_timeout=config['binance']['api']['connect_timeout'],
+        read_timeout=config['binance']['api']['read_timeout'],
+        pool_maxsize=config['binance']['api']['pool_maxsize'],
     )
 
-    binance_gateway: BinanceGatewayPort = BinanceGateway.create(
+    return BinanceGateway.create(
         binance_client_adapter=binance_client_adapter,
         binance_api_adapter=binance_api_adapter,
+        symbol_info_ttl_seconds=config['binance']['symbol_info_ttl_seconds'],
     )
 
-    di = { # fuck that Python...
-        'config': config,
-        'view': view,
-        'plt': plt,
-        'db': db,
-        'service_component': ServiceComponent.create(
-            db=db,
-            view=view,
-            telegram_component=telegram_component,
-            binance_gateway=binance_gateway,
-        ),
-        'settings_component': settings_component,
-    }
+def create_binance_user_stream_adapter(di: Container):
+    from cryptobot.components.binance_user_stream_adapter import BinanceUserStreamAdapter
+
+    return BinanceUserStreamAdapter.create(
+        binance_api_key=di['config']['binance']['api']['key'],
+        binance_api_secret=di['config']['binance']['api']['secret'],
+    )
+
+def create_chart_renderer(di: Container):
+    from cryptobot.components.chart_renderer import ChartRenderer
+
+    return ChartRenderer.create()
+
+def create_service_component(di: Container):
+    from cryptobot.components.service import ServiceComponent
+    from cryptobot.components.kline_store import KlineStore
+    from cryptobot.components.chart_cache import ChartCache
+
+    return ServiceComponent.create(
+        db=di['db'],
+        view=di['view'],
+        telegram_component=di['telegram_component'],
+        binance_gateway=di['binance_gateway'],
+        kline_store=KlineStore.create(binance_gateway=di['binance_gateway'], db=di['db']),
+        chart_cache=ChartCache.create(di['config']['chart_cache']),
+    )
+
+def create_settings_component(di: Container):
+    from cryptobot.components.settings import SettingsComponent
+
+    return SettingsComponent.create(di['db'], di['config']['settings'])
+
+def create_di(config: dict) -> Container:
+    return Container(
+        {
+            'view': create_view,
+            'db': create_db,
+            'telegram_component': create_telegram_component,
+            'binance_gateway': create_binance_gateway,
+            'binance_user_stream_adapter': create_binance_user_stream_adapter,
+            'chart_renderer': create_chart_renderer,
+            'service_component': create_service_component,
+            'settings_component': create_settings_component,
+        },
+        config=config,
+    )
+
+def proc_register_mappers(config: dict) -> None:
+    from cryptobot.mappers.balance_mapper import BalanceMapper
+    from cryptobot.mappers.order_mapper import OrderMapper
+
+    for symbol, value in config["mappers"]["symbols"].items():
+        OrderMapper.register_symbol(symbol, value)
+    for asset, value in config["mappers"]["assets"].items():
+        BalanceMapper.register_asset(asset, value)
+
+def func_get_startup_budget_ms(config: dict, command: str) -> int:
+    # STARTUP_COMMAND_BUDGETS_MS is case-insensitive, the shared parser keeps the names as they are (MAPPERS_* are case-sensitive)
+    command_budgets_ms = {name.lower(): budget_ms for name, budget_ms in config["startup"]["command_budgets_ms"].items()}
+    return command_budgets_ms.get(command.lower(), config["startup"]["budget_ms"])
+
+def proc_report_startup(profiler: StartupProfiler, config: dict, di: Container, args) -> None:
+    """
+    --profile-startup: prints the report and exits without executing the command, exit code 1 above the budget.
+    CRYPTOBOT_PROFILE_STARTUP=1: prints the report and goes on, a warning above the budget.
+    """
+    profiler.proc_stop()
+    budget_ms = func_get_startup_budget_ms(config, args.command)
+    print(profiler.func_report(args.command, di.func_get_build_seconds(), budget_ms), file=sys.stderr)
+    is_over_budget = profiler.func_is_over_budget(budget_ms)
+    if args.profile_startup:
+        sys.exit(1 if is_over_budget else 0)
+    if is_over_budget:
+        warning(f"Startup of '{args.command}' took {profiler.func_get_elapsed_seconds() * 1000:.1f} ms, the budget is {budget_ms} ms")
+
+def main():
+    config: dict = get_config()
+
+    args = parse_args("Cryptobot CLI")
+
+    args.command = args.command.lower()
+
+    proc_register_mappers(config)
+
+    di = create_di(config)
 
     init_settings_component(di['settings_component'])
 
+    if args.command in RESIDENT_COMMANDS and config["view"]["preload_templates"]:
+        di['view'].preload_templates()
+
     # commands dispatching
     err, command = dispatch(di, args)
     if err is not None:
         print(err)
 
+    if startup_profiler is not None:
+        proc_report_startup(startup_profiler, config, di, args)
+
     if not command.execute():
         print("ERROR: Command '{}' failed.".format(args.command))
 
@@ -8,7 +8,8 @@ from .show_settings import ShowSettingsCommand
 from .webserver import WebserverCommand
 from .hook import HookCommand
 from .cron import CronCommand
-from .misc import MiscCommand
+from .scheduler import SchedulerCommand
+from .user_stream import UserStreamCommand
 
 __all__ = [
     "AbstractCommand",
@@ -21,5 +22,14 @@ __all__ = [
     "WebserverCommand",
     "HookCommand",
     "CronCommand",
+    "SchedulerCommand",
+    "UserStreamCommand",
     "MiscCommand",
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str):
+    # misc imports matplotlib.pyplot and binance at module level, the other commands should not pay for it
+    if name == "MiscCommand":
+        from .misc import MiscCommand
+        return MiscCommand
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,7 +4,9 @@ from time import sleep
 from cryptobot.commands import AbstractCommand
 from cryptobot.commands.cron_check_balance_from_binance import CronCheckBalanceFromBinanceCommand
 from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
+from cryptobot.commands.cron_do_orders_incremental_routine import CronDoOrdersIncrementalRoutineCommand
 from cryptobot.commands.cron_notify_working import CronNotifyWorkingCommand
+from cryptobot.commands.cron_prerender_price_charts import CronPrerenderPriceChartsCommand
 from cryptobot.commands.cron_update_trades_for_partially_filled_orders import \
     CronUpdateTradesForPartiallyFilledOrdersCommand
 from cryptobot.components import ServiceComponent
@@ -24,6 +26,16 @@ logging.basicConfig(level=logging.INFO)
 
 millis_on_start = current_millis() - 10000 # dirty bidlokod
 
+# cron_jobs.name -> command class executing the job
+CRON_JOB_COMMANDS: dict[str, type[AbstractCommand]] = {
+    'notify-working': CronNotifyWorkingCommand,
+    'check-balance-from-binance': CronCheckBalanceFromBinanceCommand,
+    'update-trades-for-partially-filled-orders': CronUpdateTradesForPartiallyFilledOrdersCommand,
+    'do-orders-updating-routine': CronDoOrdersUpdatingRoutineCommand,
+    'do-orders-incremental-routine': CronDoOrdersIncrementalRoutineCommand,
+    'prerender-price-charts': CronPrerenderPriceChartsCommand,
+}
+
 class CronCommand(AbstractCommand):
 
     def __init__(self):
@@ -47,48 +59,37 @@ class CronCommand(AbstractCommand):
         
         info(f"Cron execution started")
 
-        cron_jobs_to_execute = list(
+        cron_jobs_to_execute = self.func_get_cron_jobs_to_execute(millis_on_start)
+
+        if len(cron_jobs_to_execute) == 0:
+            info(f"Cron : no jobs to execute")
+
+        for cron_job_to_execute in cron_jobs_to_execute:
+            self.proc_execute_cron_job(cron_job_to_execute, millis_on_start)
+
+        return True
+
+    def func_get_cron_jobs_to_execute(self, executed_at: int) -> list[CronJob]:
+        return list(
             CronJob
                 .select()
                 .where(
                     (CronJob.last_executed_at.is_null())
-                    | (CronJob.last_executed_at + CronJob.execution_interval_seconds * 1000 <= millis_on_start)
+                    | (CronJob.last_executed_at + CronJob.execution_interval_seconds * 1000 <= executed_at)
                 )
                 .execute()
         )
 
-        if len(cron_jobs_to_execute) == 0:
-            info(f"Cron : no jobs to execute")
-
-        for cron_job_to_execute in cron_jobs_to_execute:
-
-            if cron_job_to_execute.name == 'notify-working':
-                if (CronNotifyWorkingCommand()
-                        .set_payload(chat_id=self._payload["chat_id"])
-                        .set_deps(service_component=self._service_component, view=self._view)
-                        .execute()):
-                    cron_job_to_execute.last_executed_at = millis_on_start
-                    cron_job_to_execute.save()
-            if cron_job_to_execute.name == 'check-balance-from-binance':
-                if(CronCheckBalanceFromBinanceCommand()
-                        .set_payload(chat_id=self._payload["chat_id"])
-                        .set_deps(service_component=self._service_component, view=self._view)
-                        .execute()):
-                    cron_job_to_execute.last_executed_at = millis_on_start
-                    cron_job_to_execute.save()
-            if cron_job_to_execute.name == 'update-trades-for-partially-filled-orders':
-                if(CronUpdateTradesForPartiallyFilledOrdersCommand()
-                        .set_payload(chat_id=self._payload["chat_id"])
-                        .set_deps(service_component=self._service_component, view=self._view)
-                        .execute()):
-                    cron_job_to_execute.last_executed_at = millis_on_start
-                    cron_job_to_execute.save()
-            if cron_job_to_execute.name == 'do-orders-updating-routine':
-                if(CronDoOrdersUpdatingRoutineCommand()
-                        .set_payload(chat_id=self._payload["chat_id"])
-                        .set_deps(service_component=self._service_component, view=self._view)
-                        .execute()):
-                    cron_job_to_execute.last_executed_at = millis_on_start
-                    cron_job_to_execute.save()
-
-        return True
\ No newline at end of file
+    def proc_execute_cron_job(self, cron_job: CronJob, executed_at: int) -> bool:
+        command_class = CRON_JOB_COMMANDS.get(cron_job.name)
+        if command_class is None:
+            warning(f"Cron : unknown job '{cron_job.name}', skipping")
+            return False
+        if (command_class()
+                .set_payload(chat_id=self._payload["chat_id"])
+                .set_deps(service_component=self._service_component, view=self._view)
+                .execute()):
+            cron_job.last_executed_at = executed_at
+            cron_job.save()
+            return True
+        return False
@@ -0,0 +1,57 @@
+from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
+from cryptobot.mappers.order_mapper import OrderMapper
+from cryptobot.models import Order
+
+import logging
+from logging import info, warning
+
+logging.basicConfig(level=logging.INFO)
+
+class CronDoOrdersIncrementalRoutineCommand(CronDoOrdersUpdatingRoutineCommand):
+    """
+    The same routine as CronDoOrdersUpdatingRoutineCommand, but it costs O(open orders) instead of O(lifetime orders):
+    - db: only the orders in open statuses
+    - binance: open orders, orders newer than the newest one in db and targeted get_order
+      for the orders which have just left the open set
+    The full routine stays for a rare complete reconciliation.
+    """
+
+    def func_collect_orders(self) -> tuple[dict[int, Order], list[dict]]:
+        db_orders: dict[int, Order] = self._service_component.get_open_db_orders_indexed()
+        info(f"len(open db_orders): '{len(db_orders)}'")
+
+        max_binance_order_ids: dict[str, int] = self._service_component.get_max_db_binance_order_ids_by_symbols()
+        info(f"symbols: {list(max_binance_order_ids.keys())}")
+
+        binance_orders: dict[int, dict] = {}
+
+        # open orders of all the symbols - one call
+        for binance_order in self._service_component.get_open_orders():
+            if binance_order['symbol'] in max_binance_order_ids:
+                binance_orders[binance_order['orderId']] = binance_order
+
+        # orders created since the last run (they may be even filled already)
+        for symbol, max_binance_order_id in max_binance_order_ids.items():
+            for binance_order in self._service_component.get_all_orders(symbol=symbol, order_id=max_binance_order_id + 1):
+                binance_orders[binance_order['orderId']] = binance_order
+
+        # open in db, but not open on binance anymore - filled, cancelled, expired...
+        for binance_order_id, db_order in db_orders.items():
+            if binance_order_id in binance_orders:
+                continue
+            binance_order = self._service_component.get_order_by_binance_order_id_and_binance_symbol(
+                binance_order_id,
+                OrderMapper.remap_symbol(db_order.symbol),
+            )
+            if not binance_order:
+                warning(f"binance_order#{binance_order_id} not found on binance")
+                continue
+            binance_orders[binance_order_id] = binance_order
+
+        # binance orders known in db, but not in open statuses there
+        db_orders.update(self._service_component.get_db_orders_indexed_by_binance_order_ids(
+            [binance_order_id for binance_order_id in binance_orders.keys() if binance_order_id not in db_orders]
+        ))
+
+        info(f"len(binance_orders): '{len(binance_orders)}'")
+        return db_orders, list(binance_orders.values())
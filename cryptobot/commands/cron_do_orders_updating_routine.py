@@ -1,5 +1,4 @@
 from decimal import Decimal
-from time import sleep
 
 from cryptobot.commands import AbstractCommand
 from cryptobot.components import ServiceComponent
@@ -17,8 +16,6 @@ from cryptobot.views.view_helper import to_eng_string
 
 logging.basicConfig(level=logging.INFO)
 
-millis_on_start = current_millis() - 10000 # dirty bidlokod
-
 class CronDoOrdersUpdatingRoutineCommand(AbstractCommand):
 
     def __init__(self):
@@ -42,6 +39,116 @@ class CronDoOrdersUpdatingRoutineCommand(AbstractCommand):
         
         info(f"CronDoOrdersUpdatingRoutine execution started")
 
+        # taken per execution (not per process), the command may live inside the resident scheduler
+        millis_on_start = current_millis() - 10000 # dirty bidlokod
+
+        db_orders, binance_orders = self.func_collect_orders()
+
+        for binance_order in binance_orders:
+            info(f"iteration : binance_order_id '{binance_order['orderId']}'")
+            self.proc_handle_binance_order(
+                binance_order=binance_order,
+                db_order=db_orders.get(binance_order['orderId']),
+                millis_on_start=millis_on_start,
+            )
+
+        return True
+
+    def proc_handle_binance_order(self, binance_order: dict, db_order: Order | None, millis_on_start: int, refresh_balances: bool = True):
+        """
+        Brings one db order to the state of binance_order (REST-shaped order dict) and notifies about the changes.
+        Shared by this polling routine and by the user data stream listener (UserStreamCommand).
+        refresh_balances: False if the balances come from elsewhere (`outboundAccountPosition` of the user stream)
+        """
+        # upsert order into db if not exists
+        if db_order is None:
+            db_order = self.func_upsert_binance_order_and_notify(
+                binance_order=binance_order,
+                chat_id=self._payload["chat_id"],
+            )
+        else: # if order exists - take it from collection of existed orders
+            info(f"existed db_order.id: '{db_order.id}'")
+
+        # remember old order's status
+        old_db_order_status = db_order.status
+        info(f"old_db_order_status: '{old_db_order_status}'")
+
+        # the user stream and the cron routines may handle the same change of the same order at the same time:
+        # the changes are claimed in db before any side effect, only the claiming caller notifies,
+        # syncs the trades and places the follow-up order
+        mapped_binance_order_status = OrderMapper.map_status(binance_order['status'])
+        is_status_change_claimed = (
+            old_db_order_status != mapped_binance_order_status
+            and self.func_claim_status_change(db_order, old_db_order_status, mapped_binance_order_status)
+        )
+        is_quantity_change_claimed = (
+            Decimal(binance_order['executedQty']) != Decimal(db_order.executed_quantity)
+            and self.func_claim_quantity_change(db_order, Decimal(binance_order['executedQty']))
+        )
+
+        # if executedQty has changed - order's filling happened (it may be partial)
+        if is_quantity_change_claimed:
+            db_order = self.func_handle_quantity_change_and_notify(
+                binance_order=binance_order,
+                db_order=db_order,
+                millis_on_start=millis_on_start,
+                chat_id=self._payload["chat_id"],
+            )
+
+        # if order's status has changed
+        if is_status_change_claimed:
+            db_order = self.func_handle_order_status_change(
+                db_order=db_order,
+                old_db_order_status=old_db_order_status,
+                mapped_binance_order_status=mapped_binance_order_status,
+                chat_id=self._payload["chat_id"],
+                binance_updated_at=binance_order.get('updateTime'),
+                refresh_balances=refresh_balances,
+            )
+
+            # if status has changed and the new status is in [CANCELLED, PARTIALLY_FILLED, FILLED]
+            if db_order.status in [
+                OrderMapper.STATUS_CANCELED,
+                OrderMapper.STATUS_PARTIALLY_FILLED,
+                OrderMapper.STATUS_FILLED,
+            ]:
+                # load and upsert trades for the db_order
+                self._service_component.update_trades_from_binance_to_db(order_ids=[db_order.id],)
+                db_order.trades_checked = True
+                db_order.save()
+                info(f"db_order.id#{db_order.id} trades_checked: '{db_order.trades_checked}'")
+
+            # if status has changed and the new status is FILLED then place new order
+            if db_order.status == OrderMapper.STATUS_FILLED:
+                self.proc_place_new_binance_order(db_order=db_order, chat_id=self._payload["chat_id"])
+
+        return db_order
+
+    def func_claim_status_change(self, db_order: Order, old_db_order_status: int, mapped_binance_order_status: int) -> bool:
+        """Atomic compare-and-set of the status: False if another process has already moved it from the old one"""
+        claimed: bool = (Order
+                         .update(status=mapped_binance_order_status, trades_checked=False)
+                         .where((Order.id == db_order.id) & (Order.status == old_db_order_status))
+                         .execute()) == 1
+        if not claimed:
+            info(f"db_order.id#{db_order.id} status change '{old_db_order_status}' -> '{mapped_binance_order_status}' is already handled by another process")
+        return claimed
+
+    def func_claim_quantity_change(self, db_order: Order, executed_quantity: Decimal) -> bool:
+        """Atomic compare-and-set of executed_quantity: False if another process has already changed it"""
+        claimed: bool = (Order
+                         .update(executed_quantity=executed_quantity)
+                         .where((Order.id == db_order.id) & (Order.executed_quantity == db_order.executed_quantity))
+                         .execute()) == 1
+        if not claimed:
+            info(f"db_order.id#{db_order.id} executed_quantity change -> '{to_eng_string(executed_quantity)}' is already handled by another process")
+        return claimed
+
+    def func_collect_orders(self) -> tuple[dict[int, Order], list[dict]]:
+        """
+        Full reconciliation: all the db orders against the whole orders history of their symbols.
+        Returns the db orders indexed by binance_order_id and the binance orders to handle.
+        """
         # get all orders from db
         db_orders: dict[int, Order] = self._service_component.get_all_db_orders_indexed()
         info(f"len(db_orders): '{len(db_orders)}'")
@@ -55,60 +162,7 @@ class CronDoOrdersUpdatingRoutineCommand(AbstractCommand):
 
         # get all orders from binance for each symbol
         binance_orders: list[dict] = self.func_get_binance_orders(symbols=symbols)
-        del symbols
-
-        for binance_order in binance_orders:
-            info(f"iteration : binance_order_id '{binance_order['orderId']}'")
-            # upsert order into db if not exists
-            if binance_order['orderId'] not in db_orders:
-                db_order = self.func_upsert_binance_order_and_notify(
-                    binance_order=binance_order,
-                    chat_id=self._payload["chat_id"],
-                )
-            else: # if order exists - take it from collection of existed orders
-                db_order = db_orders[binance_order['orderId']]
-                info(f"existed db_order.id: '{db_order.id}'")
-
-            # remember old order's status
-            old_db_order_status = db_order.status
-            info(f"old_db_order_status: '{old_db_order_status}'")
-
-            # if executedQty has changed - order's filling happened (it may be partial)
-            if Decimal(binance_order['executedQty']) != Decimal(db_order.executed_quantity):
-                db_order = self.func_handle_quantity_change_and_notify(
-                    binance_order=binance_order,
-                    db_order=db_order,
-                    millis_on_start=millis_on_start,
-                    chat_id=self._payload["chat_id"],
-                )
-
-            # if order's status has changed
-            mapped_binance_order_status = OrderMapper.map_status(binance_order['status'])
-            if old_db_order_status != mapped_binance_order_status:
-                db_order = self.func_handle_order_status_change(
-                    db_order=db_order,
-                    old_db_order_status=old_db_order_status,
-                    mapped_binance_order_status=mapped_binance_order_status,
-                    chat_id=self._payload["chat_id"],
-                )
-
-                # if status has changed and the new status is in [CANCELLED, PARTIALLY_FILLED, FILLED]
-                if db_order.status in [
-                    OrderMapper.STATUS_CANCELED,
-                    OrderMapper.STATUS_PARTIALLY_FILLED,
-                    OrderMapper.STATUS_FILLED,
-                ]:
-                    # load and upsert trades for the db_order
-                    self._service_component.update_trades_from_binance_to_db(order_ids=[db_order.id],)
-                    db_order.trades_checked = True
-                    db_order.save()
-                    info(f"db_order.id#{db_order.id} trades_checked: '{db_order.trades_checked}'")
-
-                # if status has changed and the new status is FILLED then place new order
-                if db_order.status == OrderMapper.STATUS_FILLED:
-                    self.proc_place_new_binance_order(db_order=db_order, chat_id=self._payload["chat_id"])
-
-        return True
+        return db_orders, binance_orders
 
     def func_get_binance_orders(self, symbols: list[str]) -> list[dict]:
         binance_orders: list[dict] = []
@@ -166,7 +220,7 @@ class CronDoOrdersUpdatingRoutineCommand(AbstractCommand):
         )
         return db_order
 
-    def func_handle_order_status_change(self, db_order: Order, old_db_order_status: int, mapped_binance_order_status: int, chat_id: int) -> Order:
+    def func_handle_order_status_change(self, db_order: Order, old_db_order_status: int, mapped_binance_order_status: int, chat_id: int, binance_updated_at: int | None = None, refresh_balances: bool = True) -> Order:
         info(f"db_order.id#{db_order.id} status change: '{old_db_order_status}' != '{mapped_binance_order_status}'")
 
         # save new status to db
@@ -176,12 +230,13 @@ class CronDoOrdersUpdatingRoutineCommand(AbstractCommand):
         db_order.save()
         info(f"db_order.id#{db_order.id} status: '{db_order.status}'")
         info(f"db_order.id#{db_order.id} trades_checked: '{db_order.trades_checked}'")
-        # update assets balances
-        sleep(1)
-        self._service_component.update_assets_from_binance_to_db(
-            assets=BalanceMapper.get_assets().keys(),
-            force_insert=True,
-        )
+        # update assets balances, from an account snapshot that already has the status change applied
+        if refresh_balances:
+            self._service_component.update_assets_from_binance_to_db(
+                assets=BalanceMapper.get_assets().keys(),
+                force_insert=True,
+                updated_since=int(binance_updated_at) if binance_updated_at else None,
+            )
 
         # notify about order's status change
         self._service_component.notify_order_status_changed(
@@ -0,0 +1,74 @@
+from cryptobot.commands import AbstractCommand
+from cryptobot.commands.show_price_chart import ShowPriceChartCommand
+from cryptobot.commands.show_price_chart_options import PRICE_CHART_PRESETS
+from cryptobot.components import ServiceComponent
+from cryptobot.components.chart_renderer import ChartRenderer
+from cryptobot.ports.chart_renderer import ChartRendererPort
+from cryptobot.views.view import View
+
+import logging
+from logging import error, info
+
+logging.basicConfig(level=logging.INFO)
+
+class CronPrerenderPriceChartsCommand(AbstractCommand):
+    """
+    Keeps the preset charts (PRICE_CHART_PRESETS) of all the symbols present in db rendered in the chart cache,
+    so `show_price_chart` only sends the stored image. A chart is rendered again only when its cache key
+    has changed (new candle, other open orders) or the cached one has expired.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._view = None
+        self._chart_renderer = None
+
+    def set_payload(self, chat_id: int):
+        self._payload["chat_id"] = chat_id
+        self._initialized = True
+        return self
+
+    def set_deps(self, service_component: ServiceComponent, view: View, chart_renderer: ChartRendererPort = None):
+        self._service_component = service_component
+        self._view = view
+        self._chart_renderer = chart_renderer
+        return self
+
+    def execute(self):
+        if not self._initialized:
+            print(f"ERROR: Command {self.__class__.__name__} is NOT initialized")
+            return False
+
+        info(f"CronPrerenderPriceCharts execution started")
+
+        chart_cache = self._service_component.chart_cache
+        if chart_cache is None:
+            error(f"CronPrerenderPriceCharts : there is no chart cache, nothing to pre-render into")
+            return False
+        if getattr(chart_cache, 'cache_dir', None) is None:
+            # the charts would stay in the memory of this cron process, the webserver would never see them
+            error(f"CronPrerenderPriceCharts : CHART_CACHE_DIR is not set, nothing to pre-render into")
+            return False
+
+        if self._chart_renderer is None:
+            # cron jobs get no chart renderer from the dispatcher
+            self._chart_renderer = ChartRenderer.create()
+
+        rendered = 0
+        skipped = 0
+        for binance_symbol in self._service_component.get_db_binance_symbols():
+            for period, interval in PRICE_CHART_PRESETS:
+                command = (ShowPriceChartCommand()
+                           .set_payload(binance_symbol, period.replace('_', ' '), interval, self._payload["chat_id"])
+                           .set_deps(self._service_component, self._view, self._chart_renderer))
+                try:
+                    if command.func_prerender():
+                        rendered += 1
+                    else:
+                        skipped += 1
+                except Exception as e:
+                    # one broken chart must not stop the others
+                    error(f"CronPrerenderPriceCharts : cannot render '{binance_symbol}' '{period}' '{interval}': {e}")
+
+        info(f"CronPrerenderPriceCharts : rendered: {rendered}, still actual: {skipped}")
+        return True
@@ -43,8 +43,8 @@ class CronUpdateTradesForPartiallyFilledOrdersCommand(AbstractCommand):
         updated_trades = self._service_component.update_trades_from_binance_to_db(
             order_ids=db_order_ids,
         )
-        if len(updated_trades) > 0:
-            l(self, f"handler_update_trades_for_partially_filled_orders: updated trades: '{updated_trades}' (total: '{len(updated_trades)}')", 'info')
+        if updated_trades['inserted'] + updated_trades['updated'] > 0:
+            l(self, f"handler_update_trades_for_partially_filled_orders: inserted trades: '{updated_trades['inserted']}', updated trades: '{updated_trades['updated']}'", 'info')
         return True
 
 
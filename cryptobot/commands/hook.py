@@ -8,6 +8,7 @@ from cryptobot.commands import ShowSettingsCommand
 import json
 
 from cryptobot.components import ServiceComponent
+from cryptobot.ports.chart_renderer import ChartRendererPort
 from cryptobot.views.view import View
 
 
@@ -16,13 +17,18 @@ class HookCommand(AbstractCommand):
     def __init__(self):
         super().__init__()
         self._view = None
-        self._plt = None
+        self._chart_renderer = None
         self._initialized = True
 
-    def set_deps(self, service_component: ServiceComponent, view: View, plt):
+    def set_payload(self, raw_data: str | None = None):
+        # None = read the update from stdin (`python -m cryptobot hook`)
+        self._payload["raw_data"] = raw_data
+        return self
+
+    def set_deps(self, service_component: ServiceComponent, view: View, chart_renderer: ChartRendererPort):
         self._service_component = service_component
         self._view = view
-        self._plt = plt
+        self._chart_renderer = chart_renderer
         return self
 
     def execute(self):
@@ -30,7 +36,9 @@ class HookCommand(AbstractCommand):
             print(f"ERROR: Command {self.__class__.__name__} is NOT initialized")
             return False
 
-        raw_data = sys.stdin.read()
+        raw_data = self._payload.get("raw_data")
+        if raw_data is None:
+            raw_data = sys.stdin.read()
         error(f" raw_data: {type(raw_data)} : {raw_data}")
         try:
             json_dict = json.loads(raw_data)
@@ -71,7 +79,7 @@ class HookCommand(AbstractCommand):
                 interval = text.split(":")[3]
                 command = (ShowPriceChartCommand()
                            .set_payload(binance_symbol, period, interval, chat_id)
-                           .set_deps(self._service_component, self._view, self._plt)
+                           .set_deps(self._service_component, self._view, self._chart_renderer)
                            )
                 command.execute()
 
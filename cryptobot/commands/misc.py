@@ -169,8 +169,8 @@ class MiscCommand(AbstractCommand):
     def misc_trades(self):
         trades = self._service_component.get_all_trades('ETHUSDT')
         print(trades)
-        inserted_trades = self._service_component.upsert_binance_trades(trades)
-        print(inserted_trades)
+        upserted_trades = self._service_component.upsert_binance_trades(trades)
+        print(upserted_trades)
         return True
 
     def misc_l(self):
@@ -0,0 +1,97 @@
+import signal
+import threading
+from time import sleep
+
+from cryptobot.commands.cron import CronCommand
+from cryptobot.helpers import current_millis
+from cryptobot.models import CronJob
+
+import logging
+from logging import error, info
+
+logging.basicConfig(level=logging.INFO)
+
+# a job that did not succeed is retried not earlier than this (or its own interval, if shorter)
+RETRY_DELAY_SECONDS = 60
+
+
+class SchedulerCommand(CronCommand):
+    """
+    Resident alternative to `python -m cryptobot cron`:
+    boots once, keeps the deps warm and fires `cron_jobs` rows by their `execution_interval_seconds`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._stopped = False
+        # cron_jobs.name -> millis, not retry failed jobs on every tick
+        self._not_before: dict[str, int] = {}
+
+    def set_payload(self, chat_id: int, tick_seconds: float = 1.0, max_ticks: int | None = None):
+        super().set_payload(chat_id)
+        # max time between two looks at `cron_jobs` (new rows, changed intervals)
+        self._payload["tick_seconds"] = tick_seconds
+        # None = run forever
+        self._payload["max_ticks"] = max_ticks
+        return self
+
+    def stop(self, *args):
+        self._stopped = True
+
+    def execute(self):
+        if not self._initialized:
+            print(f"ERROR: Command {self.__class__.__name__} is NOT initialized")
+            return False
+
+        info(f"Scheduler started (tick: {self._payload['tick_seconds']}s)")
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+
+        ticks = 0
+        try:
+            while not self._stopped and (self._payload["max_ticks"] is None or ticks < self._payload["max_ticks"]):
+                ticks += 1
+                # a connection is checked out (and pinged) per tick, not held while sleeping
+                with self._service_component.db.connection_context():
+                    self.proc_tick(current_millis())
+                    if self._payload["max_ticks"] is not None and ticks >= self._payload["max_ticks"]:
+                        break
+                    sleep_seconds = self.func_get_sleep_seconds(current_millis())
+                sleep(sleep_seconds)
+        except KeyboardInterrupt:
+            pass
+
+        info(f"Scheduler stopped after {ticks} tick(s)")
+        return True
+
+    def proc_tick(self, now: int) -> int:
+        executed = 0
+        for cron_job in self.func_get_cron_jobs_to_execute(now):
+            if self._not_before.get(cron_job.name, 0) > now:
+                continue
+            try:
+                if self.proc_execute_cron_job(cron_job, now):
+                    executed += 1
+                    self._not_before.pop(cron_job.name, None)
+                    continue
+            except Exception as e:
+                # one failing job must not take the whole daemon down
+                error(f"Scheduler : job '{cron_job.name}' failed: {e}")
+            retry_delay_seconds = min(RETRY_DELAY_SECONDS, cron_job.execution_interval_seconds)
+            self._not_before[cron_job.name] = now + retry_delay_seconds * 1000
+        return executed
+
+    def func_get_sleep_seconds(self, now: int) -> float:
+        tick_seconds: float = self._payload["tick_seconds"]
+        next_due_at: int | None = None
+        for cron_job in CronJob.select(CronJob.name, CronJob.last_executed_at, CronJob.execution_interval_seconds):
+            due_at = 0
+            if cron_job.last_executed_at is not None:
+                due_at = cron_job.last_executed_at + cron_job.execution_interval_seconds * 1000
+            due_at = max(due_at, self._not_before.get(cron_job.name, 0))
+            if next_due_at is None or due_at < next_due_at:
+                next_due_at = due_at
+        if next_due_at is None:
+            return tick_seconds
+        return max(0.0, min(tick_seconds, (next_due_at - now) / 1000))
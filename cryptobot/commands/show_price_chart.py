@@ -1,33 +1,39 @@
-import datetime
 import io
 
+import numpy as np
+
 from cryptobot.commands import AbstractCommand
 from cryptobot.components import ServiceComponent
+from cryptobot.helpers.downsampling import downsample_price_columns
+from cryptobot.ports.chart_renderer import ChartRendererPort
 from cryptobot.views.view import View
 
-KLINE_INTERVAL_1SECOND = "1s"
-KLINE_INTERVAL_1MINUTE = "1m"
-KLINE_INTERVAL_3MINUTE = "3m"
-KLINE_INTERVAL_5MINUTE = "5m"
-KLINE_INTERVAL_15MINUTE = "15m"
-KLINE_INTERVAL_30MINUTE = "30m"
-KLINE_INTERVAL_1HOUR = "1h"
-KLINE_INTERVAL_2HOUR = "2h"
-KLINE_INTERVAL_4HOUR = "4h"
-KLINE_INTERVAL_6HOUR = "6h"
-KLINE_INTERVAL_8HOUR = "8h"
-KLINE_INTERVAL_12HOUR = "12h"
-KLINE_INTERVAL_1DAY = "1d"
-KLINE_INTERVAL_3DAY = "3d"
-KLINE_INTERVAL_1WEEK = "1w"
-KLINE_INTERVAL_1MONTH = "1M"
+# re-exported, the intervals used to live here
+from cryptobot.ports.kline_intervals import (
+    KLINE_INTERVAL_1SECOND,
+    KLINE_INTERVAL_1MINUTE,
+    KLINE_INTERVAL_3MINUTE,
+    KLINE_INTERVAL_5MINUTE,
+    KLINE_INTERVAL_15MINUTE,
+    KLINE_INTERVAL_30MINUTE,
+    KLINE_INTERVAL_1HOUR,
+    KLINE_INTERVAL_2HOUR,
+    KLINE_INTERVAL_4HOUR,
+    KLINE_INTERVAL_6HOUR,
+    KLINE_INTERVAL_8HOUR,
+    KLINE_INTERVAL_12HOUR,
+    KLINE_INTERVAL_1DAY,
+    KLINE_INTERVAL_3DAY,
+    KLINE_INTERVAL_1WEEK,
+    KLINE_INTERVAL_1MONTH,
+)
 
 class ShowPriceChartCommand(AbstractCommand):
 
     def __init__(self):
         super().__init__()
         self._view = None
-        self._plt = None
+        self._chart_renderer = None
 
     def set_payload(self, binance_symbol: str, period: str, interval: str, chat_id: int):
         self._payload["binance_symbol"] = binance_symbol
@@ -38,10 +44,10 @@ class ShowPriceChartCommand(AbstractCommand):
         self._initialized = True
         return self
 
-    def set_deps(self, service_component: ServiceComponent, view: View, plt):
+    def set_deps(self, service_component: ServiceComponent, view: View, chart_renderer: ChartRendererPort):
         self._service_component = service_component
         self._view = view
-        self._plt = plt
+        self._chart_renderer = chart_renderer
         return self
 
     def execute(self):
@@ -49,61 +55,7 @@ class ShowPriceChartCommand(AbstractCommand):
             print(f"ERROR: Command {self.__class__.__name__} is NOT initialized")
             return False
 
-        klines = self._service_component.get_historical_klines(self._payload["binance_symbol"], self._payload["period"], self._payload["interval"])
-        price = self._service_component.get_price_for_binance_symbol(self._payload["binance_symbol"])
-        orders = self._service_component.get_open_orders()
-
-        timestamps = []
-        high_prices = []
-        low_prices = []
-        close_prices = []
-        average_prices = []
-        dates = []
-        for kline in klines:
-            timestamps.append(kline['open_time'])
-            high_prices.append(kline['high_price'])
-            low_prices.append(kline['low_price'])
-            close_prices.append(kline['close_price'])
-            average_prices.append(kline['average_price'])
-            dates.append(datetime.datetime.fromtimestamp(kline['open_time']))
-
-        timestamps.append(round(int(price['closeTime']) / 1000))
-        high_prices.append(round(float(price['price']), 2))
-        low_prices.append(round(float(price['price']), 2))
-        close_prices.append(round(float(price['price']), 2))
-        average_prices.append(round(float(price['price']), 2))
-        dates.append(datetime.datetime.fromtimestamp(round(int(price['closeTime']) / 1000)))
-
-        self._plt.figure(figsize=(10, 5))
-        self._plt.fill_between(dates, low_prices, high_prices, color = 'skyblue', alpha = 0.3, label = "Price range (Low-High)")
-        self._plt.plot(dates, close_prices, color = 'blue', label = "Close Price", linewidth = 2)
-
-        if len(average_prices):
-            self._plt.axhline(y = average_prices[-1], color = "blue", linestyle = "--")
-            self._plt.text(dates[0], average_prices[-1], f"Current price: {average_prices[-1]}", va = 'bottom', color = "blue")
-
-        for order in orders:
-            color: str = 'green' if order['side'] == 'BUY' else 'red'
-            self._plt.axhline(y = round(float(order['price']), 2), color = color, linestyle = "--")
-            self._plt.text(dates[0], round(float(order['price']), 2), f"{round(float(order['price']), 2)} ({order['side'].lower()} {round(float(order['origQty']), 4)}, order amount: {round(float(order['price'])  * float(order['origQty']), 2)})", va = 'bottom', color=color)
-
-        title: str = f"{self._payload["binance_symbol"]} - Price History (since {self._payload["period"]}, interval {self._payload["interval"]})"
-        self._plt.title(title)
-        self._plt.xlabel("Date")
-        self._plt.ylabel(f"Price ({self._payload["binance_symbol"]})")
-        self._plt.legend()
-        self._plt.grid(True)
-
-        """
-        self._plt.tight_layout()
-        self._plt.savefig("chart.png")
-        self._plt.close()
-        """
-
-        buf = io.BytesIO()
-        self._plt.savefig(buf, format = 'png')
-        self._plt.close()
-        buf.seek(0)
+        title, png = self.func_get_chart()
 
         """
         message = self._view.render('telegram/price.j2', {
@@ -112,5 +64,64 @@ class ShowPriceChartCommand(AbstractCommand):
         })
         """
         #self._service_component.send_telegram_message(self._payload["chat_id"], json.dumps(klines))
-        self._service_component.send_telegram_photo(self._payload["chat_id"], buf, title)
-        return True
\ No newline at end of file
+        self._service_component.send_telegram_photo(self._payload["chat_id"], io.BytesIO(png), title)
+        return True
+
+    def func_get_title(self) -> str:
+        return f"{self._payload["binance_symbol"]} - Price History (since {self._payload["period"]}, interval {self._payload["interval"]})"
+
+    def func_get_chart(self) -> tuple[str, bytes]:
+        """The cached chart (if it is still actual) or a freshly rendered one"""
+        klines, price, orders, cache_key = self.func_collect_chart_data()
+        if cache_key is not None:
+            png: bytes | None = self._service_component.chart_cache.get(cache_key)
+            if png is not None:
+                return self.func_get_title(), png
+        return self.func_get_title(), self.func_render_and_cache(klines, price, orders, cache_key)
+
+    def func_prerender(self) -> bool:
+        """Renders the chart into the cache unless the cached one is still actual, returns True if rendered"""
+        klines, price, orders, cache_key = self.func_collect_chart_data()
+        if cache_key is None or self._service_component.chart_cache.get(cache_key) is not None:
+            return False
+        self.func_render_and_cache(klines, price, orders, cache_key)
+        return True
+
+    def func_collect_chart_data(self) -> tuple[np.ndarray, dict, list[dict], str | None]:
+        klines = self._service_component.get_historical_klines_columns(self._payload["binance_symbol"], self._payload["period"], self._payload["interval"])
+        price = self._service_component.get_price_for_binance_symbol(self._payload["binance_symbol"])
+        orders = self._service_component.get_open_orders()
+
+        # the key changes when a new candle opens or the open orders change
+        cache_key: str | None = None
+        if self._service_component.chart_cache is not None:
+            cache_key = self._service_component.chart_cache.func_make_key(self._payload["binance_symbol"], self._payload["period"], self._payload["interval"], klines, orders)
+        return klines, price, orders, cache_key
+
+    def func_render_and_cache(self, klines: np.ndarray, price: dict, orders: list[dict], cache_key: str | None) -> bytes:
+        title: str = self.func_get_title()
+
+        # the current price is the last point of the chart
+        current_price = round(float(price['price']), 2)
+        dates = np.append(klines['open_time'], int(price['closeTime'])).astype('datetime64[ms]')
+        high_prices = np.append(klines['high_price'], current_price)
+        low_prices = np.append(klines['low_price'], current_price)
+        close_prices = np.append(klines['close_price'], current_price)
+
+        # long ranges with fine intervals are reduced to the chart width, so the render time does not depend on the range
+        dates, low_prices, high_prices, close_prices = downsample_price_columns(
+            dates, low_prices, high_prices, close_prices, self._chart_renderer.func_get_max_points(),
+        )
+
+        png: bytes = self._chart_renderer.render_price_chart(
+            dates=dates,
+            low_prices=low_prices,
+            high_prices=high_prices,
+            close_prices=close_prices,
+            orders=orders,
+            title=title,
+            ylabel=f"Price ({self._payload["binance_symbol"]})",
+        )
+        if cache_key is not None:
+            self._service_component.chart_cache.put(cache_key, png)
+        return png
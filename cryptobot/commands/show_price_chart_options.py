@@ -2,6 +2,19 @@ from cryptobot.commands import AbstractCommand
 from cryptobot.components import ServiceComponent
 from cryptobot.views.view import View
 
+# (period, interval) of the charts offered as buttons, pre-rendered by the `prerender-price-charts` cron job
+PRICE_CHART_PRESETS: list[tuple[str, str]] = [
+    ("1_year_ago_UTC", "1M"),
+    ("6_months_ago_UTC", "1M"),
+    ("3_months_ago_UTC", "1w"),
+    ("1_months_ago_UTC", "1d"),
+    ("1_week_ago_UTC", "1d"),
+    ("3_days_ago_UTC", "1h"),
+    ("1_day_ago_UTC", "1h"),
+    ("3_hours_ago_UTC", "1m"),
+    ("1_hour_ago_UTC", "1m"),
+]
+
 class ShowPriceChartOptionsCommand(AbstractCommand):
 
     def __init__(self):
@@ -28,15 +41,8 @@ class ShowPriceChartOptionsCommand(AbstractCommand):
         })
 
         keys = [
-            f"show_price_chart:{self._payload["binance_symbol"]}:1_year_ago_UTC:1M",
-            f"show_price_chart:{self._payload["binance_symbol"]}:6_months_ago_UTC:1M",
-            f"show_price_chart:{self._payload["binance_symbol"]}:3_months_ago_UTC:1w",
-            f"show_price_chart:{self._payload["binance_symbol"]}:1_months_ago_UTC:1d",
-            f"show_price_chart:{self._payload["binance_symbol"]}:1_week_ago_UTC:1d",
-            f"show_price_chart:{self._payload["binance_symbol"]}:3_days_ago_UTC:1h",
-            f"show_price_chart:{self._payload["binance_symbol"]}:1_day_ago_UTC:1h",
-            f"show_price_chart:{self._payload["binance_symbol"]}:3_hours_ago_UTC:1m",
-            f"show_price_chart:{self._payload["binance_symbol"]}:1_hour_ago_UTC:1m",
+            f"show_price_chart:{self._payload["binance_symbol"]}:{period}:{interval}"
+            for period, interval in PRICE_CHART_PRESETS
         ]
         inline_keyboard: list = []
         for key in keys:
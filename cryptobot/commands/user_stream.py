@@ -0,0 +1,138 @@
+import signal
+import threading
+
+from cryptobot.commands import AbstractCommand
+from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
+from cryptobot.components import ServiceComponent
+from cryptobot.mappers.balance_mapper import BalanceMapper
+from cryptobot.mappers.order_mapper import OrderMapper
+from cryptobot.models import Order
+from cryptobot.ports.binance_user_stream_adapter import BinanceUserStreamAdapterPort
+from cryptobot.views.view import View
+
+import logging
+from logging import error, info
+
+logging.basicConfig(level=logging.INFO)
+
+
+class UserStreamCommand(AbstractCommand):
+    """
+    Resident listener of the Binance user data stream: order changes are handled as soon as they happen
+    by the same logic as the polling `do-orders-updating-routine` (which stays as a reconciliation fallback).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._view = None
+        self._binance_user_stream_adapter = None
+        self._routine: CronDoOrdersUpdatingRoutineCommand | None = None
+
+    def set_payload(self, chat_id: int):
+        self._payload["chat_id"] = chat_id
+        self._initialized = True
+        return self
+
+    def set_deps(self, service_component: ServiceComponent, view: View, binance_user_stream_adapter: BinanceUserStreamAdapterPort):
+        self._service_component = service_component
+        self._view = view
+        self._binance_user_stream_adapter = binance_user_stream_adapter
+        return self
+
+    def execute(self):
+        if not self._initialized:
+            print(f"ERROR: Command {self.__class__.__name__} is NOT initialized")
+            return False
+
+        info(f"UserStream execution started")
+
+        self._routine = (CronDoOrdersUpdatingRoutineCommand()
+                         .set_payload(self._payload["chat_id"])
+                         .set_deps(self._service_component, self._view))
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *args: self._binance_user_stream_adapter.stop())
+
+        try:
+            self._binance_user_stream_adapter.listen(
+                on_event=self.proc_handle_event,
+                on_connect=self.proc_reconcile,
+            )
+        except KeyboardInterrupt:
+            self._binance_user_stream_adapter.stop()
+
+        info(f"UserStream execution finished")
+        return True
+
+    def proc_reconcile(self):
+        # the events sent while the stream was down are lost - catch up with the polling routine
+        info(f"UserStream : reconciliation with the orders routine...")
+        try:
+            with self._service_component.db.connection_context():
+                self._routine.execute()
+        except Exception as e:
+            error(f"UserStream : reconciliation failed: {e}")
+
+    def proc_handle_event(self, event: dict):
+        try:
+            # events are handled in a worker thread of the event loop, it takes a pooled connection per event
+            with self._service_component.db.connection_context():
+                if event.get('e') == 'executionReport':
+                    self.proc_handle_execution_report(event)
+                elif event.get('e') == 'outboundAccountPosition':
+                    self.proc_handle_account_position(event)
+        except Exception as e:
+            # one broken event must not stop the listener
+            error(f"UserStream : cannot handle event '{event}': {e}")
+
+    def proc_handle_execution_report(self, event: dict):
+        binance_order: dict = self.func_map_execution_report(event)
+        info(f"UserStream : executionReport for binance_order#{binance_order['orderId']} ('{event.get('x')}', '{binance_order['status']}')")
+        if OrderMapper.map_symbol(binance_order['symbol']) == OrderMapper.SYMBOL_UNKNOWN:
+            info(f"UserStream : symbol '{binance_order['symbol']}' is not supported, skipping")
+            return
+        self._routine.proc_handle_binance_order(
+            binance_order=binance_order,
+            db_order=Order.get_or_none(Order.binance_order_id == binance_order['orderId']),
+            millis_on_start=int(event.get('E')),
+            # the balances change comes as the `outboundAccountPosition` event, no REST account call
+            refresh_balances=False,
+        )
+
+    def proc_handle_account_position(self, event: dict):
+        for binance_balance in event.get('B', []):
+            if BalanceMapper.map_asset(binance_balance['a']) == BalanceMapper.ASSET_UNKNOWN:
+                continue
+            self._service_component.save_binance_balance({
+                'asset': binance_balance['a'],
+                'free': binance_balance['f'],
+                'locked': binance_balance['l'],
+                'checked_at': int(event.get('u') or event.get('E')),
+            })
+
+    @staticmethod
+    def func_map_execution_report(event: dict) -> dict:
+        """executionReport -> the order dict of the same shape as REST `get_order()` / `get_all_orders()` returns"""
+        return {
+            'symbol': event['s'],
+            'orderId': int(event['i']),
+            'orderListId': event.get('g', -1),
+            # 'c' of a cancellation is the id of the cancel request, 'C' is the original one
+            'clientOrderId': event.get('C') or event.get('c'),
+            'price': event['p'],
+            'origQty': event['q'],
+            'executedQty': event['z'],
+            'cummulativeQuoteQty': event['Z'],
+            'status': event['X'],
+            'timeInForce': event.get('f'),
+            'type': event['o'],
+            'side': event['S'],
+            'stopPrice': event.get('P'),
+            'icebergQty': event.get('F'),
+            'time': event.get('O'),
+            'updateTime': event.get('T') or event.get('E'),
+            'isWorking': event.get('w'),
+            'workingTime': event.get('W'),
+            'origQuoteOrderQty': event.get('Q'),
+            'selfTradePreventionMode': event.get('V'),
+        }
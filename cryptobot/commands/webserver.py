@@ -1,25 +1,42 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from logging import error, info
+from threading import BoundedSemaphore
 
 from cryptobot.commands import AbstractCommand
+from cryptobot.commands.hook import HookCommand
 import json
 import subprocess
-from flask import Flask, request, jsonify
 
 from cryptobot.components import ServiceComponent
+from cryptobot.ports.chart_renderer import ChartRendererPort
+from cryptobot.views.view import View
 
 
 class WebserverCommand(AbstractCommand):
 
-    def set_payload(self, host: str, port: int, chat_id: int):
+    def __init__(self):
+        super().__init__()
+        self._view = None
+        self._chart_renderer = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._slots: BoundedSemaphore | None = None
+
+    def set_payload(self, host: str, port: int, chat_id: int, workers: int = 0, max_pending: int = 16):
         self._payload["host"] = host
         self._payload["port"] = port
         self._payload["chat_id"] = chat_id
+        # 0 = legacy mode, every hook is executed by `python -m cryptobot hook` subprocess
+        self._payload["workers"] = workers
+        # hooks running + waiting for a worker, Telegram gets 503 (and re-delivers later) above this
+        self._payload["max_pending"] = max(max_pending, workers)
         self._initialized = True
         return self
 
-    def set_deps(self, service_component: ServiceComponent):
+    def set_deps(self, service_component: ServiceComponent, view: View = None, chart_renderer: ChartRendererPort = None):
         self._service_component = service_component
+        self._view = view
+        self._chart_renderer = chart_renderer
         return self
 
     def execute(self):
@@ -29,6 +46,23 @@ class WebserverCommand(AbstractCommand):
 
         print(f"Starting to listen to Telegram hook for chat_id={self._payload['chat_id']} ...")
 
+        app = self.create_app()
+        try:
+            app.run(host = self._payload["host"], port = self._payload["port"])
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+        return True
+
+    def create_app(self) -> 'Flask':
+        # imported here: flask is needed by the webserver only, not by every command importing this package
+        from flask import Flask, request, jsonify
+
+        if self._payload["workers"] > 0 and self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._payload["workers"], thread_name_prefix="hook")
+            self._slots = BoundedSemaphore(self._payload["max_pending"])
+            info(f"Hooks are executed in-process, workers: {self._payload['workers']}, max pending: {self._payload['max_pending']}")
+
         app = Flask(__name__)
         @app.before_request
         def verify_telegram_secret():
@@ -55,6 +89,12 @@ class WebserverCommand(AbstractCommand):
                 error(err)
                 return jsonify({"status": "error", "error": err}), 200
 
+            if self._executor is not None:
+                if not self.func_submit_hook(data):
+                    error(f"Too many pending hooks (max {self._payload['max_pending']}), rejecting the update")
+                    return jsonify({"status": "error", "error": "Too many pending hooks"}), 503
+                return jsonify({"status": "ok", "output": None})
+
             try:
                 result = subprocess.run(
                     ["python", "-m", "cryptobot", "hook"],
@@ -90,5 +130,28 @@ class WebserverCommand(AbstractCommand):
                 return jsonify({"status": "error", "error": str(e)}), 500
         """
 
-        app.run(host = self._payload["host"], port = self._payload["port"])
-        return True
\ No newline at end of file
+        return app
+
+    def func_submit_hook(self, data: dict) -> bool:
+        if not self._slots.acquire(blocking=False):
+            return False
+        try:
+            self._executor.submit(self.proc_execute_hook, data)
+        except Exception:
+            self._slots.release()
+            raise
+        return True
+
+    def proc_execute_hook(self, data: dict):
+        try:
+            # the connection goes back to the pool after every hook, not kept by an idle worker thread
+            with self._service_component.db.connection_context():
+                (HookCommand()
+                 .set_payload(raw_data=json.dumps(data))
+                 .set_deps(self._service_component, self._view, self._chart_renderer)
+                 .execute())
+        except Exception as e:
+            # an exception inside the pool is swallowed by the Future, so log it here
+            error(f"Hook execution failed: {e}")
+        finally:
+            self._slots.release()
\ No newline at end of file
@@ -3,14 +3,26 @@ from .service import ServiceComponent
 from .binance_gateway import BinanceGateway
 from .binance_client_adapter import BinanceClientAdapter
 from .binance_api_adapter import BinanceApiAdapter
+from .binance_user_stream_adapter import BinanceUserStreamAdapter
+from .kline_store import KlineStore
+from .chart_cache import ChartCache
+from .chart_renderer import ChartRenderer
 from .telegram import TelegramComponent
+from .queued_telegram import QueuedTelegramComponent
+from .container import Container
 from .commands_dispatcher import dispatch, parse_args
 
 __all__ = [
     "dispatch", "parse_args",
+    "Container",
     "ServiceComponent",
     "BinanceGateway",
     "BinanceClientAdapter",
     "BinanceApiAdapter",
+    "BinanceUserStreamAdapter",
+    "KlineStore",
+    "ChartCache",
+    "ChartRenderer",
     "TelegramComponent",
+    "QueuedTelegramComponent",
 ]
\ No newline at end of file
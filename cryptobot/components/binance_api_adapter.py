@@ -5,6 +5,7 @@ import time
 from logging import error, info
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from cryptobot.ports.binance_api_adapter import BinanceApiAdapterPort
 
@@ -14,20 +15,42 @@ class BinanceApiAdapter(BinanceApiAdapterPort):
         base_url: str,
         binance_api_key: str,
         binance_api_secret: str,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        pool_maxsize: int = 10,
     ):
         super().__init__(base_url, binance_api_key, binance_api_secret)
         self.base_url = base_url
         self.binance_api_key = binance_api_key
         self.binance_api_secret = binance_api_secret
+        self.timeout: tuple[float, float] = (connect_timeout, read_timeout)
+        # one keep-alive session for all the calls - no TCP+TLS handshake per request (e.g. per myTrades page)
+        self.session: requests.Session = self._create_session(pool_maxsize)
 
     @classmethod
-    def create(cls, base_url: str, binance_api_key: str, binance_api_secret: str):
+    def create(cls, base_url: str, binance_api_key: str, binance_api_secret: str,
+               connect_timeout: float = 3.05, read_timeout: float = 10.0, pool_maxsize: int = 10):
         return cls(
             base_url=base_url,
             binance_api_key=binance_api_key,
             binance_api_secret=binance_api_secret,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            pool_maxsize=pool_maxsize,
         )
 
+    def _create_session(self, pool_maxsize: int) -> requests.Session:
+        session = requests.Session()
+        session.headers.update({"X-MBX-APIKEY": self.binance_api_key})
+        # the adapter talks to a single host, pool_maxsize = max parallel connections to it (e.g. hook workers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self):
+        self.session.close()
+
     def _sign_payload(self, payload: dict) -> str:
         """Sign the payload using API_SECRET"""
         query_string = "&".join([f"{k}={v}" for k, v in payload.items()])
@@ -46,16 +69,19 @@ class BinanceApiAdapter(BinanceApiAdapterPort):
         params["timestamp"] = int(time.time() * 1000)
         signature = self._sign_payload(params)
         params["signature"] = signature
-        headers = {"X-MBX-APIKEY": self.binance_api_key}
         url = self.base_url + endpoint
         try:
-            r = requests.get(url, headers=headers, params=params)
+            r = self.session.get(url, params=params, timeout=self.timeout)
             r.raise_for_status()
         except requests.exceptions.HTTPError as e:
             json_response = {'status': e.response.status_code, 'error': e.response.text,}
             error(f"HTTP error: '{e}' , Status code: '{r.status_code}' , Response text: '{r.text}'")
         except requests.exceptions.RequestException as e:
-            json_response = {'status': e.response.status_code, 'error': e.response.text,}
+            # connection errors and timeouts have no response
+            json_response = {
+                'status': e.response.status_code if e.response is not None else None,
+                'error': e.response.text if e.response is not None else str(e),
+            }
             error(f"Request failed: '{e}'")
         else:
             if r.text.strip():
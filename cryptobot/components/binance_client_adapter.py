@@ -1,33 +1,63 @@
-from typing import Any
+import threading
+from typing import Any, Callable, TYPE_CHECKING
 
-from binance import Client
-
-from cryptobot.commands.show_price_chart import KLINE_INTERVAL_1DAY
+from cryptobot.ports.kline_intervals import KLINE_INTERVAL_1DAY
 from cryptobot.ports.binance_client_adapter import BinanceClientAdapterPort
 
+if TYPE_CHECKING:
+    from binance import Client
+
 
 class BinanceClientAdapter(BinanceClientAdapterPort):
+    """
+    python-binance `Client` pings the API in its constructor (and the package takes long to import),
+    so with `binance_client_factory` the client is created on the first call only.
+    """
+
     def __init__(
             self,
-            binance_client: Client,
+            binance_client: 'Client | None' = None,
+            binance_client_factory: Callable[[], 'Client'] | None = None,
     ):
-        super().__init__(binance_client)
-        self.binance_client = binance_client
+        super().__init__()
+        if binance_client is None and binance_client_factory is None:
+            raise ValueError("BinanceClientAdapter needs binance_client or binance_client_factory")
+        self._binance_client = binance_client
+        self._binance_client_factory = binance_client_factory
+        self._lock = threading.Lock()
 
     @classmethod
     def create(
         cls,
-        binance_client: Client,
+        binance_client: 'Client | None' = None,
+        binance_api_key: str = '',
+        binance_api_secret: str = '',
     ):
-        return cls(
-            binance_client=binance_client,
-        )
+        if binance_client is not None:
+            return cls(binance_client=binance_client)
+
+        def binance_client_factory() -> 'Client':
+            from binance import Client
+            return Client(binance_api_key, binance_api_secret)
+
+        return cls(binance_client_factory=binance_client_factory)
+
+    @property
+    def binance_client(self) -> 'Client':
+        if self._binance_client is None:
+            with self._lock:
+                if self._binance_client is None:
+                    self._binance_client = self._binance_client_factory()
+        return self._binance_client
 
     def get_open_orders(self) -> list[dict[str, Any]]:
         return self.binance_client.get_open_orders()
 
-    def get_all_orders(self, symbol: str) -> list[dict[str, Any]]:
-        return self.binance_client.get_all_orders(symbol=symbol)
+    def get_all_orders(self, symbol: str, order_id: int | None = None) -> list[dict[str, Any]]:
+        if order_id is None:
+            return self.binance_client.get_all_orders(symbol=symbol)
+        # orders with orderId >= order_id only
+        return self.binance_client.get_all_orders(symbol=symbol, orderId=order_id)
 
     def get_order(self, orderId: int, symbol: str) -> dict[str, Any]:
         return self.binance_client.get_order(orderId=orderId, symbol=symbol)
@@ -41,9 +71,15 @@ class BinanceClientAdapter(BinanceClientAdapterPort):
     def get_asset_balance(self, asset=None) -> dict[str, Any] | None:
         return self.binance_client.get_asset_balance(asset=asset)
 
+    def get_account(self) -> dict[str, Any]:
+        return self.binance_client.get_account()
+
     def get_symbol_info(self, symbol: str) -> dict[str, Any]:
         return self.binance_client.get_symbol_info(symbol)
 
+    def get_exchange_info(self) -> dict[str, Any]:
+        return self.binance_client.get_exchange_info()
+
     def create_test_order(self, **params: Any) -> dict[str, Any]:
         return self.binance_client.create_test_order(**params)
 
@@ -1,11 +1,16 @@
-from logging import error
+import threading
+import time
+from logging import error, info, warning
 from typing import Any
 
-from binance import KLINE_INTERVAL_1DAY
+from cryptobot.ports.kline_intervals import KLINE_INTERVAL_1DAY
 
 from cryptobot.ports.binance_api_adapter import BinanceApiAdapterPort
 from cryptobot.ports.binance_client_adapter import BinanceClientAdapterPort
-from cryptobot.ports.binance_gateway import BinanceGatewayPort
+from cryptobot.ports.binance_gateway import BinanceGatewayPort, SymbolFilters
+
+# exchange filters change rarely, binance answers with a filter error when they did
+SYMBOL_INFO_TTL_SECONDS = 3600
 
 
 class BinanceGateway(BinanceGatewayPort):
@@ -13,20 +18,31 @@ class BinanceGateway(BinanceGatewayPort):
             self,
             binance_client_adapter: BinanceClientAdapterPort,
             binance_api_adapter: BinanceApiAdapterPort,
+            symbol_info_ttl_seconds: int = SYMBOL_INFO_TTL_SECONDS,
     ):
         super().__init__(binance_client_adapter, binance_api_adapter)
         self.binance_client_adapter = binance_client_adapter
         self.binance_api_adapter = binance_api_adapter
+        self.symbol_info_ttl_seconds = symbol_info_ttl_seconds
+        # symbol -> exchangeInfo entry / parsed filters, all the symbols are loaded by one exchangeInfo call
+        self._symbols_info: dict[str, dict[str, Any]] = {}
+        self._symbols_filters: dict[str, SymbolFilters] = {}
+        self._symbols_info_loaded_at: float | None = None
+        # the symbols absent from the last exchangeInfo, logged once per load
+        self._symbols_info_missing: set[str] = set()
+        self._symbols_info_lock = threading.Lock()
 
     @classmethod
     def create(
         cls,
         binance_client_adapter: BinanceClientAdapterPort,
         binance_api_adapter: BinanceApiAdapterPort,
+        symbol_info_ttl_seconds: int = SYMBOL_INFO_TTL_SECONDS,
     ):
         return cls(
             binance_client_adapter=binance_client_adapter,
             binance_api_adapter=binance_api_adapter,
+            symbol_info_ttl_seconds=symbol_info_ttl_seconds,
         )
 
     def get_open_orders(self) -> list[dict[str, Any]]:
@@ -37,9 +53,9 @@ class BinanceGateway(BinanceGatewayPort):
             print("ERROR: cannot get the list of orders:", e)
             return []
 
-    def get_all_orders(self, symbol: str) -> list[dict[str, Any]]:
+    def get_all_orders(self, symbol: str, order_id: int | None = None) -> list[dict[str, Any]]:
         try:
-            orders: list[dict[str, Any]] = self.binance_client_adapter.get_all_orders(symbol=symbol)
+            orders: list[dict[str, Any]] = self.binance_client_adapter.get_all_orders(symbol=symbol, order_id=order_id)
             return orders
         except Exception as e:
             print("ERROR: cannot get the list of orders:", e)
@@ -89,8 +105,77 @@ class BinanceGateway(BinanceGatewayPort):
             print(f"ERROR: cannot get the asset balance for asset: {asset}", e)
             return {}
 
+    def get_asset_balances(self, assets: list[str] | None = None, updated_since: int | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Balances of the assets (all the account's ones if None) from one `/api/v3/account` call,
+        indexed by asset: {'ETH': {'asset': 'ETH', 'free': '0.1', 'locked': '0.0'}, ...}.
+        get_asset_balance() fetches the whole account as well, but for one asset only.
+        updated_since: millis (e.g. `updateTime` of a filled order), the snapshot must have the account's
+        `updateTime` not older than that - an older one is not waited for, nothing ({}) is returned
+        and the next balances sync (the user stream, `check-balance-from-binance`) picks the change up.
+        """
+        try:
+            account: dict[str, Any] = self.binance_client_adapter.get_account()
+        except Exception as e:
+            print(f"ERROR: cannot get the account for assets: {assets}", e)
+            return {}
+        if updated_since is not None and int(account.get('updateTime', 0)) < updated_since:
+            warning(f"account updateTime '{account.get('updateTime')}' is older than '{updated_since}', skipping the stale balances")
+            return {}
+        balances: dict[str, dict[str, Any]] = {}
+        for balance in account.get('balances', []):
+            if assets is None or balance['asset'] in assets:
+                balances[balance['asset']] = balance
+        return balances
+
     def get_symbol_info(self, symbol: str) -> dict[str, Any]:
-        return self.binance_client_adapter.get_symbol_info(symbol)
+        self._proc_load_symbols_info(symbol)
+        return self._symbols_info.get(symbol, {})
+
+    def get_symbol_filters(self, symbol: str) -> SymbolFilters | None:
+        self._proc_load_symbols_info(symbol)
+        return self._symbols_filters.get(symbol)
+
+    def invalidate_symbol_info(self, symbol: str | None = None) -> None:
+        """Forgets the cached filters of the symbol (of all the symbols if None), the next call reloads exchangeInfo"""
+        with self._symbols_info_lock:
+            if symbol is None:
+                self._symbols_info = {}
+                self._symbols_filters = {}
+                self._symbols_info_loaded_at = None
+            else:
+                self._symbols_info.pop(symbol, None)
+                self._symbols_filters.pop(symbol, None)
+                # a fresh load is authoritative, it has to be expired to get the symbol again
+                self._symbols_info_loaded_at = None
+
+    def _proc_load_symbols_info(self, symbol: str) -> None:
+        with self._symbols_info_lock:
+            if (
+                self._symbols_info_loaded_at is not None
+                and time.monotonic() - self._symbols_info_loaded_at < self.symbol_info_ttl_seconds
+            ):
+                # the fresh load has all the symbols there are, an absent one is not refetched until the TTL expires
+                if symbol not in self._symbols_info and symbol not in self._symbols_info_missing:
+                    self._symbols_info_missing.add(symbol)
+                    warning(f"symbol '{symbol}' is not in exchangeInfo, not fetching it again for {self.symbol_info_ttl_seconds}s")
+                return
+            try:
+                exchange_info: dict[str, Any] = self.binance_client_adapter.get_exchange_info()
+            except Exception as e:
+                # the stale cache is still better than nothing
+                error(f"ERROR: cannot get exchangeInfo: {e}")
+                return
+            symbols_info: dict[str, dict[str, Any]] = {}
+            symbols_filters: dict[str, SymbolFilters] = {}
+            for symbol_info in exchange_info.get('symbols', []):
+                symbols_info[symbol_info['symbol']] = symbol_info
+                symbols_filters[symbol_info['symbol']] = SymbolFilters.create(symbol_info)
+            self._symbols_info = symbols_info
+            self._symbols_filters = symbols_filters
+            self._symbols_info_loaded_at = time.monotonic()
+            self._symbols_info_missing = set()
+            info(f"exchangeInfo loaded: {len(symbols_info)} symbol(s)")
 
     def create_test_order(self, **params: Any) -> dict[str, Any]:
         return self.binance_client_adapter.create_test_order(**params)
@@ -98,11 +183,11 @@ class BinanceGateway(BinanceGatewayPort):
     def create_order(self, **params: Any) -> dict[str, Any]:
         return self.binance_client_adapter.create_order(**params)
 
-    def get_all_trades(self, binance_symbol: str) -> list[dict]:
+    def get_all_trades(self, binance_symbol: str, from_id: int = 0) -> list[dict]:
         params: dict = {
             "symbol": binance_symbol,
             "limit": 1000,
-            "fromId": 0,
+            "fromId": from_id,
         }
 
         result_list: list[dict] = []
@@ -112,12 +197,15 @@ class BinanceGateway(BinanceGatewayPort):
             tries += 1
             # @TODO add try..except
             partial_list: list[dict] = self.binance_api_adapter.request(endpoint="/api/v3/myTrades", params=params)
+            if not isinstance(partial_list, list):
+                error(f"unexpected myTrades response: '{partial_list}'")
+                break
             for trade in partial_list:
-                if int(trade['id']) > params['fromId']:
-                    params['fromId'] = int(trade['id'])
-            params['fromId'] += 1
+                if int(trade['id']) >= params['fromId']:
+                    params['fromId'] = int(trade['id']) + 1
             result_list += partial_list
-            if len(partial_list) == 0:
+            # not a full page - it's the last one, no need to ask for an empty page
+            if len(partial_list) < params['limit']:
                 break
             if tries == 1000:
                 error(f"max load myTrades tries: '{tries}'")
@@ -0,0 +1,71 @@
+import asyncio
+from logging import error, info, warning
+from typing import Callable
+
+from cryptobot.ports.binance_user_stream_adapter import BinanceUserStreamAdapterPort
+
+
+class BinanceUserStreamAdapter(BinanceUserStreamAdapterPort):
+    def __init__(self,
+        binance_api_key: str,
+        binance_api_secret: str,
+        reconnect_delay_seconds: float = 5.0,
+        recv_timeout_seconds: float = 60.0,
+    ):
+        super().__init__()
+        self.binance_api_key = binance_api_key
+        self.binance_api_secret = binance_api_secret
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        # how often the stop flag is checked while the stream is silent
+        self.recv_timeout_seconds = recv_timeout_seconds
+        self._stopped = False
+
+    @classmethod
+    def create(cls, binance_api_key: str, binance_api_secret: str, reconnect_delay_seconds: float = 5.0):
+        return cls(
+            binance_api_key=binance_api_key,
+            binance_api_secret=binance_api_secret,
+            reconnect_delay_seconds=reconnect_delay_seconds,
+        )
+
+    def listen(self, on_event: Callable[[dict], None], on_connect: Callable[[], None] | None = None) -> None:
+        self._stopped = False
+        asyncio.run(self._listen(on_event, on_connect))
+
+    def stop(self) -> None:
+        self._stopped = True
+
+    async def _listen(self, on_event: Callable[[dict], None], on_connect: Callable[[], None] | None):
+        # imported here: python-binance is heavy and only the user_stream command needs the sockets
+        from binance import AsyncClient, BinanceSocketManager
+
+        while not self._stopped:
+            client: AsyncClient | None = None
+            try:
+                client = await AsyncClient.create(self.binance_api_key, self.binance_api_secret)
+                # the listenKey is created and kept alive by the socket manager
+                async with BinanceSocketManager(client).user_socket() as stream:
+                    info("User data stream connected")
+                    # the callbacks block (REST, db, telegram) - run them off the loop, so the pings and
+                    # the listenKey keepalive go on; awaited one by one, the events are handled in order
+                    if on_connect is not None:
+                        await asyncio.to_thread(on_connect)
+                    while not self._stopped:
+                        try:
+                            event = await asyncio.wait_for(stream.recv(), timeout=self.recv_timeout_seconds)
+                        except asyncio.TimeoutError:
+                            continue
+                        if not isinstance(event, dict):
+                            continue
+                        if event.get('e') == 'error':
+                            warning(f"User data stream error: '{event.get('m')}', reconnecting...")
+                            break
+                        await asyncio.to_thread(on_event, event)
+            except Exception as e:
+                error(f"User data stream failed: '{e}'")
+            finally:
+                if client is not None:
+                    await client.close_connection()
+            if not self._stopped:
+                await asyncio.sleep(self.reconnect_delay_seconds)
+        info("User data stream stopped")
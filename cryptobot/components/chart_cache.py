@@ -0,0 +1,119 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from logging import error
+from typing import Any
+
+import numpy as np
+
+from cryptobot.ports.chart_cache import ChartCachePort
+
+
+class ChartCache(ChartCachePort):
+    """
+    Rendered chart PNGs: in-memory LRU and optionally files in `cache_dir` (shared between processes).
+    The key (see func_make_key()) changes by itself when a new candle opens or the open orders change,
+    the TTL bounds how old the "current price" on a cached chart may be.
+    """
+
+    def __init__(self, max_items: int = 64, ttl_seconds: int = 60, cache_dir: str | None = None):
+        super().__init__()
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        # None = memory only
+        self.cache_dir = cache_dir or None
+        # key -> (time.time() of rendering, png)
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def create(cls, chart_cache_config: dict):
+        return cls(
+            max_items=chart_cache_config["max_items"],
+            ttl_seconds=chart_cache_config["ttl_seconds"],
+            cache_dir=chart_cache_config["dir"],
+        )
+
+    @staticmethod
+    def func_make_key(binance_symbol: str, period: str, interval: str, klines: np.ndarray, orders: list[dict[str, Any]]) -> str:
+        # the last candle is the open one, a new candle opens when the previous one closes
+        last_open_time: int = int(klines['open_time'][-1]) if len(klines) > 0 else 0
+        orders_overlay: list[tuple] = sorted(
+            (str(order['orderId']), order['side'], str(order['price']), str(order['origQty'])) for order in orders
+        )
+        orders_hash: str = hashlib.sha1(repr(orders_overlay).encode('utf-8')).hexdigest()
+        return f"{binance_symbol}:{period}:{interval}:{last_open_time}:{orders_hash}"
+
+    def get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                if now - item[0] < self.ttl_seconds:
+                    self._items.move_to_end(key)
+                    return item[1]
+                del self._items[key]
+
+        if self.cache_dir is None:
+            return None
+        path = self._func_get_path(key)
+        try:
+            rendered_at = os.path.getmtime(path)
+            if now - rendered_at >= self.ttl_seconds:
+                return None
+            with open(path, 'rb') as f:
+                png = f.read()
+        except OSError:
+            return None
+        self._proc_put_to_memory(key, rendered_at, png)
+        return png
+
+    def put(self, key: str, png: bytes) -> None:
+        self._proc_put_to_memory(key, time.time(), png)
+        if self.cache_dir is None:
+            return
+        path = self._func_get_path(key)
+        try:
+            # readers never see a half-written file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            error(f"ChartCache : cannot write '{path}': {e}")
+        # every new candle makes a new key, the files of the old ones are never read again
+        self._proc_prune_dir(time.time())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def _proc_put_to_memory(self, key: str, rendered_at: float, png: bytes) -> None:
+        with self._lock:
+            self._items[key] = (rendered_at, png)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def _proc_prune_dir(self, now: float) -> None:
+        """Deletes the expired charts (and the leftovers of the interrupted writes) from `cache_dir`"""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(('.png', '.tmp')):
+                        continue
+                    try:
+                        if now - entry.stat().st_mtime >= self.ttl_seconds:
+                            os.remove(entry.path)
+                    except OSError:
+                        # deleted by another process meanwhile
+                        pass
+        except OSError as e:
+            error(f"ChartCache : cannot prune '{self.cache_dir}': {e}")
+
+    def _func_get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.png')
@@ -0,0 +1,113 @@
+import io
+import threading
+
+import numpy as np
+
+from cryptobot.ports.chart_renderer import ChartRendererPort
+
+
+class ChartRenderer(ChartRendererPort):
+    """
+    Renders the price chart with the object-oriented matplotlib API (Figure + Agg canvas, no pyplot global state).
+    The figure with its price range, close line and legend is built once and reused: every render only
+    replaces the data and adds the current price / orders lines, which are removed right after saving.
+    """
+
+    def __init__(self, width_inches: float = 10, height_inches: float = 5, dpi: int = 100):
+        super().__init__()
+        self.width_inches = width_inches
+        self.height_inches = height_inches
+        self.dpi = dpi
+        # one figure - one render at a time
+        self._lock = threading.Lock()
+        self._figure = None
+        self._axes = None
+        self._price_range = None
+        self._close_line = None
+
+    @classmethod
+    def create(cls):
+        return cls()
+
+    def render_price_chart(
+            self,
+            dates: np.ndarray,
+            low_prices: np.ndarray,
+            high_prices: np.ndarray,
+            close_prices: np.ndarray,
+            orders: list[dict],
+            title: str,
+            ylabel: str,
+    ) -> bytes:
+        """
+        dates: datetime64, the last point is the current price (the rest are candles).
+        Returns PNG bytes.
+        """
+        with self._lock:
+            if self._figure is None:
+                self._proc_build_figure(dates, low_prices, high_prices, close_prices)
+            else:
+                self._price_range.set_data(dates, low_prices, high_prices)
+                self._close_line.set_data(dates, close_prices)
+
+            overlay: list = []
+            try:
+                current_price = close_prices[-1]
+                overlay.append(self._axes.axhline(y = current_price, color = "blue", linestyle = "--"))
+                overlay.append(self._axes.text(dates[0], current_price, f"Current price: {current_price}", va = 'bottom', color = "blue"))
+
+                for order in orders:
+                    color: str = 'green' if order['side'] == 'BUY' else 'red'
+                    order_price = round(float(order['price']), 2)
+                    overlay.append(self._axes.axhline(y = order_price, color = color, linestyle = "--"))
+                    overlay.append(self._axes.text(dates[0], order_price, f"{order_price} ({order['side'].lower()} {round(float(order['origQty']), 4)}, order amount: {round(float(order['price'])  * float(order['origQty']), 2)})", va = 'bottom', color=color))
+
+                self._proc_rescale(dates, low_prices, high_prices, close_prices)
+                self._axes.set_title(title)
+                self._axes.set_ylabel(ylabel)
+
+                buf = io.BytesIO()
+                self._figure.savefig(buf, format = 'png')
+                return buf.getvalue()
+            finally:
+                # the template stays clean for the next render
+                for artist in overlay:
+                    artist.remove()
+
+    def func_get_max_points(self) -> int:
+        """One point per pixel of the chart width, more points are not visible anyway"""
+        return int(self.width_inches * self.dpi)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._figure is not None:
+                self._figure.clear()
+            self._figure = None
+            self._axes = None
+            self._price_range = None
+            self._close_line = None
+
+    def _proc_build_figure(self, dates: np.ndarray, low_prices: np.ndarray, high_prices: np.ndarray, close_prices: np.ndarray) -> None:
+        # matplotlib takes a good part of a second to import, the commands which draw nothing do not pay for it
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure(figsize=(self.width_inches, self.height_inches), dpi=self.dpi)
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot()
+        # the first data sets the date units of the x axis
+        self._price_range = axes.fill_between(dates, low_prices, high_prices, color = 'skyblue', alpha = 0.3, label = "Price range (Low-High)")
+        (self._close_line,) = axes.plot(dates, close_prices, color = 'blue', label = "Close Price", linewidth = 2)
+        axes.set_xlabel("Date")
+        axes.legend()
+        axes.grid(True)
+        self._figure = figure
+        self._axes = axes
+
+    def _proc_rescale(self, dates: np.ndarray, low_prices: np.ndarray, high_prices: np.ndarray, close_prices: np.ndarray) -> None:
+        # relim() does not see the price range collection, its extents are added by hand
+        self._axes.relim()
+        x = self._axes.convert_xunits(dates)
+        self._axes.update_datalim(np.column_stack([x, low_prices]))
+        self._axes.update_datalim(np.column_stack([x, high_prices]))
+        self._axes.autoscale_view()
@@ -4,19 +4,19 @@ from logging import info, warning, error
 from cryptobot.commands import ShowOrdersCommand, WebserverCommand, HookCommand, ShowSettingsCommand
 from cryptobot.commands import ShowOrderStatusCommand, ShowPriceCommand
 from cryptobot.commands import ShowPriceChartOptionsCommand, ShowPriceChartCommand
-from cryptobot.commands import CronCommand
-from cryptobot.commands import MiscCommand
+from cryptobot.commands import CronCommand, SchedulerCommand, UserStreamCommand
 from cryptobot.commands.cron_check_balance_from_binance import CronCheckBalanceFromBinanceCommand
 from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
 from cryptobot.commands.cron_notify_working import CronNotifyWorkingCommand
 from cryptobot.commands.cron_update_trades_for_partially_filled_orders import \
     CronUpdateTradesForPartiallyFilledOrdersCommand
+from cryptobot.components.container import Container
 from cryptobot.helpers import current_millis
 from cryptobot.models import CronJob
 
 millis_on_start = current_millis() - 10000 # dirty bidlokod
 
-def dispatch(di: dict, args) -> None | tuple[None, type[ShowOrdersCommand]] | tuple[str, None]:
+def dispatch(di: dict | Container, args) -> None | tuple[None, type[ShowOrdersCommand]] | tuple[str, None]:
 
     if args.command == "show_orders":
         return (
@@ -65,7 +65,7 @@ def dispatch(di: dict, args) -> None | tuple[None, type[ShowOrdersCommand]] | tu
                     args.interval,
                     args.chat_id,
                 )
-                .set_deps(di['service_component'], di['view'], di['plt'])
+                .set_deps(di['service_component'], di['view'], di['chart_renderer'])
         )
     elif args.command == "show_settings":
         return (
@@ -82,14 +82,16 @@ def dispatch(di: dict, args) -> None | tuple[None, type[ShowOrdersCommand]] | tu
                     args.host,
                     args.port,
                     args.chat_id,
+                    workers=args.workers,
+                    max_pending=args.max_pending,
                 )
-                .set_deps(di['service_component'])
+                .set_deps(di['service_component'], di['view'], di['chart_renderer'])
         )
     elif args.command == "hook":
         return (
             None,
             HookCommand()
-                .set_deps(di['service_component'], di['view'], di['plt'])
+                .set_deps(di['service_component'], di['view'], di['chart_renderer'])
         )
     elif args.command == "cron":
         return (
@@ -103,7 +105,25 @@ def dispatch(di: dict, args) -> None | tuple[None, type[ShowOrdersCommand]] | tu
                 )
                 .set_deps(di['service_component'], di['view'])
         )
+    elif args.command == "scheduler":
+        return (
+            None,
+            SchedulerCommand()
+                .set_payload(
+                    di['config']['telegram']['chat_id'],
+                    tick_seconds=args.tick_seconds,
+                )
+                .set_deps(di['service_component'], di['view'])
+        )
+    elif args.command == "user_stream":
+        return (
+            None,
+            UserStreamCommand()
+                .set_payload(di['config']['telegram']['chat_id'])
+                .set_deps(di['service_component'], di['view'], di['binance_user_stream_adapter'])
+        )
     elif args.command == "misc":
+        from cryptobot.commands.misc import MiscCommand
         return (
             None,
             MiscCommand()
@@ -121,6 +141,8 @@ def dispatch(di: dict, args) -> None | tuple[None, type[ShowOrdersCommand]] | tu
 
 def parse_args(cli_name: str):
     parser = argparse.ArgumentParser(description=cli_name)
+    # before the command: python -m cryptobot --profile-startup cron (also CRYPTOBOT_PROFILE_STARTUP=1, see __main__)
+    parser.add_argument("--profile-startup", action="store_true", help="Report the startup time of the command and exit, exit code 1 above the budget")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     #
@@ -161,6 +183,8 @@ def parse_args(cli_name: str):
     parser_telegram_hook.add_argument("--host", type=str, default="0.0.0.0", help="Host to listen to")
     parser_telegram_hook.add_argument("--port", type=int, default=8765, help="Port to listen to")
     parser_telegram_hook.add_argument("--chat_id", type=int, help="Telegram chat id")
+    parser_telegram_hook.add_argument("--workers", type=int, default=0, help="In-process hook workers (0 = subprocess per hook)")
+    parser_telegram_hook.add_argument("--max_pending", type=int, default=16, help="Max hooks running or queued in-process")
 
     subparsers.add_parser("hook", help="Dispatch & execute hook")
 
@@ -168,6 +192,11 @@ def parse_args(cli_name: str):
     #parser_cron = subparsers.add_parser("cron", help="Run cron tasks")
     #parser_cron.add_argument("--chat_id", type=int, help="Telegram chat id")
 
+    parser_scheduler = subparsers.add_parser("scheduler", help="Run cron tasks in a resident process")
+    parser_scheduler.add_argument("--tick_seconds", type=float, default=1.0, help="Max seconds between cron_jobs checks")
+
+    subparsers.add_parser("user_stream", help="Listen to Binance user data stream (orders & balances in real time)")
+
     subparsers.add_parser("misc", help="Some misc checks etc.")
 
     args = parser.parse_args()
@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Any, Callable
+
+
+class Container:
+    """
+    Lazy DI container: every dependency is registered as a factory `(container) -> dependency`,
+    built on the first `di['name']` and kept for the rest of the process.
+    A command gets only what `dispatch()` asks for, so `cron` does not pay for matplotlib or the Binance client.
+    """
+
+    def __init__(self, factories: dict[str, Callable[['Container'], Any]] | None = None, **values: Any):
+        self._factories: dict[str, Callable[['Container'], Any]] = dict(factories or {})
+        self._instances: dict[str, Any] = dict(values)
+        # reentrant: factories get their own deps from the container
+        self._lock = threading.RLock()
+        # name -> (seconds without the nested deps, seconds including them), see --profile-startup
+        self._build_seconds: dict[str, tuple[float, float]] = {}
+        # [started at, seconds spent building the nested deps] of the factories being run
+        self._building: list[list[float]] = []
+
+    def register(self, name: str, factory: Callable[['Container'], Any]) -> 'Container':
+        with self._lock:
+            self._factories[name] = factory
+            self._instances.pop(name, None)
+        return self
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._instances:
+            return self._instances[name]
+        with self._lock:
+            if name not in self._instances:
+                if name not in self._factories:
+                    raise KeyError(name)
+                self._instances[name] = self._func_build(name)
+            return self._instances[name]
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        with self._lock:
+            self._instances[name] = value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._instances or name in self._factories
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def func_is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    def func_get_build_seconds(self) -> dict[str, tuple[float, float]]:
+        return dict(self._build_seconds)
+
+    def _func_build(self, name: str) -> Any:
+        frame = [time.perf_counter(), 0.0]
+        self._building.append(frame)
+        try:
+            return self._factories[name](self)
+        finally:
+            self._building.pop()
+            total = time.perf_counter() - frame[0]
+            if self._building:
+                self._building[-1][1] += total
+            self._build_seconds[name] = (total - frame[1], total)
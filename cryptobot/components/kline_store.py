@@ -0,0 +1,105 @@
+from logging import info, error
+from typing import Any
+
+from peewee import MySQLDatabase
+
+from cryptobot.helpers import current_millis
+from cryptobot.models import Kline
+from cryptobot.ports.binance_gateway import BinanceGatewayPort
+from cryptobot.ports.kline_store import KlineStorePort
+
+# interval_to_milliseconds() does not know months, the longest month is enough to look one candle back
+MONTH_INTERVAL_MILLIS = 31 * 24 * 3600 * 1000
+
+# rows per one multi-row `INSERT IGNORE` of klines
+KLINES_INSERT_CHUNK_SIZE = 500
+
+
+class KlineStore(KlineStorePort):
+    """
+    Closed candles are kept in `klines` (they never change), only the missing tail is asked from Binance.
+    """
+
+    def __init__(self, binance_gateway: BinanceGatewayPort, db: MySQLDatabase):
+        super().__init__()
+        self.binance_gateway: BinanceGatewayPort = binance_gateway
+        self.db: MySQLDatabase = db
+
+    @classmethod
+    def create(cls, binance_gateway: BinanceGatewayPort, db: MySQLDatabase):
+        return cls(
+            binance_gateway=binance_gateway,
+            db=db,
+        )
+
+    def get_historical_klines(self, binance_symbol: str, period: str | int, interval: str) -> list:
+        """
+        The same rows as BinanceGateway.get_historical_klines(): candles opened since `period`
+        (a date string like '1 day ago UTC' or millis), the last one may be still open.
+        """
+        # python-binance is heavy to import, only the commands drawing charts need it here
+        from binance.helpers import convert_ts_str, interval_to_milliseconds
+
+        start_millis: int = convert_ts_str(period)
+        # the candle containing start_millis opened before it, the lookback catches it
+        lookback_millis: int = interval_to_milliseconds(interval) or MONTH_INTERVAL_MILLIS
+
+        db_klines: list[Kline] = list(
+            Kline
+            .select()
+            .where(
+                (Kline.binance_symbol == binance_symbol)
+                & (Kline.interval == interval)
+                & (Kline.open_time >= start_millis - lookback_millis)
+            )
+            .order_by(Kline.open_time)
+        )
+
+        if self.func_is_covered(db_klines, start_millis):
+            fetch_from_millis: int = db_klines[-1].close_time + 1
+        else:
+            # nothing or holes in the stored range - the whole range once, the next calls fetch the tail only
+            db_klines = []
+            fetch_from_millis: int = start_millis - lookback_millis
+        info(f"KlineStore : {binance_symbol} {interval} - {len(db_klines)} stored candle(s), fetching since '{fetch_from_millis}'")
+
+        binance_klines: list = self.binance_gateway.get_historical_klines(binance_symbol, fetch_from_millis, interval)
+        self.proc_store_closed_klines(binance_symbol, interval, binance_klines)
+
+        klines: list = [db_kline.as_binance_kline() for db_kline in db_klines]
+        last_open_time: int = klines[-1][0] if len(klines) > 0 else -1
+        for binance_kline in binance_klines:
+            if int(binance_kline[0]) > last_open_time:
+                klines.append(binance_kline)
+
+        return [kline for kline in klines if int(kline[0]) >= start_millis]
+
+    @staticmethod
+    def func_is_covered(db_klines: list[Kline], start_millis: int) -> bool:
+        """Stored candles cover the range since start_millis without holes"""
+        if len(db_klines) == 0 or db_klines[0].open_time > start_millis:
+            return False
+        for i in range(1, len(db_klines)):
+            # binance: close_time of a candle is open_time of the next one - 1
+            if db_klines[i - 1].close_time + 1 != db_klines[i].open_time:
+                return False
+        return True
+
+    def proc_store_closed_klines(self, binance_symbol: str, interval: str, binance_klines: list[list[Any]]) -> None:
+        now: int = current_millis()
+        rows: list[dict] = []
+        for binance_kline in binance_klines:
+            # the current candle is still changing
+            if int(binance_kline[6]) >= now:
+                continue
+            db_kline = Kline().fill_from_binance(binance_symbol, interval, binance_kline)
+            if not db_kline.validate():
+                error(f"KlineStore : skipping invalid kline '{binance_kline}': {db_kline.get_validation_errors()}")
+                continue
+            rows.append(db_kline.__data__)
+        if len(rows) == 0:
+            return
+        # closed candles never change, the already stored ones are skipped
+        for i in range(0, len(rows), KLINES_INSERT_CHUNK_SIZE):
+            with self.db.atomic():
+                Kline.insert_many(rows[i:i + KLINES_INSERT_CHUNK_SIZE]).on_conflict_ignore().execute()
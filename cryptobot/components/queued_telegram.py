@@ -0,0 +1,208 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from io import BytesIO
+from logging import error, warning
+
+from requests import Response
+
+from cryptobot.ports.telegram import TelegramComponentPort
+from cryptobot.ports.telegram_http_transport import TelegramHttpTransportComponentPort
+
+# Telegram's limit for the text of one message
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+
+@dataclass
+class _TelegramJob:
+    chat_id: int
+    text: str | None = None
+    inline_keyboard: list = field(default_factory=list)
+    disable_notification: bool = False
+    parse_mode: str = "HTML"
+    photo_buf: BytesIO | None = None
+    photo_name: str | None = None
+
+    def is_mergeable_with(self, other: '_TelegramJob') -> bool:
+        # plain text messages only, buttons and photos are sent as they are
+        return (
+            self.photo_buf is None and other.photo_buf is None
+            and not self.inline_keyboard and not other.inline_keyboard
+            and self.chat_id == other.chat_id
+            and self.disable_notification == other.disable_notification
+            and self.parse_mode == other.parse_mode
+        )
+
+
+class QueuedTelegramComponent(TelegramComponentPort):
+    """
+    Wraps a TelegramComponentPort: messages are queued and sent by a background thread,
+    with respect to Telegram's per-chat and global rate limits.
+    Consecutive plain messages to the same chat are merged into one (up to 4096 chars),
+    `429 Too Many Requests` is retried after its `retry_after`.
+    """
+
+    def __init__(
+            self,
+            telegram_component: TelegramComponentPort,
+            per_chat_interval_seconds: float = 1.0,
+            global_per_second: int = 30,
+            max_retries: int = 3,
+    ):
+        super().__init__()
+        self.telegram_component: TelegramComponentPort = telegram_component
+        self.per_chat_interval_seconds = per_chat_interval_seconds
+        self.global_per_second = global_per_second
+        self.max_retries = max_retries
+
+        self._queue: deque[_TelegramJob] = deque()
+        self._condition = threading.Condition()
+        self._in_flight: int = 0
+        self._closed: bool = False
+        # chat_id -> time.monotonic() of the last sent message
+        self._last_sent_at: dict[int, float] = {}
+        # time.monotonic() of the messages sent during the last second (all the chats)
+        self._sent_during_last_second: deque[float] = deque()
+
+        self._worker = threading.Thread(target=self._run, name="telegram-queue", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def create(cls, telegram_component: TelegramComponentPort, queue_config: dict):
+        return cls(
+            telegram_component=telegram_component,
+            per_chat_interval_seconds=queue_config["per_chat_interval_seconds"],
+            global_per_second=queue_config["global_per_second"],
+            max_retries=queue_config["max_retries"],
+        )
+
+    @property
+    def bot_token(self):
+        return self.telegram_component.bot_token
+
+    @bot_token.setter
+    def bot_token(self, bot_token: str):
+        self.telegram_component.bot_token = bot_token
+
+    @property
+    def bot_api_secret_token(self):
+        return self.telegram_component.bot_api_secret_token
+
+    @bot_api_secret_token.setter
+    def bot_api_secret_token(self, bot_api_secret_token: str):
+        self.telegram_component.bot_api_secret_token = bot_api_secret_token
+
+    @property
+    def telegram_http_transport_component(self) -> TelegramHttpTransportComponentPort:
+        return self.telegram_component.telegram_http_transport_component
+
+    def check_telegram_bot_api_secret_token(self, bot_api_secret_token: str) -> bool:
+        return self.telegram_component.check_telegram_bot_api_secret_token(bot_api_secret_token)
+
+    def send_telegram_message(self, chat_id: int, text: str, inline_keyboard: list = [], disable_notification=False, parse_mode="HTML"):
+        self._put(_TelegramJob(
+            chat_id=chat_id,
+            text=text,
+            inline_keyboard=inline_keyboard,
+            disable_notification=disable_notification,
+            parse_mode=parse_mode,
+        ))
+        return None
+
+    def send_telegram_photo(self, chat_id: int, photo_buf: BytesIO, photo_name: str = None, parse_mode = "HTML"):
+        self._put(_TelegramJob(
+            chat_id=chat_id,
+            photo_buf=photo_buf,
+            photo_name=photo_name,
+            parse_mode=parse_mode,
+        ))
+        return None
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Waits until everything queued is sent, returns False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._queue) == 0 and self._in_flight == 0, timeout=timeout)
+
+    def close(self, timeout: float | None = None):
+        self.flush(timeout=timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join(timeout=timeout)
+
+    def _put(self, job: _TelegramJob):
+        with self._condition:
+            if self._closed:
+                error(f"Telegram queue is closed, the message to chat_id '{job.chat_id}' is dropped")
+                return
+            self._queue.append(job)
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._queue) > 0 or self._closed)
+                if len(self._queue) == 0 and self._closed:
+                    return
+                job = self._func_pop_merged_job()
+                self._in_flight += 1
+            try:
+                self._wait_for_rate_limits(job.chat_id)
+                self._send_with_retries(job)
+            except Exception as e:
+                error(f"Cannot send Telegram message to chat_id '{job.chat_id}': {e}")
+            finally:
+                with self._condition:
+                    self._in_flight -= 1
+                    self._condition.notify_all()
+
+    def _func_pop_merged_job(self) -> _TelegramJob:
+        job = self._queue.popleft()
+        while len(self._queue) > 0 and job.is_mergeable_with(self._queue[0]):
+            merged_text = job.text + "\n" + self._queue[0].text
+            if len(merged_text) > TELEGRAM_MAX_MESSAGE_LENGTH:
+                break
+            job.text = merged_text
+            self._queue.popleft()
+        return job
+
+    def _wait_for_rate_limits(self, chat_id: int):
+        while True:
+            now = time.monotonic()
+            while len(self._sent_during_last_second) > 0 and now - self._sent_during_last_second[0] >= 1.0:
+                self._sent_during_last_second.popleft()
+            wait_seconds = 0.0
+            if chat_id in self._last_sent_at:
+                wait_seconds = self._last_sent_at[chat_id] + self.per_chat_interval_seconds - now
+            if len(self._sent_during_last_second) >= self.global_per_second:
+                wait_seconds = max(wait_seconds, self._sent_during_last_second[0] + 1.0 - now)
+            if wait_seconds <= 0:
+                break
+            time.sleep(wait_seconds)
+        now = time.monotonic()
+        self._last_sent_at[chat_id] = now
+        self._sent_during_last_second.append(now)
+
+    def _send_with_retries(self, job: _TelegramJob):
+        for attempt in range(self.max_retries + 1):
+            if job.photo_buf is not None:
+                job.photo_buf.seek(0)
+                response = self.telegram_component.send_telegram_photo(job.chat_id, job.photo_buf, job.photo_name, job.parse_mode)
+            else:
+                response = self.telegram_component.send_telegram_message(job.chat_id, job.text, job.inline_keyboard, job.disable_notification, job.parse_mode)
+            retry_after = self._func_get_retry_after(response)
+            if retry_after is None:
+                return
+            warning(f"Telegram: 429 for chat_id '{job.chat_id}', retry after {retry_after}s (attempt {attempt + 1})")
+            time.sleep(retry_after)
+        error(f"Telegram: message to chat_id '{job.chat_id}' is dropped after {self.max_retries} retries")
+
+    @staticmethod
+    def _func_get_retry_after(response: Response | None) -> float | None:
+        if response is None or response.status_code != 429:
+            return None
+        try:
+            return float(response.json().get("parameters", {}).get("retry_after", 1))
+        except Exception:
+            return 1.0
@@ -1,20 +1,30 @@
-import time
 from decimal import Decimal
 from io import BytesIO
-from logging import info, error, warn
+from logging import info, error, warn, warning
 from typing import Any
 
-from cryptobot.helpers.money import round_price
+import numpy as np
+
+from cryptobot.helpers.klines import klines_to_columns
 from cryptobot.views.view import View
 
-from peewee import MySQLDatabase
-from cryptobot.helpers import current_millis, calculate_order_quantity, l
+from peewee import MySQLDatabase, fn
+from cryptobot.helpers import current_millis, l
 from cryptobot.mappers.balance_mapper import BalanceMapper
 from cryptobot.mappers.order_mapper import OrderMapper
-from cryptobot.models import Balance, Order, OrderFillingHistory, OrderTrade
+from cryptobot.models import Balance, Order, OrderFillingHistory, OrderTrade, TradesSyncCursor
 from ..ports.binance_gateway import BinanceGatewayPort
+from ..ports.chart_cache import ChartCachePort
+from ..ports.kline_store import KlineStorePort
 from ..ports.telegram import TelegramComponentPort
 
+# trades of orders which are not in db yet are expected to be synced later (the order will be imported by
+# the orders routine), so the trades cursor is not moved past such recent trades
+TRADES_SYNC_HOLD_BACK_MILLIS = 24 * 3600 * 1000
+
+# rows per one multi-row `INSERT ... ON DUPLICATE KEY UPDATE` of order_trades
+TRADES_UPSERT_CHUNK_SIZE = 500
+
 class ServiceComponent:
 
     def __init__(
@@ -23,12 +33,18 @@ class ServiceComponent:
             telegram_component: TelegramComponentPort,
             db: MySQLDatabase,
             view: View,
+            kline_store: KlineStorePort | None = None,
+            chart_cache: ChartCachePort | None = None,
     ):
         super().__init__()
         self.binance_gateway: BinanceGatewayPort = binance_gateway
         self.telegram_component: TelegramComponentPort = telegram_component
         self.db: MySQLDatabase = db
         self.view: View = view
+        # None = klines are always fetched from binance
+        self.kline_store: KlineStorePort | None = kline_store
+        # None = every chart is rendered
+        self.chart_cache: ChartCachePort | None = chart_cache
 
     @classmethod
     def create(
@@ -37,12 +53,16 @@ class ServiceComponent:
         view: View,
         telegram_component: TelegramComponentPort,
         binance_gateway: BinanceGatewayPort,
+        kline_store: KlineStorePort | None = None,
+        chart_cache: ChartCachePort | None = None,
     ):
         return cls(
             telegram_component=telegram_component,
             db=db,
             view=view,
             binance_gateway=binance_gateway,
+            kline_store=kline_store,
+            chart_cache=chart_cache,
         )
 
     def check_telegram_bot_api_secret_token(self, bot_api_secret_token: str) -> bool:
@@ -51,8 +71,8 @@ class ServiceComponent:
     def get_open_orders(self):
         return self.binance_gateway.get_open_orders()
 
-    def get_all_orders(self, symbol: str):
-        return self.binance_gateway.get_all_orders(symbol)
+    def get_all_orders(self, symbol: str, order_id: int | None = None):
+        return self.binance_gateway.get_all_orders(symbol, order_id=order_id)
 
     def get_order_by_binance_order_id_and_binance_symbol(self, binance_order_id: int, binance_order_symbol: str):
         return self.binance_gateway.get_order_by_binance_order_id(binance_order_id, binance_order_symbol)
@@ -76,10 +96,23 @@ class ServiceComponent:
             klines_mapped.append(kline_mapped)
         return klines_mapped
 
+    def map_historical_klines_columns(self, klines: list) -> np.ndarray:
+        return klines_to_columns(klines)
+
+    def get_raw_historical_klines(self, binance_order_symbol: str, period: str, interval: str) -> list:
+        if self.kline_store is not None:
+            return self.kline_store.get_historical_klines(binance_order_symbol, period, interval)
+        return self.binance_gateway.get_historical_klines(binance_order_symbol, period, interval)
+
     def get_historical_klines(self, binance_order_symbol: str, period: str, interval: str) -> list:
-        klines = self.binance_gateway.get_historical_klines(binance_order_symbol, period, interval)
+        klines = self.get_raw_historical_klines(binance_order_symbol, period, interval)
         return self.map_historical_klines(klines)
 
+    def get_historical_klines_columns(self, binance_order_symbol: str, period: str, interval: str) -> np.ndarray:
+        """Structured array (see helpers/klines.py), no Decimal per candle - for charts and analytics"""
+        klines = self.get_raw_historical_klines(binance_order_symbol, period, interval)
+        return self.map_historical_klines_columns(klines)
+
     def send_telegram_message(self, chat_id: int, message: str, inline_keyboard=None, disable_notification=False):
         if inline_keyboard is None:
             inline_keyboard = []
@@ -94,114 +127,187 @@ class ServiceComponent:
     def get_asset_balance(self, asset=None):
         return self.binance_gateway.get_asset_balance(asset)
 
-    def get_all_trades(self, binance_symbol: str) -> list[dict]:
-        return self.binance_gateway.get_all_trades(binance_symbol=binance_symbol)
+    def get_asset_balances(self, assets: list[str] | None = None, updated_since: int | None = None) -> dict[str, dict]:
+        return self.binance_gateway.get_asset_balances(assets, updated_since)
+
+    def get_all_trades(self, binance_symbol: str, from_id: int = 0) -> list[dict]:
+        return self.binance_gateway.get_all_trades(binance_symbol=binance_symbol, from_id=from_id)
 
-    def upsert_binance_trades(self, trades: list[dict]) -> list[int]:
+    def upsert_binance_trades(self, trades: list[dict]) -> dict[str, int]:
+        """
+        Upserts the trades with one multi-row `INSERT ... ON DUPLICATE KEY UPDATE` per chunk.
+        Returns the counts of inserted and updated `order_trades` rows.
+        """
+        result: dict[str, int] = {'inserted': 0, 'updated': 0}
         if len(trades) == 0:
-            return []
-        inserted_trades: list[int] = []
+            return result
+
+        # binance_order_id -> orders.id, one query for all the trades
+        binance_orders_ids: list[int] = list(set([trade['orderId'] for trade in trades]))
+        order_ids_indexed: dict[int, int] = {}
+        for db_order in Order.select(Order.id, Order.binance_order_id).where(Order.binance_order_id.in_(binance_orders_ids)):
+            order_ids_indexed[db_order.binance_order_id] = db_order.id
+        known_binance_order_ids: set[int] = set(order_ids_indexed.keys())
+
+        # on duplicate `binance_id` - refresh everything except the row's identity
+        preserve = [
+            field for field in OrderTrade._meta.sorted_fields
+            if field.name not in (OrderTrade.id.name, OrderTrade.created_at.name, OrderTrade.updated_at.name)
+        ]
 
-        binance_orders_ids = []
-        for trade in trades:
-            binance_orders_ids.append(trade['orderId'])
+        for i in range(0, len(trades), TRADES_UPSERT_CHUNK_SIZE):
+            rows: dict[int, dict] = {}
+            for trade in trades[i:i + TRADES_UPSERT_CHUNK_SIZE]:
+                db_order_trade = OrderTrade().fill_from_binance(trade)
+                # parent orders are checked against the prefetched map, no query per trade
+                db_order_trade.set_known_binance_order_ids(known_binance_order_ids)
+                if not db_order_trade.validate():
+                    error(f"upsert_binance_trades : skipping invalid trade '{trade['id']}': {db_order_trade.get_validation_errors()}")
+                    continue
+                db_order_trade.order_id = order_ids_indexed[trade['orderId']]
+                # the same trade twice in one statement is counted once
+                rows[db_order_trade.binance_id] = db_order_trade.__data__
+            if len(rows) == 0:
+                continue
 
-        db_orders = Order.select().where(Order.binance_order_id.in_(binance_orders_ids))
-        db_orders_indexed = {}
-        for db_order in db_orders:
-            db_orders_indexed[db_order.binance_order_id] = db_order
-        db_orders = db_orders_indexed.copy()
-        del db_orders_indexed
+            existed: int = (OrderTrade
+                            .select()
+                            .where(OrderTrade.binance_id.in_(list(rows.keys())))
+                            .count())
+            with self.db.atomic():
+                (OrderTrade
+                 .insert_many(list(rows.values()))
+                 .on_conflict(preserve=preserve, update={OrderTrade.updated_at: current_millis()})
+                 .execute())
+            result['inserted'] += len(rows) - existed
+            result['updated'] += existed
 
-        for trade in trades:
-            db_order_trade = OrderTrade().fill_from_binance(trade)
-            db_order_trade.order_id = db_orders[trade['orderId']].id
-            id = OrderTrade.insert(db_order_trade.__data__).on_conflict(
-                preserve=[
-                    OrderTrade.id,
-                    OrderTrade.created_at,
-                ],
-            ).execute()
-            if id is not None:
-                inserted_trades.append(id)
-
-        return inserted_trades
-
-    def update_trades_from_binance_to_db(self, order_ids=None):
+        return result
+
+    def update_trades_from_binance_to_db(self, order_ids=None) -> dict[str, int]:
         if order_ids is None:
             order_ids = []
         order_ids = list(set(order_ids))
         if len(order_ids) == 0:
             m_err = "order_ids is empty, doing nothing..."
             l(self, m_err, 'info')
-            return []
+            return {'inserted': 0, 'updated': 0}
         db_orders: list[Order] = list(Order.select().where(Order.id.in_(order_ids)))
         if len(db_orders) == 0:
             m_err = f"db_orders with ids: '{order_ids}' not found"
             l(self, m_err)
             raise Exception(m_err)
         all_binance_symbols = []
-        all_orders_binance_order_ids = []
         for db_order in db_orders:
             if db_order.symbol == OrderMapper.SYMBOL_UNKNOWN:
                 continue
             all_binance_symbols.append(OrderMapper.remap_symbol(db_order.symbol))
-            all_orders_binance_order_ids.append(db_order.binance_order_id)
-        all_trades = []
-        for binance_symbol in all_binance_symbols:
-            all_trades += self.binance_gateway.get_all_trades(
-                binance_symbol=binance_symbol,
-            )
+        all_binance_symbols = list(set(all_binance_symbols)) # array_unique
 
-        upserted_trades_ids: list[int] = []
+        result: dict[str, int] = {'inserted': 0, 'updated': 0}
+        for binance_symbol in all_binance_symbols:
+            symbol_result = self.sync_trades_for_symbol(binance_symbol)
+            result['inserted'] += symbol_result['inserted']
+            result['updated'] += symbol_result['updated']
+        return result
+
+    def sync_trades_for_symbol(self, binance_symbol: str) -> dict[str, int]:
+        """
+        Loads only the trades newer than the symbol's cursor and upserts the ones of all the orders known in db
+        (not only of the requested orders - the cursor moves past them and they will not be loaded again).
+        """
+        symbol: int = OrderMapper.map_symbol(binance_symbol)
+        cursor: TradesSyncCursor | None = TradesSyncCursor.get_or_none(TradesSyncCursor.symbol == symbol)
+        if cursor is None:
+            cursor = TradesSyncCursor(symbol=symbol, from_id=0)
+
+        trades: list[dict] = self.binance_gateway.get_all_trades(binance_symbol=binance_symbol, from_id=cursor.from_id)
+        info(f"sync_trades_for_symbol : '{binance_symbol}' fromId '{cursor.from_id}', loaded trades: '{len(trades)}'")
+        if len(trades) == 0:
+            return {'inserted': 0, 'updated': 0}
+        trades.sort(key=lambda trade: int(trade['id']))
 
-        for trade in all_trades:
-            if trade['orderId'] in all_orders_binance_order_ids:
-                upserted_trades_ids += self.upsert_binance_trades([trade])
-        return upserted_trades_ids
+        binance_order_ids: list[int] = list(set([trade['orderId'] for trade in trades]))
+        known_binance_order_ids: set[int] = OrderTrade.get_known_binance_order_ids(binance_order_ids)
 
-    def update_assets_from_binance_to_db(self, assets: list=None, force_insert=False):
+        hold_back_since: int = current_millis() - TRADES_SYNC_HOLD_BACK_MILLIS
+        held_back: bool = False
+        known_trades: list[dict] = []
+        for trade in trades:
+            if trade['orderId'] in known_binance_order_ids:
+                known_trades.append(trade)
+            elif not held_back and int(trade['time']) >= hold_back_since:
+                held_back = True
+                info(f"sync_trades_for_symbol : binance_order#{trade['orderId']} is not in db yet, holding the cursor at trade '{trade['id']}'")
+            if not held_back:
+                cursor.from_id = int(trade['id']) + 1
+
+        result: dict[str, int] = self.upsert_binance_trades(known_trades)
+        if not cursor.save():
+            error(f"Cannot save trades cursor for '{binance_symbol}': {cursor.get_validation_errors()}")
+        return result
+
+    def update_assets_from_binance_to_db(self, assets: list=None, force_insert=False, updated_since: int | None = None):
+        """updated_since: millis, see BinanceGateway.get_asset_balances()"""
         if assets is None:
             assets = []
+        assets = list(assets)
+        if len(assets) == 0:
+            return 0
         saved_count = 0
-        for asset in assets:
-            with self.db.atomic():
-                # get asset balance from Binance
-                binance_balance = self.get_asset_balance(asset)
+        # one account snapshot for all the assets, one transaction for all the balances
+        binance_balances: dict[str, dict] = self.get_asset_balances(assets, updated_since)
+        if not binance_balances:
+            # no account or a stale one, nothing to save
+            return 0
+        with self.db.atomic():
+            for asset in assets:
+                binance_balance = binance_balances.get(asset)
+                if binance_balance is None:
+                    warning(f"Asset {asset} is not found in the Binance account, skipping")
+                    continue
                 info(f"Asset {asset} balance: {binance_balance} -> {binance_balance['asset']} ({BalanceMapper.map_asset(binance_balance['asset'])})")
-                # last balance obj from db of the same asset with the same free&locked
-                if force_insert:
-                    balance_db = None
-                else:
-                    balance_db = (
-                        Balance.select()
-                            .where(
-                                (Balance.asset == BalanceMapper.map_asset(binance_balance['asset']))
-                                &
-                                (Balance.free == Decimal(binance_balance['free']))
-                                &
-                                (Balance.locked == Decimal(binance_balance['locked']))
-                            )
-                            .order_by(Balance.checked_at.desc())
-                            .limit(1)
-                            .first()
-                    )
-                # if it's present = update its checked_at time, no need to insert new record
-                if balance_db:
-                    info (f'Balance existed record found (force_insert: {force_insert}), id: {balance_db.id}')
-                    balance_db.updated_at = current_millis()
-                    balance_db.checked_at = current_millis()
-                else: # otherwise - insert new record
-                    info(f'Balance existed record not found (force_insert: {force_insert}), creating the new one...')
-                    balance_db = Balance().fill_from_binance(binance_balance)
-
-                if balance_db.save():
-                    info(f'Balance saved: {balance_db.as_dict()}')
+                if self.save_binance_balance(binance_balance, force_insert=force_insert):
                     saved_count += 1
-                else:
-                    error(f"Cannot save balance record: {balance_db.as_dict()}")
         return saved_count
 
+    def save_binance_balance(self, binance_balance: dict, force_insert=False) -> bool:
+        """
+        binance_balance: {'asset': 'ETH', 'free': '0.1', 'locked': '0.0'} (from REST or from the user data stream)
+        """
+        with self.db.atomic():
+            # last balance obj from db of the same asset with the same free&locked
+            if force_insert:
+                balance_db = None
+            else:
+                balance_db = (
+                    Balance.select()
+                        .where(
+                            (Balance.asset == BalanceMapper.map_asset(binance_balance['asset']))
+                            &
+                            (Balance.free == Decimal(binance_balance['free']))
+                            &
+                            (Balance.locked == Decimal(binance_balance['locked']))
+                        )
+                        .order_by(Balance.checked_at.desc())
+                        .limit(1)
+                        .first()
+                )
+            # if it's present = update its checked_at time, no need to insert new record
+            if balance_db:
+                info (f'Balance existed record found (force_insert: {force_insert}), id: {balance_db.id}')
+                balance_db.updated_at = current_millis()
+                balance_db.checked_at = current_millis()
+            else: # otherwise - insert new record
+                info(f'Balance existed record not found (force_insert: {force_insert}), creating the new one...')
+                balance_db = Balance().fill_from_binance(binance_balance)
+
+            if balance_db.save():
+                info(f'Balance saved: {balance_db.as_dict()}')
+                return True
+            error(f"Cannot save balance record: {balance_db.as_dict()}")
+            return False
+
     def notify_order_created(self, chat_id: int, db_order: Order):
         message = self.view.render('telegram/orders/order_created.j2', {
             'order': db_order,
@@ -274,6 +380,39 @@ class ServiceComponent:
         del all_db_orders
         return all_db_orders_indexed
 
+    def get_open_db_orders_indexed(self) -> dict[int, Order]:
+        open_db_orders_indexed: dict[int, Order] = {}
+        for db_order in Order.select().where(Order.status.in_(OrderMapper.OPEN_STATUSES)):
+            open_db_orders_indexed[db_order.binance_order_id] = db_order
+        return open_db_orders_indexed
+
+    def get_db_orders_indexed_by_binance_order_ids(self, binance_order_ids: list[int]) -> dict[int, Order]:
+        db_orders_indexed: dict[int, Order] = {}
+        if len(binance_order_ids) == 0:
+            return db_orders_indexed
+        for db_order in Order.select().where(Order.binance_order_id.in_(binance_order_ids)):
+            db_orders_indexed[db_order.binance_order_id] = db_order
+        return db_orders_indexed
+
+    def get_max_db_binance_order_ids_by_symbols(self) -> dict[str, int]:
+        """binance_symbol -> the newest binance_order_id known in db (for all the symbols present in db)"""
+        max_ids: dict[str, int] = {}
+        query = (Order
+                 .select(Order.symbol, fn.MAX(Order.binance_order_id).alias('max_binance_order_id'))
+                 .where(Order.symbol != OrderMapper.SYMBOL_UNKNOWN)
+                 .group_by(Order.symbol))
+        for row in query.dicts():
+            max_ids[OrderMapper.remap_symbol(row['symbol'])] = int(row['max_binance_order_id'])
+        return max_ids
+
+    def get_db_binance_symbols(self) -> list[str]:
+        """binance symbols of the orders present in db"""
+        query = (Order
+                 .select(Order.symbol)
+                 .where(Order.symbol != OrderMapper.SYMBOL_UNKNOWN)
+                 .distinct())
+        return sorted(OrderMapper.remap_symbol(db_order.symbol) for db_order in query)
+
 
     def create_order_on_binance(self, chat_id: int, str_price:str = None, db_symbol:int=None, db_side:int=None,) -> None|dict:
 
@@ -304,29 +443,23 @@ class ServiceComponent:
             if not side:
                 l(self, f"Cannot create order on Binance - unknown side '{db_side}'", 'error', chat_id)
 
-        symbol_info = self.binance_gateway.get_symbol_info(symbol)
+        # cached by the gateway, no exchangeInfo round-trip per order
+        symbol_filters = self.binance_gateway.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            l(self, f"Cannot create order on Binance - no exchange filters for symbol '{symbol}'", 'error', chat_id)
+            return None
         if side == 'BUY':
-            asset_to_sell = symbol_info['quoteAsset']
+            asset_to_sell = symbol_filters.quote_asset
         else:
-            asset_to_sell = symbol_info['baseAsset']
-
-        step_size = None
-        min_qty = None
-        max_qty = None
-        min_notional = None
-        tick_size = None
-
-        l(self, f"symbol_info['filters']: {symbol_info['filters']}", 'info', chat_id)
-
-        for f in symbol_info["filters"]:
-            if f["filterType"] == "LOT_SIZE":
-                step_size = Decimal(f["stepSize"])
-                min_qty = Decimal(f["minQty"])
-                max_qty = Decimal(f["maxQty"])
-            elif f["filterType"] == "MIN_NOTIONAL":
-                min_notional = Decimal(f["minNotional"])
-            elif f["filterType"] == "PRICE_FILTER":
-                tick_size = Decimal(f["tickSize"])
+            asset_to_sell = symbol_filters.base_asset
+
+        step_size = symbol_filters.step_size
+        min_qty = symbol_filters.min_qty
+        max_qty = symbol_filters.max_qty
+        min_notional = symbol_filters.min_notional
+        tick_size = symbol_filters.tick_size
+
+        l(self, f"symbol_filters: {symbol_filters}", 'info', chat_id)
 
         l(self, f"asset_to_sell: {asset_to_sell}", 'info', chat_id)
         l(self, f"step_size: {step_size}", 'info', chat_id)
@@ -335,7 +468,9 @@ class ServiceComponent:
         l(self, f"min_notional: {min_notional}", 'info', chat_id)
         l(self, f"tick_size: {tick_size}", 'info', chat_id)
 
-        safe_price = round_price(price=price, tick_size=tick_size)
+        # filter compliant price and quantity are computed locally, no trial and error against create_test_order()
+        safe_price = symbol_filters.func_fit_price(price)
+        l(self, f"safe_price: {safe_price}", 'info', chat_id)
 
         binance_balance = self.get_asset_balance(asset_to_sell)
         l(self, f"binance_balance: {binance_balance}", 'info', chat_id)
@@ -343,13 +478,7 @@ class ServiceComponent:
         #actual_balance = Decimal('0.00809190') # @TODO REMOVE !!!
         l(self, f"actual_balance: {actual_balance}", 'info', chat_id)
 
-        quantity = calculate_order_quantity(
-            balance=actual_balance,
-            price=safe_price,
-            step_size=step_size,
-            side=side,
-            min_qty=min_qty,
-        )
+        quantity = symbol_filters.func_fit_quantity(side=side, price=safe_price, balance=actual_balance)
         l(self, f"quantity: {quantity}", 'info', chat_id)
 
         if quantity == 0:
@@ -358,65 +487,48 @@ class ServiceComponent:
             self.send_telegram_message(chat_id, err_m)
             return None
 
-        can_create = False
-        tries = 0
-        while not can_create and tries <= 10:
-            l(self, f"trying to create test order...", 'info', chat_id)
-            tries += 1
-            try:
-                params: dict = {
-                    'symbol': symbol,
-                    'side': side,
-                    'type': 'LIMIT',
-                    'timeInForce': 'GTC',
-                    'quantity': str(quantity),
-                    'price': str(safe_price),
-                }
-                l(self, f"attempt #{tries} to create test order on binance with the following params: {params}...", 'info', chat_id)
-                result = self.binance_gateway.create_test_order(**params)
-                l(self, f"create_test_order() result: {result}", 'info', chat_id)
-                can_create = True
-            except Exception as e:
-                l(self, str(e), 'error', chat_id)
-                if 'LOT_SIZE' in str(e):
-                    err_m = f"buy_qty '{quantity}' is too big or too small (cannot pass LOT_SIZE validation, decreasing quantity '{quantity}' by step_size '{step_size}')"
-                    l(self, err_m, 'error', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                    quantity -= step_size
-                    info('sleeping 5 secs...')
-                    l(self, f"sleeping 5 secs...", 'info', chat_id)
-                    time.sleep(5)
-                elif 'MIN_NOTIONAL' in str(e):
-                    err_m = f"actual_balance '{actual_balance}' is less then '{min_notional}' (cannot pass MIN_NOTIONAL validation, need more free balance...')"
-                    l(self, err_m, 'error', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                elif 'PRICE_FILTER' in str(e):
-                    err_m = f"safe_price '{safe_price}' must be multiple of tick_size '{tick_size}' (cannot pass PRICE_FILTER validation, please fix the price...')"
-                    l(self, err_m, 'error', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                elif 'MAX_NUM_ORDERS' in str(e):
-                    err_m = f"too many open orders (cannot pass MAX_NUM_ORDERS validation, please wait or cancel some orders...')"
-                    l(self, err_m, 'error', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                else:
-                    err_m = f"create_test_order ERROR: {e}"
-                    l(self, err_m, 'error', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                if quantity <= min_qty:
-                    err_m = f"not enough balance for minimal order quantity (requested quantity: '{quantity}', minimal quantity: '{min_qty}')"
-                    l(self, err_m, 'warning', chat_id)
-                    self.send_telegram_message(chat_id, err_m)
-                    break
-
-        l(self, f"can_create: {can_create}", 'info', chat_id)
-
-        if can_create:
-            # create real order here
-            m = f"creation of REAL ORDER ON BINANCE, the params: {params}"
-            l(self, m, 'info', chat_id)
-            # todo replace with order's owner's chat_id
-            self.send_telegram_message(chat_id, m,)
-            real_result = self.binance_gateway.create_order(**params)
-            l(self, f"create_order() result: {real_result}", 'info', chat_id)
-            return real_result
-        return None
+        violations: list[str] = symbol_filters.func_get_violations(quantity=quantity, price=safe_price)
+        if len(violations) > 0:
+            err_m = f"the order (quantity '{quantity}', price '{safe_price}') cannot pass {', '.join(violations)} validation"
+            if 'NOTIONAL' in violations:
+                err_m += f" (actual_balance '{actual_balance}', order amount must be not less then '{min_notional}', need more free balance...)"
+            l(self, err_m, 'error', chat_id)
+            self.send_telegram_message(chat_id, err_m)
+            return None
+
+        params: dict = {
+            'symbol': symbol,
+            'side': side,
+            'type': 'LIMIT',
+            'timeInForce': 'GTC',
+            'quantity': str(quantity),
+            'price': str(safe_price),
+        }
+
+        # the last check on the Binance side, it is not retried: the params are already filter compliant
+        l(self, f"trying to create test order on binance with the following params: {params}...", 'info', chat_id)
+        try:
+            result = self.binance_gateway.create_test_order(**params)
+            l(self, f"create_test_order() result: {result}", 'info', chat_id)
+        except Exception as e:
+            l(self, str(e), 'error', chat_id)
+            if any(filter_type in str(e) for filter_type in ['LOT_SIZE', 'NOTIONAL', 'PRICE_FILTER']):
+                # the cached filters are outdated, the next order placement reloads them
+                self.binance_gateway.invalidate_symbol_info(symbol)
+                err_m = f"the exchange filters of '{symbol}' have changed, the order is not created (will be validated with the fresh filters next time): {e}"
+            elif 'MAX_NUM_ORDERS' in str(e):
+                err_m = f"too many open orders (cannot pass MAX_NUM_ORDERS validation, please wait or cancel some orders...')"
+            else:
+                err_m = f"create_test_order ERROR: {e}"
+            l(self, err_m, 'error', chat_id)
+            self.send_telegram_message(chat_id, err_m)
+            return None
+
+        # create real order here
+        m = f"creation of REAL ORDER ON BINANCE, the params: {params}"
+        l(self, m, 'info', chat_id)
+        # todo replace with order's owner's chat_id
+        self.send_telegram_message(chat_id, m,)
+        real_result = self.binance_gateway.create_order(**params)
+        l(self, f"create_order() result: {real_result}", 'info', chat_id)
+        return real_result
@@ -1,55 +1,101 @@
+import threading
+import time
 from decimal import Decimal
 from typing import Any
 
-from peewee import MySQLDatabase
+from peewee import MySQLDatabase, fn
 
 from cryptobot.mappers.setting_mapper import SettingMapper
 from cryptobot.models import Setting
 
 
 class SettingsComponent:
-    def __init__(self, db: MySQLDatabase,):
+    """
+    All the settings are loaded by one query into a typed snapshot (`data_map`), the reads are served from it.
+    At most once per `refresh_interval_seconds` the snapshot is checked against the version of the table
+    (the rows count and the max created_at/updated_at, one aggregate query) and reloaded if the version has changed,
+    so the edits made by `ss()` in another process are seen by the resident ones. 0 = the check on every read.
+    """
+
+    def __init__(self, db: MySQLDatabase, refresh_interval_seconds: float = 0.0):
         super().__init__()
-        self.data_map = {}
+        # the_key -> typed value, replaced as a whole on reload
+        self.data_map: dict[str, Any] = {}
         self.db = db
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._version: tuple | None = None
+        # time.monotonic() of the last version check, None = never checked
+        self._checked_at: float | None = None
+        self._lock = threading.Lock()
 
     @classmethod
-    def create(cls, db: MySQLDatabase):
+    def create(cls, db: MySQLDatabase, settings_config: dict | None = None):
+        if settings_config is None:
+            return cls(db=db)
         return cls(
             db=db,
+            refresh_interval_seconds=settings_config["refresh_interval_seconds"],
         )
 
     def get_many(self, only_keys=None) -> dict:
-        if only_keys is None:
-            only_keys = []
-        db_settings = Setting.select()
-        if len(only_keys) > 0:
-            db_settings.where(Setting.the_key.in_(only_keys))
-        values: dict = {}
-        for db_setting in db_settings:
-            values[db_setting.the_key] = self.get(db_setting.the_key)
-        return values
+        self._proc_refresh_if_stale()
+        if not only_keys:
+            return dict(self.data_map)
+        return {key: value for key, value in self.data_map.items() if key in only_keys}
 
     def get(self, key: str = None, default=None) -> int | float | Decimal | bool | str | None:
         if key is None:
             raise ValueError("key is required")
-        if key in self.data_map:
-            return self.data_map[key]
-        value = self._load_from_db(key=key)
-        if value is not None:
-            self.data_map[key] = value
-            return value
-        return default
+        self._proc_refresh_if_stale()
+        value = self.data_map.get(key)
+        if value is None:
+            return default
+        return value
 
     def set(self, key:str, value:int|float|Decimal|bool|str) -> None:
         if self._save_to_db(key=key, value=value):
-            self.data_map[key] = value
+            with self._lock:
+                data_map = dict(self.data_map)
+                data_map[key] = value
+                self.data_map = data_map
 
-    def _load_from_db(self, key:str) -> int|float|Decimal|bool|str|None:
-        db_setting = Setting.select().where(Setting.the_key == key).first()
-        if not db_setting:
-            return None
-        return self._map_from_db(db_setting.the_type, db_setting.the_value)
+    def proc_invalidate(self) -> None:
+        """The next read reloads the snapshot"""
+        with self._lock:
+            self._version = None
+            self._checked_at = None
+
+    def _proc_refresh_if_stale(self) -> None:
+        if self._func_is_checked_recently():
+            return
+        with self._lock:
+            # another thread may have checked it while this one was waiting for the lock
+            if self._func_is_checked_recently():
+                return
+            # the version is taken before the rows: a change in between is caught by the next check
+            version = self._func_load_version()
+            if version != self._version:
+                self.data_map = self._func_load_all()
+                self._version = version
+            self._checked_at = time.monotonic()
+
+    def _func_is_checked_recently(self) -> bool:
+        return self._checked_at is not None and time.monotonic() - self._checked_at < self.refresh_interval_seconds
+
+    def _func_load_version(self) -> tuple:
+        return (Setting
+                .select(fn.COUNT(Setting.id), fn.MAX(Setting.created_at), fn.MAX(Setting.updated_at))
+                .tuples()
+                .first())
+
+    def _func_load_all(self) -> dict[str, Any]:
+        db_settings = (Setting
+                       .select(Setting.the_key, Setting.the_value, Setting.the_type)
+                       .order_by(Setting.id))
+        return {
+            db_setting.the_key: self._map_from_db(db_setting.the_type, db_setting.the_value)
+            for db_setting in db_settings
+        }
 
     def _map_from_db(self, the_type: str, the_value: Any) -> Any|None:
         if the_type == SettingMapper.TYPE_INT:
@@ -3,6 +3,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+def _parse_int_map(value: str) -> dict[str, int]:
+    """'cron=700,hook=700' -> {'cron': 700, 'hook': 700}"""
+    int_map = {}
+    for item in value.split(","):
+        if "=" in item:
+            name, number = item.split("=", 1)
+            int_map[name.strip()] = int(number)
+    return int_map
+
 def get_config() -> dict:
     """
 
@@ -14,16 +23,54 @@ def get_config() -> dict:
                 "base_url": os.getenv("BINANCE_API_BASE_URL", ""),
                 "key": os.getenv("BINANCE_API_KEY", ""),
                 "secret": os.getenv("BINANCE_API_SECRET", ""),
+                "connect_timeout": float(os.getenv("BINANCE_API_CONNECT_TIMEOUT", "3.05")),
+                "read_timeout": float(os.getenv("BINANCE_API_READ_TIMEOUT", "10")),
+                "pool_maxsize": int(os.getenv("BINANCE_API_POOL_MAXSIZE", "10")),
             },
+            "symbol_info_ttl_seconds": int(os.getenv("BINANCE_SYMBOL_INFO_TTL_SECONDS", "3600")),
         },
         "telegram": {
             "bot_token": os.getenv("TELEGRAM_BOT_TOKEN", ""),
             "bot_username": os.getenv("TELEGRAM_BOT_USERNAME", ""),
             "chat_id": os.getenv("TELEGRAM_CHAT_ID", ""),
             "bot_api_secret_token": os.getenv("TELEGRAM_BOT_API_SECRET_TOKEN", ""),
+            "queue": {
+                "enabled": os.getenv("TELEGRAM_QUEUE_ENABLED", "1") == "1",
+                "per_chat_interval_seconds": float(os.getenv("TELEGRAM_QUEUE_PER_CHAT_INTERVAL_SECONDS", "1.0")),
+                "global_per_second": int(os.getenv("TELEGRAM_QUEUE_GLOBAL_PER_SECOND", "30")),
+                "max_retries": int(os.getenv("TELEGRAM_QUEUE_MAX_RETRIES", "3")),
+            },
+        },
+        "chart_cache": {
+            "max_items": int(os.getenv("CHART_CACHE_MAX_ITEMS", "64")),
+            "ttl_seconds": int(os.getenv("CHART_CACHE_TTL_SECONDS", "60")),
+            # empty = memory only, a directory shares the charts between processes
+            "dir": os.getenv("CHART_CACHE_DIR", ""),
+        },
+        # trading pairs & assets beyond the built-in ones, "BTCUSDT=2,BNBUSDT=3" / "BTC=3,BNB=4"
+        # the numbers are stored in the db rows, never change or reuse them
+        "mappers": {
+            "symbols": _parse_int_map(os.getenv("MAPPERS_SYMBOLS", "")),
+            "assets": _parse_int_map(os.getenv("MAPPERS_ASSETS", "")),
         },
         "view": {
-            "views_folder": "../views"
+            "views_folder": "../views",
+            # the compiled templates are shared between the processes (a hook does not compile them again)
+            "bytecode_cache_enabled": os.getenv("VIEW_BYTECODE_CACHE_ENABLED", "1") == "1",
+            # empty = jinja's directory in the system temp dir
+            "bytecode_cache_dir": os.getenv("VIEW_BYTECODE_CACHE_DIR", ""),
+            # the resident commands (webserver, scheduler, user_stream) compile all the templates at boot
+            "preload_templates": os.getenv("VIEW_PRELOAD_TEMPLATES", "1") == "1",
+        },
+        "settings": {
+            # how often the resident processes check the settings table for the changes, 0 = on every read
+            "refresh_interval_seconds": float(os.getenv("SETTINGS_REFRESH_INTERVAL_SECONDS", "5")),
+        },
+        "startup": {
+            # the budget of `--profile-startup` (imports + dependencies until the command starts), 0 = none
+            "budget_ms": int(os.getenv("STARTUP_BUDGET_MS", "0")),
+            # per command, overrides budget_ms, e.g. "cron=700,hook=700,webserver=1500"
+            "command_budgets_ms": _parse_int_map(os.getenv("STARTUP_COMMAND_BUDGETS_MS", "")),
         },
         "db": {
             "host": os.getenv("DATABASE_HOST", ""),
@@ -31,5 +78,14 @@ def get_config() -> dict:
             "name": os.getenv("DATABASE_NAME", ""),
             "user": os.getenv("DATABASE_USER", ""),
             "pass": os.getenv("DATABASE_PASS", ""),
+            # connections of the pool, one per concurrently working thread (hook workers, scheduler, user stream)
+            "max_connections": int(os.getenv("DATABASE_MAX_CONNECTIONS", "8")),
+            # connections older than this are closed instead of being reused, keep it below MySQL's wait_timeout
+            "stale_timeout_seconds": int(os.getenv("DATABASE_STALE_TIMEOUT_SECONDS", "300")),
+            # how long to wait for a free connection when all of them are in use (0 = forever)
+            "pool_timeout_seconds": int(os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", "10")),
+            "ping_on_checkout": os.getenv("DATABASE_PING_ON_CHECKOUT", "1") == "1",
+            "reconnect_attempts": int(os.getenv("DATABASE_RECONNECT_ATTEMPTS", "3")),
+            "reconnect_delay_seconds": float(os.getenv("DATABASE_RECONNECT_DELAY_SECONDS", "0.5")),
         }
     }
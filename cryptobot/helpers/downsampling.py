@@ -0,0 +1,60 @@
+import numpy as np
+
+def bucket_edges(length: int, max_points: int) -> np.ndarray:
+    """
+    Splits `length` points into `max_points` buckets: the first and the last point have their own bucket,
+    the rest are split evenly. Bucket k is [edges[k], edges[k + 1]).
+    """
+    every = (length - 2) / (max_points - 2)
+    middle = np.floor(np.arange(max_points - 1) * every).astype(np.int64) + 1
+    return np.concatenate(([0], middle, [length]))
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: from every bucket takes the point which makes the largest triangle
+    with the point taken from the previous bucket and the average of the next bucket.
+    Keeps the peaks and the dips of the line, unlike taking every n-th point.
+    """
+    buckets_count = len(edges) - 1
+    indices = np.empty(buckets_count, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = len(x) - 1
+    selected = 0
+    for k in range(1, buckets_count - 1):
+        start, end = edges[k], edges[k + 1]
+        next_start, next_end = edges[k + 1], edges[k + 2]
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+        # doubled triangle areas, the factor does not matter for argmax
+        areas = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[k] = selected
+    return indices
+
+def downsample_price_columns(
+        dates: np.ndarray,
+        low_prices: np.ndarray,
+        high_prices: np.ndarray,
+        close_prices: np.ndarray,
+        max_points: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduces the chart to `max_points` points (there is no sense to plot more points than there are pixels):
+    the close line by LTTB, the low-high band by the min/max envelope of the same buckets,
+    so the band never gets narrower than the candles it replaces. The first and the last points are kept.
+    """
+    length = len(dates)
+    if max_points < 3 or length <= max_points:
+        return dates, low_prices, high_prices, close_prices
+
+    edges = bucket_edges(length, max_points)
+    indices = lttb_indices(dates.astype(np.int64).astype(np.float64), close_prices, edges)
+    return (
+        dates[indices],
+        np.minimum.reduceat(low_prices, edges[:-1]),
+        np.maximum.reduceat(high_prices, edges[:-1]),
+        close_prices[indices],
+    )
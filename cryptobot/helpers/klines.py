@@ -0,0 +1,31 @@
+import numpy as np
+
+# one row per candle, times are millis (as binance gives them), prices and volume are float64
+KLINE_DTYPE = np.dtype([
+    ('open_time', np.int64),
+    ('open_price', np.float64),
+    ('high_price', np.float64),
+    ('low_price', np.float64),
+    ('close_price', np.float64),
+    ('volume', np.float64),
+    ('close_time', np.int64),
+])
+
+def klines_to_columns(klines: list) -> np.ndarray:
+    """
+    Raw `/api/v3/klines` rows -> structured array with KLINE_DTYPE, converted column by column.
+    For charts and analytics, money math still needs Decimal (see ServiceComponent.map_historical_klines).
+    """
+    columns = np.empty(len(klines), dtype=KLINE_DTYPE)
+    if len(klines) == 0:
+        return columns
+    columns['open_time'] = np.fromiter((kline[0] for kline in klines), dtype=np.int64, count=len(klines))
+    columns['close_time'] = np.fromiter((kline[6] for kline in klines), dtype=np.int64, count=len(klines))
+    # numpy parses the decimal strings itself
+    values = np.array([kline[1:6] for kline in klines], dtype=np.float64)
+    columns['open_price'] = values[:, 0]
+    columns['high_price'] = values[:, 1]
+    columns['low_price'] = values[:, 2]
+    columns['close_price'] = values[:, 3]
+    columns['volume'] = values[:, 4]
+    return columns
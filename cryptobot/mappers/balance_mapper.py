@@ -5,20 +5,33 @@ class BalanceMapper:
     ASSET_ETH = 2
 
     asset_mapping: dict[str, int] = {
-        'USDT': 1,
-        'ETH': 2,
+        'USDT': ASSET_USDT,
+        'ETH': ASSET_ETH,
     }
+    # db value -> binance asset, kept in sync by register_asset()
+    asset_remapping: dict[int, str] = {value: name for name, value in asset_mapping.items()}
+
+    @classmethod
+    def register_asset(cls, asset: str, value: int) -> None:
+        """
+        Adds an asset without a code change (see MAPPERS_ASSETS).
+        The value is stored in the balances rows, so it must never be reused for another asset.
+        """
+        asset = asset.upper()
+        if cls.asset_mapping.get(asset, value) != value or cls.asset_remapping.get(value, asset) != asset:
+            raise ValueError(f"Asset {asset} = {value} conflicts with the registered ones")
+        cls.asset_mapping[asset] = value
+        cls.asset_remapping[value] = asset
 
     @classmethod
     def map_asset(cls, asset: str) -> int:
         if not asset:
             return cls.ASSET_UNKNOWN
-        asset = asset.upper()
-        if asset == "USDT":
-            return cls.ASSET_USDT
-        if asset == "ETH":
-            return cls.ASSET_ETH
-        return cls.ASSET_UNKNOWN
+        return cls.asset_mapping.get(asset.upper(), cls.ASSET_UNKNOWN)
+
+    @classmethod
+    def remap_asset(cls, asset: int) -> str|None:
+        return cls.asset_remapping.get(asset)
 
     @classmethod
     def get_assets(cls):
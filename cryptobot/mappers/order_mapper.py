@@ -20,6 +20,14 @@ class OrderMapper:
     STATUS_EXPIRED = 8
     STATUS_EXPIRED_IN_MATCH = 9
 
+    # statuses an order may still change from
+    OPEN_STATUSES = [
+        STATUS_NEW,
+        STATUS_PENDING_NEW,
+        STATUS_PARTIALLY_FILLED,
+        STATUS_PENDING_CANCEL,
+    ]
+
     # Type constants
     TYPE_UNKNOWN = 0
     TYPE_LIMIT = 1
@@ -30,6 +38,7 @@ class OrderMapper:
     TYPE_TAKE_PROFIT_LIMIT = 6
     TYPE_LIMIT_MAKER = 7
 
+    # binance name -> db value, and the reverse tables db value -> binance name (built once, see register_symbol())
     type_mapping = {
         'UNKNOWN': TYPE_UNKNOWN,
         'LIMIT': TYPE_LIMIT,
@@ -38,8 +47,9 @@ class OrderMapper:
         'STOP_LOSS_LIMIT': TYPE_STOP_LOSS_LIMIT,
         'TAKE_PROFIT': TYPE_TAKE_PROFIT,
         'TAKE_PROFIT_LIMIT': TYPE_TAKE_PROFIT_LIMIT,
-        'TAKE_LIMIT_MAKER': TYPE_LIMIT_MAKER,
+        'LIMIT_MAKER': TYPE_LIMIT_MAKER,
     }
+    type_remapping: dict[int, str] = {value: name for name, value in type_mapping.items()}
 
     status_mapping = {
             "UNKNOWN": STATUS_UNKNOWN,
@@ -53,82 +63,68 @@ class OrderMapper:
             "EXPIRED": STATUS_EXPIRED,
             "EXPIRED_IN_MATCH": STATUS_EXPIRED_IN_MATCH,
         }
+    status_remapping: dict[int, str] = {value: name for name, value in status_mapping.items()}
+
+    side_mapping = {
+        'BUY': SIDE_BUY,
+        'SELL': SIDE_SELL,
+    }
+    side_remapping: dict[int, str] = {value: name for name, value in side_mapping.items()}
 
     symbol_mapping = {
-        'UNKNOWN': 0,
-        'ETHUSDT': 1,
+        'UNKNOWN': SYMBOL_UNKNOWN,
+        'ETHUSDT': SYMBOL_ETHUSDT,
     }
+    symbol_remapping: dict[int, str] = {value: name for name, value in symbol_mapping.items()}
+
+    @classmethod
+    def register_symbol(cls, symbol: str, value: int) -> None:
+        """
+        Adds a trading pair without a code change (see MAPPERS_SYMBOLS).
+        The value is stored in the orders & trades rows, so it must never be reused for another pair.
+        """
+        symbol = symbol.upper()
+        if cls.symbol_mapping.get(symbol, value) != value or cls.symbol_remapping.get(value, symbol) != symbol:
+            raise ValueError(f"Symbol {symbol} = {value} conflicts with the registered ones")
+        cls.symbol_mapping[symbol] = value
+        cls.symbol_remapping[value] = symbol
 
     @classmethod
     def map_symbol(cls, symbol: str) -> int:
         if not symbol:
             return cls.SYMBOL_UNKNOWN
-        symbol = symbol.upper()
-        if symbol == "ETHUSDT":
-            return cls.SYMBOL_ETHUSDT
-        return cls.SYMBOL_UNKNOWN
+        return cls.symbol_mapping.get(symbol.upper(), cls.SYMBOL_UNKNOWN)
 
     @classmethod
     def remap_symbol(cls, symbol: int) -> str|None:
-        for binance_symbol in cls.symbol_mapping:
-            if cls.symbol_mapping[binance_symbol] == symbol:
-                return binance_symbol
-        return None
+        return cls.symbol_remapping.get(symbol)
 
     @classmethod
     def map_side(cls, side: str) -> int:
         if not side:
             return cls.SIDE_UNKNOWN
-        side = side.upper()
-        if side == "BUY":
-            return cls.SIDE_BUY
-        if side == "SELL":
-            return cls.SIDE_SELL
-        return cls.SIDE_UNKNOWN
+        return cls.side_mapping.get(side.upper(), cls.SIDE_UNKNOWN)
 
     @classmethod
     def remap_side(cls, side: int) -> str|None:
-        if not side:
-            return None
-        if side == cls.SIDE_BUY:
-            return 'BUY'
-        if side == cls.SIDE_SELL:
-            return 'SELL'
-        return None
+        return cls.side_remapping.get(side)
 
     @classmethod
     def map_status(cls, status: str) -> int:
         if not status:
             return cls.STATUS_UNKNOWN
-        status = status.upper()
-        return cls.status_mapping.get(status, cls.STATUS_UNKNOWN)
+        return cls.status_mapping.get(status.upper(), cls.STATUS_UNKNOWN)
 
     @classmethod
     def remap_status(cls, status: int) -> str|None:
-        for binance_status in cls.status_mapping:
-            if cls.status_mapping[binance_status] == status:
-                return binance_status
-        return None
+        return cls.status_remapping.get(status)
 
     @classmethod
     def map_type(cls, type: str) -> int:
         if not type:
             return cls.TYPE_UNKNOWN
-        type = type.upper()
-        mapping = {
-            "LIMIT": cls.TYPE_LIMIT,
-            "MARKET": cls.TYPE_MARKET,
-            "STOP_LOSS": cls.TYPE_STOP_LOSS,
-            "STOP_LOSS_LIMIT": cls.TYPE_STOP_LOSS_LIMIT,
-            "TAKE_PROFIT": cls.TYPE_TAKE_PROFIT,
-            "TAKE_PROFIT_LIMIT": cls.TYPE_TAKE_PROFIT_LIMIT,
-            "LIMIT_MAKER": cls.TYPE_LIMIT_MAKER,
-        }
-        return mapping.get(type, cls.TYPE_UNKNOWN)
+        return cls.type_mapping.get(type.upper(), cls.TYPE_UNKNOWN)
 
     @classmethod
     def remap_type(cls, type: int) -> str|None:
-        for binance_type in cls.type_mapping:
-            if cls.type_mapping[binance_type] == type:
-                return binance_type
-        return None
+        return cls.type_remapping.get(type)
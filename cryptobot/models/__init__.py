@@ -1,7 +1,9 @@
-from .db import db_proxy as database_proxy
+from .db import db_proxy as database_proxy, ReconnectPooledMySQLDatabase
 from .order import Order
 from .order_filling_history import OrderFillingHistory
 from .order_trade import OrderTrade
 from .cron_job import CronJob
 from .balance import Balance
-from .setting import Setting
\ No newline at end of file
+from .setting import Setting
+from .trades_sync_cursor import TradesSyncCursor
+from .kline import Kline
\ No newline at end of file
@@ -19,6 +19,9 @@ class Balance(BaseModel):
 
     class Meta:
         table_name = 'balances'
+        indexes = (
+            (('asset', 'free', 'locked', 'checked_at'), False),
+        )
 
     # --- validation ---
 
@@ -29,7 +32,7 @@ class Balance(BaseModel):
         # asset
         if self.asset is None:
             self.add_error("asset", f"asset cannot be blank: '{self.asset}'")
-        elif self.asset not in BalanceMapper.get_assets().values():
+        elif self.asset not in BalanceMapper.asset_remapping:
             self.add_error("asset", f"Unknown asset: '{self.asset}'")
 
         # checked_at
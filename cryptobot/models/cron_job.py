@@ -39,8 +39,9 @@ class CronJob(BaseModel):
                 self.add_error("execution_interval_seconds",
                                f"Execution interval (seconds) must be int: '{self.execution_interval_seconds}'")
             else:
-                if self.execution_interval_seconds < 60:
-                    self.add_error("execution_interval_seconds", f"Execution interval (seconds) cannot be less then 0: '{self.execution_interval_seconds}'")
+                # sub-minute intervals are fine for the resident scheduler, `cron` still ticks once a minute
+                if self.execution_interval_seconds < 1:
+                    self.add_error("execution_interval_seconds", f"Execution interval (seconds) cannot be less then 1: '{self.execution_interval_seconds}'")
 
         return len(self._validation_errors) == 0
 
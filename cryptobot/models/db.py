@@ -1,3 +1,85 @@
-from peewee import DatabaseProxy
+from time import sleep
+
+from peewee import DatabaseProxy, OperationalError
+from playhouse.pool import PooledMySQLDatabase
+from playhouse.shortcuts import ReconnectMixin
+
+from logging import warning
 
 db_proxy = DatabaseProxy()
+
+
+class ReconnectPooledMySQLDatabase(ReconnectMixin, PooledMySQLDatabase):
+    """
+    Connection pool for the resident processes (webserver, scheduler, user stream):
+    a connection is checked out per thread and returned to the pool by `db.connection_context()`,
+    dead connections (MySQL's `wait_timeout`) are dropped on checkout and the failed query is retried
+    on a fresh one - up to `reconnect_attempts` times, with a doubling delay. Never inside a transaction.
+    """
+
+    reconnect_errors = ReconnectMixin.reconnect_errors + (
+        (OperationalError, '2003'),  # Can't connect to MySQL server (it is restarting).
+    )
+
+    def __init__(
+            self,
+            database,
+            ping_on_checkout: bool = True,
+            reconnect_attempts: int = 3,
+            reconnect_delay_seconds: float = 0.5,
+            **kwargs,
+    ):
+        super().__init__(database, **kwargs)
+        self.ping_on_checkout = ping_on_checkout
+        self.reconnect_attempts = max(reconnect_attempts, 1)
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+
+    @classmethod
+    def create(cls, db_config: dict):
+        return cls(
+            db_config["name"],
+            user = db_config["user"],
+            password = db_config["pass"],
+            host = db_config["host"],
+            port = db_config["port"],
+            max_connections = db_config["max_connections"],
+            stale_timeout = db_config["stale_timeout_seconds"],
+            timeout = db_config["pool_timeout_seconds"],
+            ping_on_checkout = db_config["ping_on_checkout"],
+            reconnect_attempts = db_config["reconnect_attempts"],
+            reconnect_delay_seconds = db_config["reconnect_delay_seconds"],
+        )
+
+    def _is_closed(self, conn) -> bool:
+        # the ping costs a round trip per checkout
+        if not self.ping_on_checkout:
+            return False
+        return super()._is_closed(conn)
+
+    def _reconnect(self, func, *args, **kwargs):
+        for attempt in range(self.reconnect_attempts + 1):
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as e:
+                # inside a transaction the changes made so far would be lost silently
+                if attempt >= self.reconnect_attempts or self.in_transaction() or not self._func_is_reconnect_error(e):
+                    raise
+                # the first retry is immediate (the server has just dropped an idle connection)
+                delay_seconds = 0 if attempt == 0 else self.reconnect_delay_seconds * 2 ** (attempt - 1)
+                warning(f"Database : {e}, reconnecting in {delay_seconds}s (attempt {attempt + 1})")
+                self.proc_drop_connection()
+                sleep(delay_seconds)
+
+    def proc_drop_connection(self):
+        """Closes the connection of this thread for real, a broken one must not go back to the pool"""
+        if self.is_closed():
+            return
+        try:
+            self.manual_close()
+        except Exception:
+            # the socket is already dead, the pool has forgotten it anyway
+            pass
+
+    def _func_is_reconnect_error(self, e: Exception) -> bool:
+        message = str(e).lower()
+        return any(fragment in message for fragment in self._reconnect_errors.get(type(e), []))
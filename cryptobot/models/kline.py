@@ -0,0 +1,105 @@
+from decimal import Decimal
+from typing import Any
+
+from peewee import BigIntegerField, DecimalField, CharField
+
+from .base import BaseModel
+
+class Kline(BaseModel):
+    # fields
+    binance_symbol = CharField(max_length=20, null=False)
+    # binance interval ('1m', '1h', '1M', ...), the column is case-sensitive: '1m' != '1M'
+    interval = CharField(max_length=3, null=False)
+    open_time = BigIntegerField(null=False)
+    close_time = BigIntegerField(null=False)
+    open_price = DecimalField(max_digits=24, decimal_places=8, auto_round=True)
+    high_price = DecimalField(max_digits=24, decimal_places=8, auto_round=True)
+    low_price = DecimalField(max_digits=24, decimal_places=8, auto_round=True)
+    close_price = DecimalField(max_digits=24, decimal_places=8, auto_round=True)
+    volume = DecimalField(max_digits=30, decimal_places=8, auto_round=True)
+    quote_volume = DecimalField(max_digits=30, decimal_places=8, auto_round=True)
+    trades_count = BigIntegerField(null=False, default=0)
+    taker_buy_base_volume = DecimalField(max_digits=30, decimal_places=8, auto_round=True)
+    taker_buy_quote_volume = DecimalField(max_digits=30, decimal_places=8, auto_round=True)
+
+    class Meta:
+        table_name = 'klines'
+        indexes = (
+            (('binance_symbol', 'interval', 'open_time'), True),
+        )
+
+    # --- validation ---
+
+    def validate(self) -> bool:
+        if not super().validate():
+            return False
+
+        # binance_symbol
+        if not self.binance_symbol:
+            self.add_error("binance_symbol", f"binance_symbol cannot be blank: '{self.binance_symbol}'")
+
+        # interval
+        if not self.interval:
+            self.add_error("interval", f"interval cannot be blank: '{self.interval}'")
+
+        # open_time, close_time
+        if self.open_time is None or self.close_time is None or self.open_time >= self.close_time:
+            self.add_error("close_time", f"close_time '{self.close_time}' must be greater than open_time '{self.open_time}'")
+
+        return len(self._validation_errors) == 0
+
+    # --- binance ---
+
+    def fill_from_binance(self, binance_symbol: str, interval: str, binance_kline: list[Any]):
+        self.binance_symbol = binance_symbol
+        self.interval = interval
+        self.open_time = int(binance_kline[0])
+        self.open_price = Decimal(binance_kline[1])
+        self.high_price = Decimal(binance_kline[2])
+        self.low_price = Decimal(binance_kline[3])
+        self.close_price = Decimal(binance_kline[4])
+        self.volume = Decimal(binance_kline[5])
+        self.close_time = int(binance_kline[6])
+        self.quote_volume = Decimal(binance_kline[7])
+        self.trades_count = int(binance_kline[8])
+        self.taker_buy_base_volume = Decimal(binance_kline[9])
+        self.taker_buy_quote_volume = Decimal(binance_kline[10])
+        return self
+
+    def as_binance_kline(self) -> list[Any]:
+        """The row in the shape of `/api/v3/klines` response"""
+        return [
+            self.open_time,
+            str(self.open_price),
+            str(self.high_price),
+            str(self.low_price),
+            str(self.close_price),
+            str(self.volume),
+            self.close_time,
+            str(self.quote_volume),
+            self.trades_count,
+            str(self.taker_buy_base_volume),
+            str(self.taker_buy_quote_volume),
+            '0',
+        ]
+
+    # --- utilities ---
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "binance_symbol": self.binance_symbol,
+            "interval": self.interval,
+            "open_time": self.open_time,
+            "close_time": self.close_time,
+            "open_price": self.open_price,
+            "high_price": self.high_price,
+            "low_price": self.low_price,
+            "close_price": self.close_price,
+            "volume": self.volume,
+            "quote_volume": self.quote_volume,
+            "trades_count": self.trades_count,
+            "taker_buy_base_volume": self.taker_buy_base_volume,
+            "taker_buy_quote_volume": self.taker_buy_quote_volume,
+        }
@@ -26,6 +26,9 @@ class Order(BaseModel):
 
     class Meta:
         table_name = 'orders'
+        indexes = (
+            (('status', 'symbol'), False),
+        )
 
     # --- validation ---
 
@@ -33,25 +36,13 @@ class Order(BaseModel):
         if not super().validate():
             return False
 
-        if self.side not in (OrderMapper.SIDE_UNKNOWN, OrderMapper.SIDE_BUY, OrderMapper.SIDE_SELL):
+        if self.side != OrderMapper.SIDE_UNKNOWN and self.side not in OrderMapper.side_remapping:
             self.add_error("side", f"Invalid side value: {self.side}")
 
-        if self.symbol not in (OrderMapper.SYMBOL_UNKNOWN, OrderMapper.SYMBOL_ETHUSDT):
+        if self.symbol not in OrderMapper.symbol_remapping:
             self.add_error("symbol", f"Invalid symbol value: {self.symbol}")
 
-        valid_statuses = (
-            OrderMapper.STATUS_UNKNOWN,
-            OrderMapper.STATUS_NEW,
-            OrderMapper.STATUS_PENDING_NEW,
-            OrderMapper.STATUS_PARTIALLY_FILLED,
-            OrderMapper.STATUS_FILLED,
-            OrderMapper.STATUS_CANCELED,
-            OrderMapper.STATUS_PENDING_CANCEL,
-            OrderMapper.STATUS_REJECTED,
-            OrderMapper.STATUS_EXPIRED,
-            OrderMapper.STATUS_EXPIRED_IN_MATCH,
-        )
-        if self.status not in valid_statuses:
+        if self.status not in OrderMapper.status_remapping:
             self.add_error("status", f"Invalid status value: {self.status}")
 
         if self.order_price is None or self.order_price <= 0:
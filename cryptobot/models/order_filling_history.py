@@ -18,6 +18,9 @@ class OrderFillingHistory(BaseModel):
 
     class Meta:
         table_name = 'orders_filling_history'
+        indexes = (
+            (('order_id', 'logged_at'), False),
+        )
 
     # --- validation ---
 
@@ -28,8 +28,31 @@ class OrderTrade(BaseModel):
 
     class Meta:
         table_name = 'order_trades'
+        indexes = (
+            (('binance_order_id',), False),
+        )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # None = check the parent order with a query on every validation
+        self._known_binance_order_ids: set[int] | None = None
 
     # --- validation ---
+    @classmethod
+    def get_known_binance_order_ids(cls, binance_order_ids: list[int]) -> set[int]:
+        """One `IN (...)` query for the whole batch, see set_known_binance_order_ids()"""
+        if len(binance_order_ids) == 0:
+            return set()
+        return set(
+            db_order.binance_order_id
+            for db_order in Order.select(Order.binance_order_id).where(Order.binance_order_id.in_(list(set(binance_order_ids))))
+        )
+
+    def set_known_binance_order_ids(self, known_binance_order_ids: set[int] | None):
+        # batch validation: the parent order existence is checked against this set, without a query per trade
+        self._known_binance_order_ids = known_binance_order_ids
+        return self
+
     def validate(self) -> bool:
         if not super().validate():
             return False
@@ -48,11 +71,14 @@ class OrderTrade(BaseModel):
         if self.binance_order_id is None:
             self.add_error("binance_order_id", "binance_order_id must be present")
 
-        if Order.select().where(Order.binance_order_id == self.binance_order_id).count() == 0:
+        if self._known_binance_order_ids is not None:
+            if self.binance_order_id not in self._known_binance_order_ids:
+                self.add_error("binance_order_id", f"Order with binance_order_id = {self.binance_order_id} must exist in db")
+        elif Order.select().where(Order.binance_order_id == self.binance_order_id).count() == 0:
             self.add_error("binance_order_id", f"Order with binance_order_id = {self.binance_order_id} must exist in db")
 
         # symbol
-        if self.symbol not in (OrderMapper.SYMBOL_UNKNOWN, OrderMapper.SYMBOL_ETHUSDT):
+        if self.symbol not in OrderMapper.symbol_remapping:
             self.add_error("symbol", f"Invalid symbol value: {self.symbol}")
 
         # order_list_id
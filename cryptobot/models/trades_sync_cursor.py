@@ -0,0 +1,39 @@
+from peewee import BigIntegerField
+
+from cryptobot.mappers.order_mapper import OrderMapper
+from .base import BaseModel
+
+class TradesSyncCursor(BaseModel):
+    # fields
+    symbol = BigIntegerField(null=False, unique=True)
+    # next `fromId` for `/api/v3/myTrades` (all the trades below it are already synced)
+    from_id = BigIntegerField(null=False, default=0)
+
+    class Meta:
+        table_name = 'trades_sync_cursors'
+
+    # --- validation ---
+
+    def validate(self) -> bool:
+        if not super().validate():
+            return False
+
+        # symbol
+        if self.symbol not in OrderMapper.symbol_remapping or self.symbol == OrderMapper.SYMBOL_UNKNOWN:
+            self.add_error("symbol", f"Invalid symbol value: {self.symbol}")
+
+        # from_id
+        if self.from_id is None or self.from_id < 0:
+            self.add_error("from_id", f"from_id must be present and cannot be negative: '{self.from_id}'")
+
+        return len(self._validation_errors) == 0
+
+    # --- utilities ---
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "symbol": self.symbol,
+            "from_id": self.from_id,
+        }
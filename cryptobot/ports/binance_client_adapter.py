@@ -1,7 +1,6 @@
 from typing import Protocol, runtime_checkable, Any
 
-from binance import KLINE_INTERVAL_1DAY
-from binance.client import Client
+from cryptobot.ports.kline_intervals import KLINE_INTERVAL_1DAY
 
 
 @runtime_checkable
@@ -9,7 +8,7 @@ class BinanceClientAdapterPort(Protocol):
 
     def get_open_orders(self) -> list[dict[str, Any]]: ...
 
-    def get_all_orders(self, symbol: str) -> list[dict[str, Any]]: ...
+    def get_all_orders(self, symbol: str, order_id: int | None = None) -> list[dict[str, Any]]: ...
 
     def get_order(self, orderId: int, symbol: str) -> dict[str, Any]: ...
 
@@ -19,8 +18,12 @@ class BinanceClientAdapterPort(Protocol):
 
     def get_asset_balance(self, asset=None) -> dict[str, Any] | None: ...
 
+    def get_account(self) -> dict[str, Any]: ...
+
     def get_symbol_info(self, symbol: str) -> dict[str, Any]: ...
 
+    def get_exchange_info(self) -> dict[str, Any]: ...
+
     def create_test_order(self, **params) -> dict: ...
 
     def create_order(self, **params) -> dict: ...
\ No newline at end of file
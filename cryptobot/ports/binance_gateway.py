@@ -1,17 +1,110 @@
+from dataclasses import dataclass
+from decimal import Decimal
 from typing import Protocol, runtime_checkable, Any, Mapping
 
-from binance import KLINE_INTERVAL_1DAY
+from cryptobot.ports.kline_intervals import KLINE_INTERVAL_1DAY
 
 from cryptobot.ports.binance_api_adapter import BinanceApiAdapterPort
 from cryptobot.ports.binance_client_adapter import BinanceClientAdapterPort
 
 
+@dataclass(frozen=True)
+class SymbolFilters:
+    """Exchange filters of one symbol, parsed from its `exchangeInfo` entry"""
+    symbol: str
+    base_asset: str
+    quote_asset: str
+    step_size: Decimal | None = None
+    min_qty: Decimal | None = None
+    max_qty: Decimal | None = None
+    min_notional: Decimal | None = None
+    max_notional: Decimal | None = None
+    tick_size: Decimal | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+
+    @classmethod
+    def create(cls, symbol_info: dict[str, Any]):
+        params: dict[str, Any] = {}
+        for f in symbol_info.get("filters", []):
+            if f["filterType"] == "LOT_SIZE":
+                params["step_size"] = Decimal(f["stepSize"])
+                params["min_qty"] = Decimal(f["minQty"])
+                params["max_qty"] = Decimal(f["maxQty"])
+            elif f["filterType"] in ["MIN_NOTIONAL", "NOTIONAL"]:
+                params["min_notional"] = Decimal(f["minNotional"])
+                if "maxNotional" in f:
+                    params["max_notional"] = Decimal(f["maxNotional"])
+            elif f["filterType"] == "PRICE_FILTER":
+                params["tick_size"] = Decimal(f["tickSize"])
+                params["min_price"] = Decimal(f["minPrice"])
+                params["max_price"] = Decimal(f["maxPrice"])
+        return cls(
+            symbol=symbol_info["symbol"],
+            base_asset=symbol_info["baseAsset"],
+            quote_asset=symbol_info["quoteAsset"],
+            **params,
+        )
+
+    # Local pre-validation of LIMIT orders, the same rules Binance applies (zero = the limit is disabled):
+    # https://developers.binance.com/docs/binance-spot-api-docs/filters
+
+    def func_fit_price(self, price: Decimal) -> Decimal:
+        """Rounds the price down to the PRICE_FILTER grid: (price - minPrice) % tickSize == 0"""
+        if not self.tick_size:
+            return price
+        base = self.min_price or Decimal(0)
+        return base + ((price - base) // self.tick_size) * self.tick_size
+
+    def func_fit_quantity(self, side: str, price: Decimal, balance: Decimal) -> Decimal:
+        """
+        The biggest LOT_SIZE compliant quantity the free balance allows at the price
+        (BUY spends the quote asset, SELL the base one). Decimal('0') if even minQty is not affordable.
+        """
+        if side.upper() == "BUY":
+            raw_quantity = balance / price
+        elif side.upper() == "SELL":
+            raw_quantity = balance
+        else:
+            raise ValueError("Side must be 'BUY' or 'SELL'")
+        if self.max_qty:
+            raw_quantity = min(raw_quantity, self.max_qty)
+        base = self.min_qty or Decimal(0)
+        if raw_quantity < base or raw_quantity <= 0:
+            return Decimal('0')
+        if not self.step_size:
+            return raw_quantity
+        return base + ((raw_quantity - base) // self.step_size) * self.step_size
+
+    def func_get_violations(self, quantity: Decimal, price: Decimal) -> list[str]:
+        """Names of the filters the order would fail, empty if it passes"""
+        violations: list[str] = []
+        if (
+            quantity <= 0
+            or (self.min_qty and quantity < self.min_qty)
+            or (self.max_qty and quantity > self.max_qty)
+            or (self.step_size and (quantity - (self.min_qty or 0)) % self.step_size != 0)
+        ):
+            violations.append("LOT_SIZE")
+        if (
+            price <= 0
+            or (self.min_price and price < self.min_price)
+            or (self.max_price and price > self.max_price)
+            or (self.tick_size and (price - (self.min_price or 0)) % self.tick_size != 0)
+        ):
+            violations.append("PRICE_FILTER")
+        notional = quantity * price
+        if (self.min_notional and notional < self.min_notional) or (self.max_notional and notional > self.max_notional):
+            violations.append("NOTIONAL")
+        return violations
+
+
 @runtime_checkable
 class BinanceGatewayPort(Protocol):
 
     def get_open_orders(self) -> list[dict[str, Any]]: ...
 
-    def get_all_orders(self, symbol: str) -> list[dict[str, Any]]: ...
+    def get_all_orders(self, symbol: str, order_id: int | None = None) -> list[dict[str, Any]]: ...
 
     def get_order_by_binance_order_id(self, binance_order_id: int, binance_order_symbol: str) -> dict[str, Any]: ...
 
@@ -21,13 +114,19 @@ class BinanceGatewayPort(Protocol):
 
     def get_asset_balance(self, asset=None) -> dict[str, Any]: ...
 
+    def get_asset_balances(self, assets: list[str] | None = None, updated_since: int | None = None) -> dict[str, dict[str, Any]]: ...
+
     def get_symbol_info(self, symbol: str) -> dict[str, Any]: ...
 
+    def get_symbol_filters(self, symbol: str) -> SymbolFilters | None: ...
+
+    def invalidate_symbol_info(self, symbol: str | None = None) -> None: ...
+
     def create_test_order(self, **params: Any) -> dict[str, Any]: ...
 
     def create_order(self, **params: Any) -> dict[str, Any]: ...
 
-    def get_all_trades(self, binance_symbol: str) -> list[dict]: ...
+    def get_all_trades(self, binance_symbol: str, from_id: int = 0) -> list[dict]: ...
 
     """
     Get internal transfers history (Spot-to-Funding and vise-versa).
@@ -0,0 +1,14 @@
+from typing import Protocol, runtime_checkable, Callable
+
+
+@runtime_checkable
+class BinanceUserStreamAdapterPort(Protocol):
+
+    """
+    Blocks and passes every user data stream event (executionReport, outboundAccountPosition, ...) to on_event
+    until stop() is called. on_connect is called after every (re)connection - the events sent while
+    the stream was down are lost, so it's the place for a REST reconciliation.
+    """
+    def listen(self, on_event: Callable[[dict], None], on_connect: Callable[[], None] | None = None) -> None: ...
+
+    def stop(self) -> None: ...
@@ -0,0 +1,14 @@
+from typing import Protocol, runtime_checkable, Any
+
+import numpy as np
+
+
+@runtime_checkable
+class ChartCachePort(Protocol):
+
+    @staticmethod
+    def func_make_key(binance_symbol: str, period: str, interval: str, klines: np.ndarray, orders: list[dict[str, Any]]) -> str: ...
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, png: bytes) -> None: ...
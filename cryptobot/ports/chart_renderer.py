@@ -0,0 +1,22 @@
+from typing import Protocol, runtime_checkable
+
+import numpy as np
+
+
+@runtime_checkable
+class ChartRendererPort(Protocol):
+
+    def render_price_chart(
+            self,
+            dates: np.ndarray,
+            low_prices: np.ndarray,
+            high_prices: np.ndarray,
+            close_prices: np.ndarray,
+            orders: list[dict],
+            title: str,
+            ylabel: str,
+    ) -> bytes: ...
+
+    def func_get_max_points(self) -> int: ...
+
+    def close(self) -> None: ...
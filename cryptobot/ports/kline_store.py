@@ -0,0 +1,7 @@
+from typing import Protocol, runtime_checkable
+
+
+@runtime_checkable
+class KlineStorePort(Protocol):
+
+    def get_historical_klines(self, binance_symbol: str, period: str | int, interval: str) -> list: ...
@@ -0,0 +1,164 @@
+import importlib.abc
+import sys
+import threading
+import time
+from typing import Any
+
+# stdlib only: this module is imported before anything else in __main__, its own imports are not measured
+
+ENV_PROFILE_STARTUP = "CRYPTOBOT_PROFILE_STARTUP"
+ARG_PROFILE_STARTUP = "--profile-startup"
+
+
+def func_is_profiling_requested(argv: list[str], environ: dict) -> bool:
+    return ARG_PROFILE_STARTUP in argv or environ.get(ENV_PROFILE_STARTUP, "") == "1"
+
+
+class StartupProfiler:
+    """
+    Measures what `python -m cryptobot <command>` spends before the command starts executing:
+    every module import (like `python -X importtime`: self time and time including the nested imports)
+    and the construction of every dependency taken from the DI container.
+    The interpreter's own start (before cryptobot/__main__.py runs) is not included.
+    """
+
+    def __init__(self):
+        self.started_at: float = time.perf_counter()
+        self.stopped_at: float | None = None
+        # module name -> [self seconds, seconds including nested imports]
+        self.imports: dict[str, list[float]] = {}
+        self._local = threading.local()
+        self._finder: _ImportTimingFinder | None = None
+
+    @classmethod
+    def start(cls) -> 'StartupProfiler':
+        profiler = cls()
+        profiler.proc_install()
+        return profiler
+
+    def proc_install(self) -> None:
+        if self._finder is None:
+            self._finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def proc_stop(self) -> None:
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+        if self.stopped_at is None:
+            self.stopped_at = time.perf_counter()
+
+    def func_get_elapsed_seconds(self) -> float:
+        return (self.stopped_at or time.perf_counter()) - self.started_at
+
+    def func_is_over_budget(self, budget_ms: int) -> bool:
+        # 0 = no budget
+        return 0 < budget_ms < self.func_get_elapsed_seconds() * 1000
+
+    def func_run_timed(self, name: str, func, *args) -> Any:
+        stack: list[list[float]] = self._func_get_stack()
+        # [started at, seconds spent in the nested imports]
+        frame = [time.perf_counter(), 0.0]
+        stack.append(frame)
+        try:
+            return func(*args)
+        finally:
+            stack.pop()
+            total = time.perf_counter() - frame[0]
+            if stack:
+                stack[-1][1] += total
+            timing = self.imports.setdefault(name, [0.0, 0.0])
+            # create_module() and exec_module() of the same module are summed up
+            timing[0] += total - frame[1]
+            timing[1] += total
+
+    def func_report(
+            self,
+            command: str,
+            dependencies: dict[str, tuple[float, float]] | None = None,
+            budget_ms: int = 0,
+            top: int = 25,
+    ) -> str:
+        """Ranked tables (by self time) of the imports and of the dependencies, the total and the budget"""
+        elapsed_ms = self.func_get_elapsed_seconds() * 1000
+        imports_ms = sum(timing[0] for timing in self.imports.values()) * 1000
+        lines = [
+            f"Startup profile of '{command}': {elapsed_ms:.1f} ms"
+            f" (imports {imports_ms:.1f} ms in {len(self.imports)} modules)",
+            "",
+            f"{'self ms':>10} {'cumul ms':>10}  import",
+        ]
+        ranked_imports = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_seconds, total_seconds) in ranked_imports[:top]:
+            lines.append(f"{self_seconds * 1000:>10.1f} {total_seconds * 1000:>10.1f}  {name}")
+        if len(ranked_imports) > top:
+            lines.append(f"{'':>10} {'':>10}  ... {len(ranked_imports) - top} more")
+
+        if dependencies:
+            lines += ["", f"{'self ms':>10} {'cumul ms':>10}  dependency"]
+            ranked_dependencies = sorted(dependencies.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (self_seconds, total_seconds) in ranked_dependencies:
+                lines.append(f"{self_seconds * 1000:>10.1f} {total_seconds * 1000:>10.1f}  {name}")
+
+        lines.append("")
+        if budget_ms <= 0:
+            lines.append(f"Budget for '{command}': not set")
+        elif self.func_is_over_budget(budget_ms):
+            lines.append(f"Budget for '{command}': {budget_ms} ms - EXCEEDED by {elapsed_ms - budget_ms:.1f} ms")
+        else:
+            lines.append(f"Budget for '{command}': {budget_ms} ms - OK")
+        return "\n".join(lines)
+
+    def _func_get_stack(self) -> list[list[float]]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+class _ImportTimingFinder(importlib.abc.MetaPathFinder):
+    """Asks the other finders for the spec and wraps its loader into _TimedLoader"""
+
+    def __init__(self, profiler: StartupProfiler):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        finding: set = self._local.__dict__.setdefault("finding", set())
+        if fullname in finding:
+            return None
+        finding.add(fullname)
+        try:
+            spec = None
+            for finder in list(sys.meta_path):
+                find_spec = getattr(finder, "find_spec", None)
+                if finder is self or find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            finding.discard(fullname)
+
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, fullname, self._profiler)
+        return spec
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, fullname: str, profiler: StartupProfiler):
+        self._loader = loader
+        self._fullname = fullname
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        # get_source(), get_resource_reader() etc. of the wrapped loader
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        # the extension modules (.so) are loaded here
+        return self._profiler.func_run_timed(self._fullname, self._loader.create_module, spec)
+
+    def exec_module(self, module):
+        return self._profiler.func_run_timed(self._fullname, self._loader.exec_module, module)
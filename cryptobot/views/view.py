@@ -32,4 +32,11 @@ class View:
         #print(f'Rendering template: \'{template}\'')
         return template.render(self._default_vars | render_vars)
 
+    def preload_templates(self) -> list[str]:
+        """Compiles all the templates into the environment's cache, for the resident processes"""
+        names = self._environment.list_templates(filter_func=lambda name: name.endswith('.j2'))
+        for name in names:
+            self._environment.get_template(name)
+        return names
+
 
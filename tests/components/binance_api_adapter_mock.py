@@ -39,9 +39,11 @@ class BinanceApiAdapterMock(BinanceApiAdapterMockPort, BinanceApiAdapterPort):
             symbol: str|None = params.get("symbol", None)
             if symbol is None:
                 return []
-            if params['fromId'] != 0:
-                return []
-            return self.memory_my_trades.get(symbol, [])
+            my_trades: list[dict[str, str|int|bool]] = [
+                trade for trade in self.memory_my_trades.get(symbol, []) if int(trade['id']) >= params.get('fromId', 0)
+            ]
+            my_trades.sort(key=lambda trade: int(trade['id']))
+            return my_trades[:params.get('limit', 500)]
 
         if endpoint == "/sapi/v1/asset/transfer":
             type: str|None = params.get("type", None)
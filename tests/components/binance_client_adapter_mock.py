@@ -19,6 +19,11 @@ class BinanceClientAdapterMock(BinanceClientAdapterMockPort, BinanceClientAdapte
         self.memory_historical_klines: dict[str, list[list[Any]]] = {}
         self.memory_asset_balance: dict[str, dict[str, str]] = {}
         self.memory_symbol_info: dict[str, Any] = {}
+        self.exchange_info_calls_count: int = 0
+        self.account_calls_count: int = 0
+        # None = the account is always up to date (updateTime is now)
+        self.memory_account_update_time: int | None = None
+        self.historical_klines_calls: list[dict[str, Any]] = []
 
     @classmethod
     def create(cls,):
@@ -47,11 +52,13 @@ class BinanceClientAdapterMock(BinanceClientAdapterMockPort, BinanceClientAdapte
                     orders.append(order)
         return orders
 
-    def get_all_orders(self, symbol: str) -> list[dict[str, Any]]:
+    def get_all_orders(self, symbol: str, order_id: int | None = None) -> list[dict[str, Any]]:
         orders: list[dict[str, Any]] = []
         if self.memory_orders.get(symbol) is None:
             self.memory_orders[symbol] = []
         for order in self.memory_orders.get(symbol):
+            if order_id is not None and order['orderId'] < order_id:
+                continue
             orders.append(order)
         return orders
 
@@ -72,6 +79,16 @@ class BinanceClientAdapterMock(BinanceClientAdapterMockPort, BinanceClientAdapte
         self.memory_historical_klines = historical_klines
 
     def get_historical_klines(self, symbol: str, start_str: str, interval: str = KLINE_INTERVAL_1DAY) -> list:
+        self.historical_klines_calls.append({'symbol': symbol, 'start_str': start_str, 'interval': interval})
+        if isinstance(start_str, int):
+            # millis (as KlineStore asks): all the seeded candles of the symbol and interval opened since then
+            klines: dict[int, list[Any]] = {}
+            for key, seeded_klines in self.memory_historical_klines.items():
+                if key.startswith(f'{symbol}:') and key.endswith(f':{interval}'):
+                    for kline in seeded_klines:
+                        if kline[0] >= start_str:
+                            klines[kline[0]] = kline
+            return [klines[open_time] for open_time in sorted(klines.keys())]
         key = f'{symbol}:{start_str}:{interval}'
         if self.memory_historical_klines.get(key) is None:
             raise BinanceAPIException(response='', status_code='400', text='')
@@ -85,12 +102,26 @@ class BinanceClientAdapterMock(BinanceClientAdapterMockPort, BinanceClientAdapte
             return None
         return self.memory_asset_balance.get(asset, None)
 
+    def seed_account_update_time(self, update_time: int | None) -> None:
+        self.memory_account_update_time = update_time
+
+    def get_account(self) -> dict[str, Any]:
+        self.account_calls_count += 1
+        update_time = self.memory_account_update_time
+        if update_time is None:
+            update_time = int(time.time() * 1000)
+        return {'updateTime': update_time, 'balances': list(self.memory_asset_balance.values())}
+
     def seed_symbol_info(self, symbol_info: dict[str, Any]) -> None:
         self.memory_symbol_info = symbol_info
 
     def get_symbol_info(self, symbol: str) -> dict[str, Any]:
         return self.memory_symbol_info.get(symbol, {})
 
+    def get_exchange_info(self) -> dict[str, Any]:
+        self.exchange_info_calls_count += 1
+        return {'symbols': list(self.memory_symbol_info.values())}
+
     def _check_base_order_params(self, **params: Any) -> bool:
         if params.get('symbol', None) is None or params['symbol'] not in ['ETHUSDT',]:
             raise Exception
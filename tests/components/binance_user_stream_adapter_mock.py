@@ -0,0 +1,38 @@
+from typing import Any, Callable
+
+from cryptobot.ports.binance_user_stream_adapter import BinanceUserStreamAdapterPort
+from tests.ports.binance_user_stream_adapter_mock import BinanceUserStreamAdapterMockPort
+
+
+class BinanceUserStreamAdapterMock(BinanceUserStreamAdapterMockPort, BinanceUserStreamAdapterPort):
+    """
+    Fake user data stream: "connects" and replays the seeded events, returns when all of them are sent.
+    """
+    def __init__(self):
+        super().__init__()
+        self.memory_events: list[dict[str, Any]] = []
+        self.memory_connects: int = 0
+        self._stopped = False
+
+    def clear(self) -> None:
+        self.memory_events: list[dict[str, Any]] = []
+        self.memory_connects: int = 0
+
+    def seed_events(self, events: list[dict[str, Any]], clear: bool = True) -> None:
+        if clear:
+            self.memory_events = []
+        self.memory_events += events
+
+    def connects_count(self) -> int:
+        return self.memory_connects
+
+    def listen(self, on_event: Callable[[dict], None], on_connect: Callable[[], None] | None = None) -> None:
+        self._stopped = False
+        self.memory_connects += 1
+        if on_connect is not None:
+            on_connect()
+        while len(self.memory_events) > 0 and not self._stopped:
+            on_event(self.memory_events.pop(0))
+
+    def stop(self) -> None:
+        self._stopped = True
@@ -0,0 +1,38 @@
+import json
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import ConnectTimeout
+
+
+class HttpTransportAdapterMock(BaseAdapter):
+    """
+    Transport adapter to mount into a requests.Session: remembers the sent requests and replies with the seeded ones.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.sent: list[dict] = []
+        self.responses: list[tuple[int, dict | list] | Exception] = []
+
+    def seed_responses(self, responses: list[tuple[int, dict | list] | Exception]) -> None:
+        self.responses = responses
+
+    def send(self, request: PreparedRequest, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:
+        self.sent.append({'request': request, 'timeout': timeout})
+        if len(self.responses) == 0:
+            raise ConnectTimeout(f"No seeded response for '{request.url}'", request=request)
+        seeded = self.responses.pop(0)
+        if isinstance(seeded, Exception):
+            raise seeded
+        status_code, body = seeded
+        response = Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
@@ -1,3 +1,4 @@
+import json
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,6 +15,11 @@ class TelegramHttpTransportMockComponent(TelegramHttpTransportComponentMockPort,
     def __init__(self):
         super().__init__()
         self.messages: list[TelegramMessageDataObject] = []
+        # (status_code, json body) to reply with, an empty Response() when nothing is seeded
+        self.responses: list[tuple[int, dict]] = []
+
+    def seed_responses(self, responses: list[tuple[int, dict]]) -> None:
+        self.responses = responses
 
     def clear(self) -> None:
         self.messages: list[TelegramMessageDataObject] = []
@@ -29,6 +35,12 @@ class TelegramHttpTransportMockComponent(TelegramHttpTransportComponentMockPort,
 
     def request_post(self, url: str, data: dict | None = None, files: dict | None = None) -> Response | None:
         self.messages.append(TelegramMessageDataObject(url=url, data=data, files=files))
-        return Response()
+        response = Response()
+        if len(self.responses) > 0:
+            status_code, body = self.responses.pop(0)
+            response.status_code = status_code
+            response._content = json.dumps(body).encode('utf-8')
+            response.encoding = 'utf-8'
+        return response
 
 
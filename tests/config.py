@@ -10,7 +10,8 @@ def get_config() -> dict:
     """
     config: dict = get_original_config()
 
-    config['db'] = {
+    # the pool settings are taken from the original config
+    config['db'] = config['db'] | {
         "host": os.getenv("TEST_DATABASE_HOST", ""),
         "port": int(os.getenv("TEST_DATABASE_PORT", "")),
         "name": os.getenv("TEST_DATABASE_NAME", ""),
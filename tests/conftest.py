@@ -9,10 +9,9 @@ import pytest
 from binance import Client
 from dotenv import load_dotenv
 from jinja2 import Environment, FileSystemLoader
-from peewee import MySQLDatabase
 
 from cryptobot.components import TelegramComponent, ServiceComponent, BinanceClientAdapter, BinanceApiAdapter, \
-    BinanceGateway
+    BinanceGateway, ChartRenderer
 from cryptobot.components.settings import SettingsComponent
 from cryptobot.components.telegram_http_transport import TelegramHttpTransportComponent
 from cryptobot.helpers import get_project_root, init_settings_component
@@ -23,9 +22,10 @@ from cryptobot.views import view_helper
 from cryptobot.views.view import View
 from tests.components.binance_api_adapter_mock import BinanceApiAdapterMock
 from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.components.binance_user_stream_adapter_mock import BinanceUserStreamAdapterMock
 from tests.components.telegram_http_transport_mock import TelegramHttpTransportMockComponent
 from tests.config import get_config
-from cryptobot.models import database_proxy
+from cryptobot.models import database_proxy, ReconnectPooledMySQLDatabase
 
 # Load .env from repo root (one level above /tests)
 ROOT = Path(__file__).resolve().parents[1]
@@ -160,13 +160,7 @@ def make_di(make_config) -> dict[str, Any]:
 
     default_vars = {}
 
-    db = MySQLDatabase(
-        config["db"]["name"], # database name
-        user = config["db"]["user"], # database username
-        password = config["db"]["pass"], # database password
-        host = config["db"]["host"],  # database host
-        port = config["db"]["port"]  # database port
-    )
+    db = ReconnectPooledMySQLDatabase.create(config["db"])
     database_proxy.initialize(db)
     if not db.connect():
         print(f'ERROR: Cannot connect to database {config["db"]["host"]}')
@@ -198,6 +192,7 @@ def make_di(make_config) -> dict[str, Any]:
         'config': config,
         'view': view,
         'plt': plt,
+        'chart_renderer': ChartRenderer.create(),
         'db': db,
         'service_component': ServiceComponent.create(
             db=db,
@@ -206,6 +201,7 @@ def make_di(make_config) -> dict[str, Any]:
             binance_gateway=binance_gateway,
         ),
         'settings_component': settings_component,
+        'binance_user_stream_adapter': BinanceUserStreamAdapterMock(),
     }
 
     init_settings_component(di['settings_component'])
@@ -0,0 +1,9 @@
+CREATE TABLE `trades_sync_cursors` (
+  `id` bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  `created_at` bigint(20) unsigned NOT NULL,
+  `updated_at` bigint(20) unsigned DEFAULT NULL,
+  `symbol` bigint(20) unsigned NOT NULL,
+  `from_id` bigint(20) unsigned NOT NULL DEFAULT 0,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `symbol` (`symbol`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
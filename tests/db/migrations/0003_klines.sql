@@ -0,0 +1,20 @@
+CREATE TABLE `klines` (
+  `id` bigint(20) unsigned NOT NULL AUTO_INCREMENT,
+  `created_at` bigint(20) unsigned NOT NULL,
+  `updated_at` bigint(20) unsigned DEFAULT NULL,
+  `binance_symbol` varchar(20) NOT NULL,
+  `interval` varchar(3) COLLATE utf8mb4_bin NOT NULL,
+  `open_time` bigint(20) unsigned NOT NULL,
+  `close_time` bigint(20) unsigned NOT NULL,
+  `open_price` decimal(24,8) NOT NULL,
+  `high_price` decimal(24,8) NOT NULL,
+  `low_price` decimal(24,8) NOT NULL,
+  `close_price` decimal(24,8) NOT NULL,
+  `volume` decimal(30,8) NOT NULL,
+  `quote_volume` decimal(30,8) NOT NULL,
+  `trades_count` bigint(20) unsigned NOT NULL DEFAULT 0,
+  `taker_buy_base_volume` decimal(30,8) NOT NULL,
+  `taker_buy_quote_volume` decimal(30,8) NOT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `binance_symbol_interval_open_time` (`binance_symbol`,`interval`,`open_time`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
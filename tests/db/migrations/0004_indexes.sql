@@ -0,0 +1,15 @@
+-- ShowOrdersCommand, CronUpdateTradesForPartiallyFilledOrdersCommand, ServiceComponent.get_open_db_orders_indexed: WHERE status (IN) ..., symbol
+ALTER TABLE `orders`
+  ADD KEY `status_symbol` (`status`,`symbol`);
+
+-- ServiceComponent.update_assets_from_binance_to_db: WHERE asset = ... AND free = ... AND locked = ... ORDER BY checked_at DESC LIMIT 1
+ALTER TABLE `balances`
+  ADD KEY `asset_free_locked_checked_at` (`asset`,`free`,`locked`,`checked_at`);
+
+-- trades of an order (Order.trades) and of a binance order
+ALTER TABLE `order_trades`
+  ADD KEY `order_id` (`order_id`),
+  ADD KEY `binance_order_id` (`binance_order_id`);
+
+ALTER TABLE `orders_filling_history`
+  ADD KEY `order_id_logged_at` (`order_id`,`logged_at`);
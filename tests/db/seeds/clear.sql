@@ -1,8 +1,10 @@
 SET FOREIGN_KEY_CHECKS=0;
 TRUNCATE TABLE balances;
 TRUNCATE TABLE cron_jobs;
+TRUNCATE TABLE klines;
 TRUNCATE TABLE order_trades;
 TRUNCATE TABLE orders;
 TRUNCATE TABLE orders_filling_history;
 TRUNCATE TABLE settings;
+TRUNCATE TABLE trades_sync_cursors;
 SET FOREIGN_KEY_CHECKS=1;
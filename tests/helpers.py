@@ -1,8 +1,9 @@
+from contextlib import contextmanager
 from decimal import Decimal
 
 from cryptobot.components import ServiceComponent
 from cryptobot.helpers import current_millis
-from cryptobot.models import CronJob
+from cryptobot.models import CronJob, database_proxy
 from tests.ports.telegram_http_transport_mock import TelegramHttpTransportComponentMockPort
 
 
@@ -41,4 +42,29 @@ def _prepare_cron_jobs_table(execute_cron_jobs=None) -> None:
         cron_job.last_executed_at = current_millis() + (1000 * 3600)
         if cron_job.name in execute_cron_jobs:
             cron_job.last_executed_at = 0
-        cron_job.save()
\ No newline at end of file
+        cron_job.save()
+
+class QueryCounter:
+    def __init__(self):
+        self.queries: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+@contextmanager
+def count_queries(db=None):
+    """Records the SQL of every query sent to db (the initialized database_proxy by default) within the block"""
+    db = db if db is not None else database_proxy.obj
+    counter = QueryCounter()
+    original_execute_sql = db.execute_sql
+
+    def execute_sql(sql, params=None, *args, **kwargs):
+        counter.queries.append(sql)
+        return original_execute_sql(sql, params, *args, **kwargs)
+
+    db.execute_sql = execute_sql
+    try:
+        yield counter
+    finally:
+        del db.execute_sql
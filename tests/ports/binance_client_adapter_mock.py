@@ -13,6 +13,8 @@ class BinanceClientAdapterMockPort(Protocol):
 
     def seed_asset_balance(self, asset_balance: dict[str, dict[str, str]]) -> None: ...
 
+    def seed_account_update_time(self, update_time: int | None) -> None: ...
+
     def seed_symbol_info(self, symbol_info: dict[str, Any]) -> None: ...
 
     def fake_change_order_status(self, binance_order_id: int, status: str) -> None: ...
@@ -0,0 +1,10 @@
+from typing import Protocol, runtime_checkable, Any
+
+@runtime_checkable
+class BinanceUserStreamAdapterMockPort(Protocol):
+
+    def clear(self) -> None: ...
+
+    def seed_events(self, events: list[dict[str, Any]], clear: bool = True) -> None: ...
+
+    def connects_count(self) -> int: ...
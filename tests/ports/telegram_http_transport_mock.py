@@ -11,3 +11,5 @@ class TelegramHttpTransportComponentMockPort(Protocol):
     def memory_length(self) -> int: ...
 
     def get_from_memory(self, index: int) -> TelegramMessageDataObject | None: ...
+
+    def seed_responses(self, responses: list[tuple[int, dict]]) -> None: ...
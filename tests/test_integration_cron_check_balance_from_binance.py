@@ -50,6 +50,8 @@ def test_integration_cron_check_balance_from_binance(db_session_conn, apply_seed
     for asset_binance in BalanceMapper.asset_mapping.keys():
         balances_count_1[asset_binance] = Balance.select().where(Balance.asset == BalanceMapper.map_asset(asset_binance)).count()
         assert balances_count_1[asset_binance] - balances_count_0[asset_binance] == 1
+    # one account snapshot for all the assets
+    assert binance_client_adapter.account_calls_count == 1
 
     # check balance again
     (CronCheckBalanceFromBinanceCommand()
@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from cryptobot.commands.cron_check_balance_from_binance import CronCheckBalanceFromBinanceCommand
+from cryptobot.commands.cron_do_orders_incremental_routine import CronDoOrdersIncrementalRoutineCommand
+from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
+from cryptobot.components import ServiceComponent
+from cryptobot.mappers.order_mapper import OrderMapper
+from cryptobot.models import Order
+from cryptobot.views.view import View
+from tests.components.binance_api_adapter_mock import BinanceApiAdapterMock
+from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.mocks.binance.asset_balance import get_mock_asset_balance
+from tests.mocks.binance.avg_price import get_mock_avg_price
+from tests.mocks.binance.orders import get_mock_orders
+from tests.mocks.binance.symbol_info import get_mock_symbol_info
+from tests.mocks.binance.trades import get_mock_trades
+
+
+@pytest.mark.integration
+
+def test_integration_cron_do_orders_incremental_routine(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    view: View = di['view']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+    binance_api_adapter: BinanceApiAdapterMock = sc.binance_gateway.binance_api_adapter
+
+    binance_client_adapter.seed_asset_balance(get_mock_asset_balance())
+    binance_client_adapter.seed_avg_price(get_mock_avg_price())
+    mock_symbol_info: dict[str, Any] = get_mock_symbol_info()
+    binance_client_adapter.seed_symbol_info(mock_symbol_info)
+    binance_api_adapter.seed_my_trades(my_trades=get_mock_trades())
+    binance_client_adapter.seed_orders(get_mock_orders())
+
+    chat_id: int = 112233
+
+    CronCheckBalanceFromBinanceCommand().set_payload(chat_id,).set_deps(sc, view).execute()
+    # full reconciliation once
+    CronDoOrdersUpdatingRoutineCommand().set_payload(chat_id,).set_deps(sc, view).execute()
+
+    open_db_orders: dict[int, Order] = sc.get_open_db_orders_indexed()
+    assert len(open_db_orders) > 0
+    for db_order in open_db_orders.values():
+        assert db_order.status in OrderMapper.OPEN_STATUSES
+
+    # nothing has changed on binance
+    db_orders_count: int = Order.select().count()
+    CronDoOrdersIncrementalRoutineCommand().set_payload(chat_id,).set_deps(sc, view).execute()
+    assert Order.select().count() == db_orders_count
+
+    # id=32, symbol=ETHUSDT, side=BUY, status: NEW -> CANCELLED - it disappears from the open orders
+    id: int = 32
+    db_order: Order = Order.get_by_id(id)
+    assert db_order.binance_order_id in open_db_orders
+    binance_client_adapter.fake_change_order_status(binance_order_id=db_order.binance_order_id, status='CANCELED')
+
+    # the order placed on binance directly (not by the bot) - newer than everything in db
+    new_binance_order: dict[str, Any] = binance_client_adapter.create_order(
+        symbol='ETHUSDT',
+        side='BUY',
+        type='LIMIT',
+        timeInForce='GTC',
+        quantity='0.00100000',
+        price='3000.00000000',
+    )
+
+    CronDoOrdersIncrementalRoutineCommand().set_payload(chat_id,).set_deps(sc, view).execute()
+
+    assert Order.get_by_id(id).status == OrderMapper.STATUS_CANCELED
+    assert db_order.binance_order_id not in sc.get_open_db_orders_indexed()
+
+    db_order_new: Order = Order.get(Order.binance_order_id == new_binance_order['orderId'])
+    assert db_order_new.status == OrderMapper.STATUS_NEW
+    assert db_order_new.side == OrderMapper.SIDE_BUY
+    assert Order.select().count() == db_orders_count + 1
+
+    assert sc.get_max_db_binance_order_ids_by_symbols() == {'ETHUSDT': new_binance_order['orderId']}
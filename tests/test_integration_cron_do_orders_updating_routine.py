@@ -6,6 +6,7 @@ import pytest
 from cryptobot.commands.cron_check_balance_from_binance import CronCheckBalanceFromBinanceCommand
 from cryptobot.commands.cron_do_orders_updating_routine import CronDoOrdersUpdatingRoutineCommand
 from cryptobot.components import ServiceComponent
+from cryptobot.helpers import current_millis
 from cryptobot.mappers.balance_mapper import BalanceMapper
 from cryptobot.mappers.order_mapper import OrderMapper
 from cryptobot.models import Order, Balance
@@ -158,4 +159,43 @@ def test_integration_cron_do_orders_updating_routine(db_session_conn, apply_seed
     assert db_order_new.side == OrderMapper.SIDE_SELL
     assert db_order_new.trades_checked == 0
     assert db_order_new.order_price == _get_new_safe_price(sc, 'ETHUSDT', 'SELL', db_order_after.order_price, Decimal(5))
-    assert db_order_new.client_order_id.startswith('x-')
\ No newline at end of file
+    assert db_order_new.client_order_id.startswith('x-')
+
+
+@pytest.mark.integration
+def test_integration_cron_do_orders_updating_routine_handles_fill_once(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    view: View = di['view']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+    binance_api_adapter: BinanceApiAdapterMock = sc.binance_gateway.binance_api_adapter
+
+    binance_client_adapter.seed_asset_balance(get_mock_asset_balance())
+    binance_client_adapter.seed_avg_price(get_mock_avg_price())
+    binance_client_adapter.seed_symbol_info(get_mock_symbol_info())
+    binance_api_adapter.seed_my_trades(my_trades=get_mock_trades())
+    binance_client_adapter.seed_orders(get_mock_orders())
+
+    chat_id: int = 112233
+
+    CronCheckBalanceFromBinanceCommand().set_payload(chat_id,).set_deps(sc, view).execute()
+    routine = CronDoOrdersUpdatingRoutineCommand().set_payload(chat_id,).set_deps(sc, view)
+    routine.execute()
+
+    # id=30, symbol=ETHUSDT, side=SELL, status: NEW -> FILLED
+    stale_db_order: Order = Order.get_by_id(30)
+    binance_client_adapter.fake_change_order_status(binance_order_id=stale_db_order.binance_order_id, status='FILLED')
+    binance_order: dict[str, Any] = binance_client_adapter.get_order(orderId=stale_db_order.binance_order_id, symbol='ETHUSDT')
+    binance_orders_count_before: int = len(binance_client_adapter.memory_orders['ETHUSDT'])
+
+    # the user stream event and a cron tick see the same NEW -> FILLED with the same stale db order
+    routine.proc_handle_binance_order(binance_order=binance_order, db_order=stale_db_order, millis_on_start=current_millis())
+    routine.proc_handle_binance_order(binance_order=binance_order, db_order=stale_db_order, millis_on_start=current_millis())
+
+    # exactly one follow-up order is placed for the fill
+    assert len(binance_client_adapter.memory_orders['ETHUSDT']) == binance_orders_count_before + 1
+    db_order_after: Order = Order.get_by_id(30)
+    assert db_order_after.status == OrderMapper.STATUS_FILLED
+    assert db_order_after.trades_checked == 1
+    assert db_order_after.executed_quantity == stale_db_order.original_quantity
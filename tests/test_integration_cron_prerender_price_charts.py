@@ -0,0 +1,80 @@
+from typing import Any
+
+import pytest
+
+from cryptobot.commands import ShowPriceChartCommand
+from cryptobot.commands.cron_prerender_price_charts import CronPrerenderPriceChartsCommand
+from cryptobot.commands.show_price_chart_options import PRICE_CHART_PRESETS
+from cryptobot.components import ServiceComponent, ChartCache
+from cryptobot.views.view import View
+from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.mocks.binance.avg_price import get_mock_avg_price
+from tests.mocks.binance.historical_klines import get_mock_historical_klines
+from tests.mocks.binance.orders import get_mock_orders
+from tests.ports.telegram_http_transport_mock import TelegramHttpTransportComponentMockPort
+
+
+class ChartCacheSpy(ChartCache):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.puts_count: int = 0
+
+    def put(self, key: str, png: bytes) -> None:
+        self.puts_count += 1
+        super().put(key, png)
+
+@pytest.mark.integration
+
+def test_integration_cron_prerender_price_charts(db_session_conn, apply_seed_fixture, make_config, make_di, tmp_path):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    view: View = di['view']
+    tlg_transport: TelegramHttpTransportComponentMockPort = sc.telegram_component.telegram_http_transport_component
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+
+    # the dispatcher gives periods with spaces
+    mock_historical_klines: dict[str, list[list[Any]]] = {}
+    for key, klines in get_mock_historical_klines().items():
+        mock_historical_klines[key.replace('_', ' ')] = klines
+    binance_client_adapter.seed_historical_klines(mock_historical_klines)
+    binance_client_adapter.seed_avg_price(get_mock_avg_price())
+    binance_client_adapter.seed_orders(get_mock_orders())
+
+    chat_id: int = 112233
+
+    # without CHART_CACHE_DIR the charts would be rendered into the memory of the cron process only
+    chart_cache = ChartCacheSpy(max_items=64, ttl_seconds=600)
+    sc.chart_cache = chart_cache
+    assert not CronPrerenderPriceChartsCommand().set_payload(chat_id).set_deps(sc, view, di['chart_renderer']).execute()
+    assert chart_cache.puts_count == 0
+
+    chart_cache = ChartCacheSpy(max_items=64, ttl_seconds=600, cache_dir=str(tmp_path))
+    sc.chart_cache = chart_cache
+
+    assert sc.get_db_binance_symbols() == ['ETHUSDT']
+
+    assert CronPrerenderPriceChartsCommand().set_payload(chat_id).set_deps(sc, view, di['chart_renderer']).execute()
+    assert chart_cache.puts_count == len(PRICE_CHART_PRESETS)
+    # nothing is sent by the pre-rendering
+    assert tlg_transport.memory_length() == 0
+
+    # every preset is sent from the cache, nothing is rendered (there is no chart renderer at all)
+    for period, interval in PRICE_CHART_PRESETS:
+        command = (ShowPriceChartCommand()
+                   .set_payload('ETHUSDT', period.replace('_', ' '), interval, chat_id)
+                   .set_deps(sc, view, None))
+        assert command.execute()
+    assert tlg_transport.memory_length() == len(PRICE_CHART_PRESETS)
+    assert chart_cache.puts_count == len(PRICE_CHART_PRESETS)
+
+    # nothing has changed - nothing is rendered
+    CronPrerenderPriceChartsCommand().set_payload(chat_id).set_deps(sc, view, di['chart_renderer']).execute()
+    assert chart_cache.puts_count == len(PRICE_CHART_PRESETS)
+
+    # the open orders have changed - the overlay of every chart is outdated
+    open_order_id: int = [order for order in get_mock_orders() if order['status'] == 'NEW'][0]['orderId']
+    binance_client_adapter.seed_orders([order for order in get_mock_orders() if order['orderId'] != open_order_id])
+    CronPrerenderPriceChartsCommand().set_payload(chat_id).set_deps(sc, view, di['chart_renderer']).execute()
+    assert chart_cache.puts_count == 2 * len(PRICE_CHART_PRESETS)
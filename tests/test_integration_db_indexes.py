@@ -0,0 +1,89 @@
+import pytest
+
+from cryptobot.mappers.balance_mapper import BalanceMapper
+from cryptobot.mappers.order_mapper import OrderMapper
+
+ROWS_COUNT = 2000
+
+
+def _func_get_status(i: int) -> int:
+    # like in real life: a few open orders among the filled and canceled ones
+    if i % 50 == 0:
+        return OrderMapper.OPEN_STATUSES[(i // 50) % len(OrderMapper.OPEN_STATUSES)]
+    return OrderMapper.STATUS_FILLED if i % 3 else OrderMapper.STATUS_CANCELED
+
+def _fill_tables(db_session_conn):
+    # enough rows of different values, so the optimizer prefers the indexes to a full scan
+    cur = db_session_conn.cursor()
+    cur.executemany(
+        "INSERT INTO orders (binance_order_id, created_at, symbol, status, order_price, original_quantity, executed_quantity, cummulative_quote_quantity) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+        [(1000 + i, i, 1 + i % 3, _func_get_status(i), '1000', '1', '0', '0') for i in range(ROWS_COUNT)],
+    )
+    cur.executemany(
+        "INSERT INTO balances (created_at, checked_at, asset, free, locked) VALUES (%s, %s, %s, %s, %s)",
+        [(i, i, 1 + i % 2, f'{i}.5', '0') for i in range(ROWS_COUNT)],
+    )
+    cur.executemany(
+        "INSERT INTO order_trades (binance_id, created_at, order_id, binance_order_id, symbol, price, quantity, quote_quantity, commission, commission_asset_char, binance_time, is_buyer, is_maker, is_best_match) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
+        [(5000 + i, i, 1 + i, 1000 + i, 1, '1000', '1', '1000', '0', 'BNB', i, 1, 0, 1) for i in range(ROWS_COUNT)],
+    )
+    cur.executemany(
+        "INSERT INTO orders_filling_history (created_at, logged_at, order_id, status, original_quantity, executed_quantity) VALUES (%s, %s, %s, %s, %s, %s)",
+        [(i, i, 1 + i, 1, '1', '0') for i in range(ROWS_COUNT)],
+    )
+    cur.execute("ANALYZE TABLE orders, balances, order_trades, orders_filling_history")
+    cur.fetchall()
+    db_session_conn.commit()
+    cur.close()
+
+def _explain_key(db_session_conn, sql: str, params: tuple = ()) -> str | None:
+    cur = db_session_conn.cursor(dictionary=True)
+    cur.execute("EXPLAIN " + sql, params)
+    row = cur.fetchone()
+    cur.fetchall()
+    cur.close()
+    return row['key']
+
+@pytest.mark.integration
+
+def test_integration_db_indexes_are_used(db_session_conn, apply_seed_fixture):
+    _fill_tables(db_session_conn)
+
+    # ShowOrdersCommand / get_open_db_orders_indexed
+    assert _explain_key(
+        db_session_conn,
+        f"SELECT * FROM orders WHERE status IN ({', '.join(['%s'] * len(OrderMapper.OPEN_STATUSES))})",
+        tuple(OrderMapper.OPEN_STATUSES),
+    ) == 'status_symbol'
+    # CronUpdateTradesForPartiallyFilledOrdersCommand
+    assert _explain_key(
+        db_session_conn,
+        "SELECT * FROM orders WHERE status = %s",
+        (OrderMapper.STATUS_PARTIALLY_FILLED,),
+    ) == 'status_symbol'
+
+    # update_assets_from_binance_to_db
+    assert _explain_key(
+        db_session_conn,
+        "SELECT * FROM balances WHERE asset = %s AND free = %s AND locked = %s ORDER BY checked_at DESC LIMIT 1",
+        (BalanceMapper.ASSET_ETH, '11.5', '0'),
+    ) == 'asset_free_locked_checked_at'
+
+    assert _explain_key(
+        db_session_conn,
+        "SELECT * FROM order_trades WHERE binance_order_id = %s",
+        (1010,),
+    ) == 'binance_order_id'
+    assert _explain_key(
+        db_session_conn,
+        "SELECT * FROM order_trades WHERE order_id = %s",
+        (11,),
+    ) == 'order_id'
+
+    assert _explain_key(
+        db_session_conn,
+        "SELECT * FROM orders_filling_history WHERE order_id = %s ORDER BY logged_at",
+        (11,),
+    ) == 'order_id_logged_at'
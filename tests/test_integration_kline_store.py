@@ -0,0 +1,56 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from cryptobot.components import ServiceComponent, KlineStore
+from cryptobot.models import Kline
+from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.mocks.binance.historical_klines import get_mock_historical_klines
+
+
+@pytest.mark.integration
+
+def test_integration_kline_store(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+    kline_store = KlineStore.create(binance_gateway=sc.binance_gateway, db=di['db'])
+
+    mock_klines: list[list[Any]] = get_mock_historical_klines()['ETHUSDT:3_days_ago_UTC:1h']
+    start_millis: int = mock_klines[0][0]
+
+    # only the first day is known to binance yet
+    binance_client_adapter.seed_historical_klines({'ETHUSDT:3_days_ago_UTC:1h': mock_klines[:24]})
+    klines: list = kline_store.get_historical_klines('ETHUSDT', start_millis, '1h')
+
+    assert [kline[0] for kline in klines] == [kline[0] for kline in mock_klines[:24]]
+    # nothing stored yet - the whole range is fetched (with one candle to look back)
+    assert binance_client_adapter.historical_klines_calls[-1]['start_str'] == start_millis - 3600 * 1000
+    assert Kline.select().where((Kline.binance_symbol == 'ETHUSDT') & (Kline.interval == '1h')).count() == 24
+
+    # the rest of the candles are closed - only the tail is fetched
+    binance_client_adapter.seed_historical_klines({'ETHUSDT:3_days_ago_UTC:1h': mock_klines})
+    klines = kline_store.get_historical_klines('ETHUSDT', start_millis, '1h')
+
+    assert binance_client_adapter.historical_klines_calls[-1]['start_str'] == mock_klines[23][6] + 1
+    assert [kline[0] for kline in klines] == [kline[0] for kline in mock_klines]
+    for kline, mock_kline in zip(klines, mock_klines):
+        for i in [1, 2, 3, 4, 5]:
+            assert Decimal(kline[i]) == Decimal(mock_kline[i])
+        assert kline[6] == mock_kline[6]
+    assert Kline.select().where((Kline.binance_symbol == 'ETHUSDT') & (Kline.interval == '1h')).count() == len(mock_klines)
+
+    # '1m' and '1M' candles are not mixed up
+    assert Kline.select().where((Kline.binance_symbol == 'ETHUSDT') & (Kline.interval == '1H')).count() == 0
+
+    # served from the store through ServiceComponent, the range starts inside the first candle
+    calls_count: int = len(binance_client_adapter.historical_klines_calls)
+    sc.kline_store = kline_store
+    klines_mapped: list = sc.get_historical_klines('ETHUSDT', start_millis + 1, '1h')
+
+    assert len(klines_mapped) == len(mock_klines) - 1
+    assert klines_mapped[0]['open_time'] == round(mock_klines[1][0] / 1000)
+    assert len(binance_client_adapter.historical_klines_calls) == calls_count + 1
+    assert binance_client_adapter.historical_klines_calls[-1]['start_str'] == mock_klines[-1][6] + 1
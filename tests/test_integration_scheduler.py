@@ -0,0 +1,51 @@
+import pytest
+
+from cryptobot.commands import SchedulerCommand
+from cryptobot.components import ServiceComponent
+from cryptobot.helpers import current_millis
+from cryptobot.models import CronJob
+from cryptobot.views.view import View
+from tests.helpers import _prepare_cron_jobs_table
+from tests.ports.telegram_http_transport_mock import TelegramHttpTransportComponentMockPort
+
+
+@pytest.mark.integration
+
+def test_integration_scheduler(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    view: View = di['view']
+    tlg_transport: TelegramHttpTransportComponentMockPort = sc.telegram_component.telegram_http_transport_component
+
+    _prepare_cron_jobs_table(['notify-working'])
+
+    chat_id: int = 112233
+
+    millis_before: int = current_millis()
+
+    scheduler = (SchedulerCommand()
+                 .set_payload(chat_id, tick_seconds=0.1, max_ticks=1)
+                 .set_deps(sc, view))
+    assert scheduler.execute()
+
+    # only the due job has been fired
+    assert tlg_transport.memory_length() == 1
+    assert 'Up & running...' in tlg_transport.get_from_memory(index=0).data.get('text', '')
+
+    cron_job: CronJob = CronJob.get(CronJob.name == 'notify-working')
+    assert cron_job.last_executed_at >= millis_before
+
+    # the same scheduler keeps running - the job is not due anymore
+    tlg_transport.clear()
+    assert scheduler.proc_tick(current_millis()) == 0
+    assert tlg_transport.memory_length() == 0
+
+    # the nearest due job is far away, so the scheduler sleeps the whole tick
+    assert scheduler.func_get_sleep_seconds(current_millis()) == 0.1
+
+    # sub-minute interval: due again as soon as the interval has passed
+    cron_job.execution_interval_seconds = 1
+    assert cron_job.save()
+    assert scheduler.proc_tick(cron_job.last_executed_at + 1000) == 1
+    assert tlg_transport.memory_length() == 1
@@ -0,0 +1,43 @@
+import pytest
+
+from cryptobot.components.settings import SettingsComponent
+from cryptobot.helpers import current_millis
+from cryptobot.models import Setting
+
+
+@pytest.mark.integration
+
+def test_integration_settings_snapshot(db_session_conn, apply_seed_fixture, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    settings_component = SettingsComponent.create(di['db'])
+
+    assert settings_component.get('autocreate_buy_order') is True
+    assert settings_component.get('unknown', 'default') == 'default'
+    # the filter of get_many() is applied
+    assert settings_component.get_many(['autocreate_sell_order']) == {'autocreate_sell_order': True}
+    assert settings_component.get_many() == {'autocreate_buy_order': True, 'autocreate_sell_order': True}
+
+    # changed by another process
+    Setting.update(the_value='false', updated_at=current_millis() + 1).where(Setting.the_key == 'autocreate_sell_order').execute()
+    assert settings_component.get('autocreate_sell_order') is False
+
+    settings_component.set('autocreate_buy_order', False)
+    assert settings_component.get('autocreate_buy_order') is False
+    assert Setting.get(Setting.the_key == 'autocreate_buy_order').the_value == 'false'
+
+
+@pytest.mark.integration
+def test_integration_settings_snapshot_refresh_interval(db_session_conn, apply_seed_fixture, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    settings_component = SettingsComponent.create(di['db'], {'refresh_interval_seconds': 3600})
+
+    assert settings_component.get('autocreate_sell_order') is True
+
+    Setting.update(the_value='false', updated_at=current_millis() + 1).where(Setting.the_key == 'autocreate_sell_order').execute()
+    # served from the snapshot, no query until the interval passes
+    assert settings_component.get('autocreate_sell_order') is True
+
+    settings_component.proc_invalidate()
+    assert settings_component.get('autocreate_sell_order') is False
@@ -4,7 +4,7 @@ from typing import Any
 import pytest
 
 from cryptobot.commands import ShowPriceChartCommand
-from cryptobot.components import ServiceComponent
+from cryptobot.components import ServiceComponent, ChartCache
 from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
 from tests.components.telegram_http_transport_mock import TelegramMessageDataObject
 from tests.mocks.binance.avg_price import get_mock_avg_price
@@ -52,7 +52,7 @@ def test_integration_show_price_chart(db_session_conn, apply_seed_fixture, make_
 
             command = (ShowPriceChartCommand()
                        .set_payload(binance_symbol, period, interval, chat_id)
-                       .set_deps(sc, di['view'], di['plt'])
+                       .set_deps(sc, di['view'], di['chart_renderer'])
                        )
             command.execute()
 
@@ -69,4 +69,51 @@ def test_integration_show_price_chart(db_session_conn, apply_seed_fixture, make_
             assert len(msg.files['photo']) == 3
             assert msg.files['photo'][0] == f'{binance_symbol.lower()}-price-history-since-{period.replace('_', '-').lower()}-interval-{interval.lower()}.png'
             assert type(msg.files['photo'][1]) == _io.BytesIO
-            assert msg.files['photo'][2] == 'image/png'
\ No newline at end of file
+            assert msg.files['photo'][2] == 'image/png'
+
+
+@pytest.mark.integration
+def test_integration_show_price_chart_cached(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    tlg_transport: TelegramHttpTransportComponentMockPort = sc.telegram_component.telegram_http_transport_component
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+
+    binance_client_adapter.seed_historical_klines(get_mock_historical_klines())
+    binance_client_adapter.seed_avg_price(get_mock_avg_price())
+    binance_client_adapter.seed_orders(get_mock_orders())
+    sc.chart_cache = ChartCache(max_items=16, ttl_seconds=60)
+
+    chat_id: int = 112233
+    command = (ShowPriceChartCommand()
+               .set_payload('ETHUSDT', '1_hour_ago_UTC', '1m', chat_id)
+               .set_deps(sc, di['view'], di['chart_renderer'])
+               )
+    command.execute()
+
+    # the same chart again - sent from the cache, matplotlib is not touched
+    command = (ShowPriceChartCommand()
+               .set_payload('ETHUSDT', '1_hour_ago_UTC', '1m', chat_id)
+               .set_deps(sc, di['view'], None)
+               )
+    assert command.execute()
+
+    assert tlg_transport.memory_length() == 2
+    first_msg: TelegramMessageDataObject = tlg_transport.get_from_memory(index=0)
+    second_msg: TelegramMessageDataObject = tlg_transport.get_from_memory(index=1)
+    assert second_msg.data.get('caption', '') == first_msg.data.get('caption', '')
+    assert second_msg.files['photo'][1].getvalue() == first_msg.files['photo'][1].getvalue()
+
+    # the open orders have changed - rendered again
+    open_order_id: int = [order for order in get_mock_orders() if order['status'] == 'NEW'][0]['orderId']
+    binance_client_adapter.seed_orders([order for order in get_mock_orders() if order['orderId'] != open_order_id])
+    command = (ShowPriceChartCommand()
+               .set_payload('ETHUSDT', '1_hour_ago_UTC', '1m', chat_id)
+               .set_deps(sc, di['view'], di['chart_renderer'])
+               )
+    assert command.execute()
+
+    assert tlg_transport.memory_length() == 3
+    third_msg: TelegramMessageDataObject = tlg_transport.get_from_memory(index=2)
+    assert third_msg.files['photo'][1].getvalue() != first_msg.files['photo'][1].getvalue()
@@ -0,0 +1,149 @@
+from decimal import Decimal
+
+import pytest
+
+from cryptobot.components import ServiceComponent
+from cryptobot.helpers import current_millis
+from cryptobot.mappers.order_mapper import OrderMapper
+from cryptobot.models import Order, OrderTrade, TradesSyncCursor
+from tests.components.binance_api_adapter_mock import BinanceApiAdapterMock
+from tests.helpers import count_queries
+from tests.mocks.binance.trades import get_mock_trades
+
+
+def _get_mock_trade(id: int, binance_order_id: int, price: Decimal, qty: str) -> dict:
+    return {
+        'commission': '0.00000000',
+        'commissionAsset': 'USDT',
+        'id': id,
+        'isBestMatch': True,
+        'isBuyer': False,
+        'isMaker': True,
+        'orderId': binance_order_id,
+        'orderListId': -1,
+        'price': f"{price:.8f}",
+        'qty': qty,
+        'quoteQty': f"{price * Decimal(qty):.8f}",
+        'symbol': 'ETHUSDT',
+        'time': current_millis(),
+    }
+
+@pytest.mark.integration
+
+def test_integration_trades_sync_cursor(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    binance_api_adapter: BinanceApiAdapterMock = sc.binance_gateway.binance_api_adapter
+
+    mock_trades: dict[str, list[dict[str, str|int|bool]]] = get_mock_trades()
+    binance_api_adapter.seed_my_trades(my_trades=mock_trades)
+
+    db_order: Order = Order.get_by_id(31)
+
+    # first sync loads the whole history and remembers where it stopped
+    sc.update_trades_from_binance_to_db(order_ids=[db_order.id])
+    cursor: TradesSyncCursor = TradesSyncCursor.get(TradesSyncCursor.symbol == OrderMapper.SYMBOL_ETHUSDT)
+    assert cursor.from_id == max([int(trade['id']) for trade in mock_trades['ETHUSDT']]) + 1
+
+    # nothing new on binance
+    assert sc.update_trades_from_binance_to_db(order_ids=[db_order.id]) == {'inserted': 0, 'updated': 0}
+    assert TradesSyncCursor.get_by_id(cursor.id).from_id == cursor.from_id
+
+    # the only new trade is loaded
+    new_trade_id: int = cursor.from_id + 10
+    mock_trades['ETHUSDT'].append(_get_mock_trade(new_trade_id, db_order.binance_order_id, db_order.order_price, '0.00080000'))
+    binance_api_adapter.seed_my_trades(my_trades=mock_trades)
+    assert sc.update_trades_from_binance_to_db(order_ids=[db_order.id]) == {'inserted': 1, 'updated': 0}
+    assert OrderTrade.select().where(OrderTrade.binance_id == new_trade_id).count() == 1
+    assert TradesSyncCursor.get_by_id(cursor.id).from_id == new_trade_id + 1
+
+    # fresh trade of an order which is not in db yet holds the cursor, trades of known orders are still loaded
+    unknown_trade_id: int = new_trade_id + 10
+    known_trade_id: int = new_trade_id + 20
+    mock_trades['ETHUSDT'].append(_get_mock_trade(unknown_trade_id, 1, db_order.order_price, '0.00100000'))
+    mock_trades['ETHUSDT'].append(_get_mock_trade(known_trade_id, db_order.binance_order_id, db_order.order_price, '0.00340000'))
+    binance_api_adapter.seed_my_trades(my_trades=mock_trades)
+    assert sc.update_trades_from_binance_to_db(order_ids=[db_order.id]) == {'inserted': 1, 'updated': 0}
+    assert OrderTrade.select().where(OrderTrade.binance_id == known_trade_id).count() == 1
+    assert OrderTrade.select().where(OrderTrade.binance_id == unknown_trade_id).count() == 0
+    assert TradesSyncCursor.get_by_id(cursor.id).from_id == unknown_trade_id
+
+@pytest.mark.integration
+
+def test_integration_trades_bulk_upsert(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+
+    db_order: Order = Order.get_by_id(31)
+    trades_before: int = OrderTrade.select().count()
+
+    first_id: int = 10 ** 12
+    trades: list[dict] = [
+        _get_mock_trade(first_id + i, db_order.binance_order_id, db_order.order_price, '0.00010000')
+        for i in range(1200) # more than one chunk
+    ]
+    assert sc.upsert_binance_trades(trades) == {'inserted': 1200, 'updated': 0}
+    assert OrderTrade.select().count() == trades_before + 1200
+    assert OrderTrade.get(OrderTrade.binance_id == first_id).order_id == db_order.id
+
+    # the same trades again (+ a new one and one of an unknown order) - existed rows are updated, not duplicated
+    trades[0]['commission'] = '0.00000100'
+    trades.append(_get_mock_trade(first_id + 1200, db_order.binance_order_id, db_order.order_price, '0.00010000'))
+    trades.append(_get_mock_trade(first_id + 1201, 1, db_order.order_price, '0.00010000'))
+    assert sc.upsert_binance_trades(trades) == {'inserted': 1, 'updated': 1200}
+    assert OrderTrade.select().count() == trades_before + 1201
+    db_order_trade: OrderTrade = OrderTrade.get(OrderTrade.binance_id == first_id)
+    assert Decimal(db_order_trade.commission) == Decimal('0.00000100')
+    assert db_order_trade.updated_at is not None
+
+    assert sc.upsert_binance_trades([]) == {'inserted': 0, 'updated': 0}
+
+@pytest.mark.integration
+
+def test_integration_trades_batch_validation(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+
+    db_order: Order = Order.get_by_id(31)
+
+    # the known orders of the whole batch are taken by one `IN (...)` query
+    with count_queries() as counter:
+        known_binance_order_ids: set[int] = OrderTrade.get_known_binance_order_ids([db_order.binance_order_id, 1, db_order.binance_order_id])
+    assert known_binance_order_ids == {db_order.binance_order_id}
+    assert counter.count == 1
+    assert ' IN (' in counter.queries[0]
+
+    # validation against the known ids does not touch db
+    with count_queries() as counter:
+        db_order_trade = (OrderTrade()
+                          .fill_from_binance(_get_mock_trade(1, db_order.binance_order_id, db_order.order_price, '0.00010000'))
+                          .set_known_binance_order_ids(known_binance_order_ids))
+        assert db_order_trade.validate()
+        db_order_trade = (OrderTrade()
+                          .fill_from_binance(_get_mock_trade(2, 1, db_order.order_price, '0.00010000'))
+                          .set_known_binance_order_ids(known_binance_order_ids))
+        assert not db_order_trade.validate()
+        assert 'binance_order_id' in db_order_trade.get_validation_errors()
+    assert counter.count == 0
+
+    # the number of queries of the bulk upsert does not depend on the number of trades (within one chunk)
+    first_id: int = 10 ** 12
+    with count_queries() as counter_few:
+        sc.upsert_binance_trades([
+            _get_mock_trade(first_id + i, db_order.binance_order_id, db_order.order_price, '0.00010000')
+            for i in range(5)
+        ])
+    with count_queries() as counter_many:
+        sc.upsert_binance_trades([
+            _get_mock_trade(first_id + 100 + i, db_order.binance_order_id, db_order.order_price, '0.00010000')
+            for i in range(400)
+        ])
+    assert counter_few.count > 0
+    assert counter_few.count == counter_many.count
+    # the parent orders of all the 400 trades are taken by one `IN (...)` query
+    orders_queries: list[str] = [query for query in counter_many.queries if 'FROM `orders`' in query]
+    assert len(orders_queries) == 1
+    assert ' IN (' in orders_queries[0]
@@ -0,0 +1,155 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from cryptobot.commands import UserStreamCommand
+from cryptobot.components import ServiceComponent
+from cryptobot.helpers import current_millis
+from cryptobot.mappers.balance_mapper import BalanceMapper
+from cryptobot.mappers.order_mapper import OrderMapper
+from cryptobot.models import Order, Balance
+from cryptobot.views.view import View
+from tests.components.binance_api_adapter_mock import BinanceApiAdapterMock
+from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.components.binance_user_stream_adapter_mock import BinanceUserStreamAdapterMock
+from tests.mocks.binance.asset_balance import get_mock_asset_balance
+from tests.mocks.binance.avg_price import get_mock_avg_price
+from tests.mocks.binance.orders import get_mock_orders
+from tests.mocks.binance.symbol_info import get_mock_symbol_info
+from tests.mocks.binance.trades import get_mock_trades
+from tests.ports.telegram_http_transport_mock import TelegramHttpTransportComponentMockPort
+
+
+def _get_execution_report(order: dict[str, Any], execution_type: str) -> dict[str, Any]:
+    return {
+        'e': 'executionReport',
+        'E': current_millis(),
+        's': order['symbol'],
+        'c': order['clientOrderId'],
+        'S': order['side'],
+        'o': order['type'],
+        'f': order['timeInForce'],
+        'q': order['origQty'],
+        'p': order['price'],
+        'P': order['stopPrice'],
+        'F': order['icebergQty'],
+        'g': order['orderListId'],
+        'C': '',
+        'x': execution_type,
+        'X': order['status'],
+        'r': 'NONE',
+        'i': order['orderId'],
+        'z': order['executedQty'],
+        'Z': order['cummulativeQuoteQty'],
+        'T': current_millis(),
+        'O': order['time'],
+        'w': False,
+        'W': order['workingTime'],
+        'Q': order['origQuoteOrderQty'],
+        'V': order['selfTradePreventionMode'],
+    }
+
+def _get_account_position(asset_balance: dict[str, dict[str, str]]) -> dict[str, Any]:
+    return {
+        'e': 'outboundAccountPosition',
+        'E': current_millis(),
+        'u': current_millis(),
+        'B': [
+            {'a': balance['asset'], 'f': balance['free'], 'l': balance['locked']}
+            for balance in asset_balance.values()
+        ] + [{'a': 'BNB', 'f': '1.00000000', 'l': '0.00000000'}],
+    }
+
+@pytest.mark.integration
+
+def test_integration_user_stream(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    view: View = di['view']
+    tlg_transport: TelegramHttpTransportComponentMockPort = sc.telegram_component.telegram_http_transport_component
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+    binance_api_adapter: BinanceApiAdapterMock = sc.binance_gateway.binance_api_adapter
+    binance_user_stream_adapter: BinanceUserStreamAdapterMock = di['binance_user_stream_adapter']
+
+    mock_asset_balance: dict[str, dict[str, str]] = get_mock_asset_balance()
+    binance_client_adapter.seed_asset_balance(mock_asset_balance)
+    binance_client_adapter.seed_avg_price(get_mock_avg_price())
+    binance_client_adapter.seed_symbol_info(get_mock_symbol_info())
+    binance_api_adapter.seed_my_trades(my_trades=get_mock_trades())
+    mock_orders: list[dict[str, Any]] = get_mock_orders()
+    binance_client_adapter.seed_orders(mock_orders)
+
+    chat_id: int = 112233
+
+    command = (UserStreamCommand()
+               .set_payload(chat_id)
+               .set_deps(sc, view, binance_user_stream_adapter)
+               )
+
+    # connection only - reconciliation with the polling routine
+    assert command.execute()
+    assert binance_user_stream_adapter.connects_count() == 1
+    tlg_transport.clear()
+
+    # id=30, symbol=ETHUSDT, side=SELL, status: NEW -> PARTIALLY_FILLED (known from the stream only:
+    # the REST state stays NEW, the reconciliation on connect changes nothing)
+    id: int = 30
+    db_order: Order = Order.get_by_id(id)
+    event_order: dict[str, Any] = dict(binance_client_adapter.get_order(orderId=db_order.binance_order_id, symbol='ETHUSDT'))
+    event_executed_quantity: Decimal = Decimal(event_order['origQty']) / 2
+    event_order['status'] = 'PARTIALLY_FILLED'
+    event_order['executedQty'] = f"{event_executed_quantity:.8f}"
+    event_order['cummulativeQuoteQty'] = f"{event_executed_quantity * Decimal(event_order['price']):.8f}"
+
+    # the balances of the event differ from the REST ones
+    event_asset_balance: dict[str, dict[str, str]] = {
+        asset: {
+            'asset': balance['asset'],
+            'free': f"{Decimal(balance['free']) + Decimal('1.5'):.8f}",
+            'locked': f"{Decimal(balance['locked']) + Decimal('0.25'):.8f}",
+        }
+        for asset, balance in mock_asset_balance.items()
+    }
+
+    binance_user_stream_adapter.seed_events([
+        _get_execution_report(event_order, 'TRADE'),
+        {'e': 'listStatus', 'E': current_millis()}, # not handled, ignored
+        _get_account_position(event_asset_balance),
+    ])
+    account_calls_count: int = binance_client_adapter.account_calls_count
+    assert command.execute()
+    # the balances are taken from the event, not from a REST account snapshot
+    assert binance_client_adapter.account_calls_count == account_calls_count
+
+    assert binance_client_adapter.get_order(orderId=db_order.binance_order_id, symbol='ETHUSDT')['status'] == 'NEW'
+    db_order_after: Order = Order.get_by_id(id)
+    assert db_order_after.status == OrderMapper.STATUS_PARTIALLY_FILLED
+    assert Decimal(db_order_after.executed_quantity) == event_executed_quantity
+    assert tlg_transport.memory_length() > 0
+
+    # the balances from `outboundAccountPosition` are written, unknown assets are skipped
+    for asset, balance in event_asset_balance.items():
+        if BalanceMapper.map_asset(asset) == BalanceMapper.ASSET_UNKNOWN:
+            continue
+        assert Balance.select().where(
+            (Balance.asset == BalanceMapper.map_asset(asset))
+            & (Balance.free == Decimal(balance['free']))
+            & (Balance.locked == Decimal(balance['locked']))
+        ).count() == 1
+    assert Balance.select().where(Balance.asset == BalanceMapper.ASSET_UNKNOWN).count() == 0
+
+@pytest.mark.unit
+
+def test_unit_user_stream_map_execution_report(make_config):
+    order: dict[str, Any] = get_mock_orders()[0]
+    event: dict[str, Any] = _get_execution_report(order, 'NEW')
+    event['c'] = 'cancel-request-id'
+    event['C'] = order['clientOrderId']
+
+    mapped: dict[str, Any] = UserStreamCommand.func_map_execution_report(event)
+    for key in ['symbol', 'orderId', 'price', 'origQty', 'executedQty', 'cummulativeQuoteQty', 'status', 'type', 'side', 'clientOrderId']:
+        assert mapped[key] == order[key]
+    assert mapped['updateTime'] == event['T']
+    assert Order().fill_from_binance(mapped).binance_order_id == order['orderId']
@@ -0,0 +1,54 @@
+import pytest
+
+from cryptobot.commands import WebserverCommand
+from cryptobot.components import ServiceComponent
+from tests.ports.telegram_http_transport_mock import TelegramHttpTransportComponentMockPort
+
+
+def _get_update(chat_id: int, text: str) -> dict:
+    return {
+        'message': {
+            'chat': {'id': chat_id},
+            'text': text,
+        },
+    }
+
+@pytest.mark.integration
+
+def test_integration_webserver_in_process_workers(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    config = make_config
+    sc: ServiceComponent = di['service_component']
+    tlg_transport: TelegramHttpTransportComponentMockPort = sc.telegram_component.telegram_http_transport_component
+
+    chat_id: int = 112233
+
+    command = (WebserverCommand()
+               .set_payload('127.0.0.1', 8765, chat_id, workers=2, max_pending=2)
+               .set_deps(sc, di['view'], di['chart_renderer'])
+               )
+    client = command.create_app().test_client()
+    headers = {'X-Telegram-Bot-Api-Secret-Token': config['telegram']['bot_api_secret_token']}
+
+    # wrong secret token
+    response = client.post('/telegram/cryptobot', json=_get_update(chat_id, 'foo'), headers={'X-Telegram-Bot-Api-Secret-Token': 'wrong'})
+    assert response.status_code == 403
+
+    # the hook is answered immediately and executed by the pool
+    response = client.post('/telegram/cryptobot', json=_get_update(chat_id, 'foo'), headers=headers)
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'ok'
+
+    # all the slots are busy - Telegram has to re-deliver the update later
+    command._slots.acquire()
+    command._slots.acquire()
+    response = client.post('/telegram/cryptobot', json=_get_update(chat_id, 'bar'), headers=headers)
+    assert response.status_code == 503
+    command._slots.release()
+    command._slots.release()
+
+    command._executor.shutdown(wait=True)
+
+    assert tlg_transport.memory_length() == 1
+    assert tlg_transport.get_from_memory(index=0).data.get('text', '') == 'Unknown command: foo'
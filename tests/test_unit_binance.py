@@ -5,6 +5,8 @@ from typing import Any
 import pytest
 
 from cryptobot.components import ServiceComponent
+from cryptobot.helpers import current_millis
+from cryptobot.ports.binance_gateway import SymbolFilters
 from mocks.binance.orders import get_mock_orders
 from mocks.binance.avg_price import get_mock_avg_price
 from mocks.binance.trades import get_mock_trades
@@ -134,6 +136,30 @@ def test_unit_binance_get_historical_klines(db_session_conn, apply_seed_fixture,
                     else:
                         assert kline.get('close_time', 0) > kline.get('open_time', 0)
 
+def test_unit_binance_get_historical_klines_columns(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+
+    mock_historical_klines: dict[str, list[list[Any]]] = get_mock_historical_klines()
+    binance_client_adapter.seed_historical_klines(mock_historical_klines)
+
+    for full_key in mock_historical_klines.keys():
+        symbol, period, interval = full_key.split(':')
+        klines = sc.get_historical_klines_columns(symbol, period, interval)
+        mock_klines = mock_historical_klines[full_key]
+        assert len(klines) == len(mock_klines)
+        assert klines['open_time'].tolist() == [mock_kline[0] for mock_kline in mock_klines]
+        assert klines['close_time'].tolist() == [mock_kline[6] for mock_kline in mock_klines]
+        assert klines['open_price'].tolist() == [float(mock_kline[1]) for mock_kline in mock_klines]
+        assert klines['high_price'].tolist() == [float(mock_kline[2]) for mock_kline in mock_klines]
+        assert klines['low_price'].tolist() == [float(mock_kline[3]) for mock_kline in mock_klines]
+        assert klines['close_price'].tolist() == [float(mock_kline[4]) for mock_kline in mock_klines]
+        assert klines['volume'].tolist() == [float(mock_kline[5]) for mock_kline in mock_klines]
+
+    assert len(sc.map_historical_klines_columns([])) == 0
+
 def test_unit_binance_get_asset_balance(db_session_conn, apply_seed_fixture, make_config, make_di):
     apply_seed_fixture(seed_name='common')
     di = make_di
@@ -151,6 +177,35 @@ def test_unit_binance_get_asset_balance(db_session_conn, apply_seed_fixture, mak
 
     assert sc.get_asset_balance('unexisted_asset_sasadad') is None
 
+def test_unit_binance_get_asset_balances(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+
+    mock_asset_balance: dict[str, dict[str, str]] = get_mock_asset_balance()
+    binance_client_adapter.seed_asset_balance(mock_asset_balance)
+
+    asset_balances = sc.get_asset_balances(['USDT', 'ETH', 'unexisted_asset_sasadad'])
+    assert list(asset_balances.keys()) == ['USDT', 'ETH']
+    for asset, asset_balance in asset_balances.items():
+        assert asset_balance.get('free', None) == mock_asset_balance[asset]['free']
+        assert asset_balance.get('locked', None) == mock_asset_balance[asset]['locked']
+    # all the account's assets
+    assert sc.get_asset_balances().keys() == mock_asset_balance.keys()
+    assert binance_client_adapter.account_calls_count == 2
+
+    # the snapshot older than the awaited change is skipped, not waited for
+    binance_client_adapter.seed_account_update_time(current_millis() - 60000)
+    assert sc.get_asset_balances(['ETH'], updated_since=current_millis()) == {}
+    assert binance_client_adapter.account_calls_count == 3
+    assert sc.update_assets_from_binance_to_db(['ETH'], force_insert=True, updated_since=current_millis()) == 0
+    assert binance_client_adapter.account_calls_count == 4
+    # the fresh one is taken
+    binance_client_adapter.seed_account_update_time(None)
+    assert sc.get_asset_balances(['ETH'], updated_since=current_millis() - 1000).keys() == {'ETH'}
+    assert binance_client_adapter.account_calls_count == 5
+
 def test_unit_binance_get_symbol_info(db_session_conn, apply_seed_fixture, make_config, make_di):
     apply_seed_fixture(seed_name='common')
     di = make_di
@@ -196,6 +251,66 @@ def test_unit_binance_get_symbol_info(db_session_conn, apply_seed_fixture, make_
             else:
                 assert symbol_info[key] == mock[key]
 
+def test_unit_binance_get_symbol_filters(db_session_conn, apply_seed_fixture, make_config, make_di):
+    apply_seed_fixture(seed_name='common')
+    di = make_di
+    sc: ServiceComponent = di['service_component']
+    binance_client_adapter: BinanceClientAdapterMock = sc.binance_gateway.binance_client_adapter
+
+    binance_client_adapter.seed_symbol_info(get_mock_symbol_info())
+
+    symbol_filters = sc.binance_gateway.get_symbol_filters('ETHUSDT')
+    assert symbol_filters.base_asset == 'ETH'
+    assert symbol_filters.quote_asset == 'USDT'
+    assert symbol_filters.step_size == Decimal('0.0001')
+    assert symbol_filters.min_qty == Decimal('0.0001')
+    assert symbol_filters.max_qty == Decimal('9000')
+    assert symbol_filters.min_notional == Decimal('5')
+    assert symbol_filters.tick_size == Decimal('0.01')
+
+    # cached: filters and the raw symbol_info come from the single exchangeInfo call
+    sc.binance_gateway.get_symbol_filters('ETHUSDT')
+    sc.binance_gateway.get_symbol_info('ETHUSDT')
+    assert binance_client_adapter.exchange_info_calls_count == 1
+
+    # invalidated symbol is reloaded
+    sc.binance_gateway.invalidate_symbol_info('ETHUSDT')
+    assert sc.binance_gateway.get_symbol_filters('ETHUSDT') == symbol_filters
+    assert binance_client_adapter.exchange_info_calls_count == 2
+
+    # the fresh load is authoritative: an unknown symbol does not trigger a reload
+    assert sc.binance_gateway.get_symbol_filters('UNKNOWNSYMBOL') is None
+    assert sc.binance_gateway.get_symbol_info('UNKNOWNSYMBOL') == {}
+    assert binance_client_adapter.exchange_info_calls_count == 2
+
+    # expired cache is reloaded
+    sc.binance_gateway.symbol_info_ttl_seconds = 0
+    sc.binance_gateway.get_symbol_filters('ETHUSDT')
+    assert binance_client_adapter.exchange_info_calls_count == 3
+
+    assert sc.binance_gateway.get_symbol_filters('UNKNOWNSYMBOL') is None
+    assert binance_client_adapter.exchange_info_calls_count == 4
+
+def test_unit_binance_symbol_filters_fit_order(make_config):
+    symbol_filters = SymbolFilters.create(get_mock_symbol_info()['ETHUSDT'])
+
+    # price is rounded down to tick_size
+    assert symbol_filters.func_fit_price(Decimal('4410.123456')) == Decimal('4410.12')
+    # BUY spends the quote asset, quantity is rounded down to step_size
+    assert symbol_filters.func_fit_quantity('BUY', Decimal('4000'), Decimal('100')) == Decimal('0.025')
+    # SELL spends the base asset
+    assert symbol_filters.func_fit_quantity('SELL', Decimal('4000'), Decimal('0.12107340')) == Decimal('0.121')
+    # not even minQty
+    assert symbol_filters.func_fit_quantity('SELL', Decimal('4000'), Decimal('0.00005')) == Decimal('0')
+    # not more than maxQty
+    assert symbol_filters.func_fit_quantity('SELL', Decimal('4000'), Decimal('10000')) == Decimal('9000')
+
+    assert symbol_filters.func_get_violations(Decimal('0.025'), Decimal('4000.00')) == []
+    assert symbol_filters.func_get_violations(Decimal('0.02505'), Decimal('4000.00')) == ['LOT_SIZE']
+    assert symbol_filters.func_get_violations(Decimal('0.025'), Decimal('4000.005')) == ['PRICE_FILTER']
+    # 0.0010 * 4000 = 4 < minNotional 5
+    assert symbol_filters.func_get_violations(Decimal('0.0010'), Decimal('4000.00')) == ['NOTIONAL']
+
 def test_unit_binance_create_test_order_and_create_order(db_session_conn, apply_seed_fixture, make_config, make_di):
     apply_seed_fixture(seed_name='common')
     di = make_di
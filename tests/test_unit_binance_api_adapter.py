@@ -0,0 +1,68 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from cryptobot.components import BinanceApiAdapter, BinanceGateway
+from tests.components.binance_client_adapter_mock import BinanceClientAdapterMock
+from tests.components.http_transport_adapter_mock import HttpTransportAdapterMock
+
+
+def _get_trades_page(from_id: int, count: int) -> list[dict]:
+    return [{'id': from_id + i, 'orderId': 1, 'symbol': 'ETHUSDT'} for i in range(count)]
+
+def _create_adapter() -> tuple[BinanceApiAdapter, HttpTransportAdapterMock]:
+    binance_api_adapter = BinanceApiAdapter.create(
+        base_url='https://api.binance.com',
+        binance_api_key='key',
+        binance_api_secret='secret',
+        connect_timeout=1.5,
+        read_timeout=7.0,
+    )
+    transport = HttpTransportAdapterMock()
+    binance_api_adapter.session.mount('https://', transport)
+    return binance_api_adapter, transport
+
+@pytest.mark.unit
+
+def test_unit_binance_api_adapter_session(make_config):
+    binance_api_adapter, transport = _create_adapter()
+    binance_gateway = BinanceGateway.create(
+        binance_client_adapter=BinanceClientAdapterMock(),
+        binance_api_adapter=binance_api_adapter,
+    )
+    session = binance_api_adapter.session
+    transport.seed_responses([
+        (200, _get_trades_page(10, 1000)),
+        (200, _get_trades_page(1010, 5)),
+    ])
+
+    trades = binance_gateway.get_all_trades(binance_symbol='ETHUSDT', from_id=10)
+
+    # all the pages are loaded through the same keep-alive session, no extra request for an empty page
+    assert binance_api_adapter.session is session
+    assert len(trades) == 1005
+    assert len(transport.sent) == 2
+    assert parse_qs(urlparse(transport.sent[0]['request'].url).query)['fromId'] == ['10']
+    assert parse_qs(urlparse(transport.sent[1]['request'].url).query)['fromId'] == ['1010']
+    for sent in transport.sent:
+        assert sent['timeout'] == (1.5, 7.0)
+        assert sent['request'].headers['X-MBX-APIKEY'] == 'key'
+        assert 'signature' in parse_qs(urlparse(sent['request'].url).query)
+
+    binance_api_adapter.close()
+
+@pytest.mark.unit
+
+def test_unit_binance_api_adapter_errors(make_config):
+    binance_api_adapter, transport = _create_adapter()
+    transport.seed_responses([
+        (400, {'code': -1100, 'msg': 'Illegal characters found in parameter'}),
+    ])
+
+    response = binance_api_adapter.request(endpoint='/api/v3/myTrades', params={'symbol': 'ETHUSDT'})
+    assert response['status'] == 400
+
+    # no seeded response - connection timeout, there is no response at all
+    response = binance_api_adapter.request(endpoint='/api/v3/myTrades', params={'symbol': 'ETHUSDT'})
+    assert response['status'] is None
+    assert 'No seeded response' in response['error']
@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+
+from cryptobot.components import ChartCache
+from cryptobot.helpers.klines import klines_to_columns
+from tests.mocks.binance.historical_klines import get_mock_historical_klines
+from tests.mocks.binance.orders import get_mock_orders
+
+
+@pytest.mark.unit
+
+def test_unit_chart_cache_key(make_config):
+    mock_klines = get_mock_historical_klines()['ETHUSDT:1_hour_ago_UTC:1m']
+    orders = [order for order in get_mock_orders() if order['status'] == 'NEW']
+
+    key = ChartCache.func_make_key('ETHUSDT', '1 hour ago UTC', '1m', klines_to_columns(mock_klines), orders)
+    # the same candles and orders (in any order) - the same key
+    assert key == ChartCache.func_make_key('ETHUSDT', '1 hour ago UTC', '1m', klines_to_columns(mock_klines), list(reversed(orders)))
+    # a new candle has opened
+    assert key != ChartCache.func_make_key('ETHUSDT', '1 hour ago UTC', '1m', klines_to_columns(mock_klines[:-1]), orders)
+    # the open orders have changed
+    assert key != ChartCache.func_make_key('ETHUSDT', '1 hour ago UTC', '1m', klines_to_columns(mock_klines), orders[1:])
+    assert key != ChartCache.func_make_key('ETHUSDT', '3 hours ago UTC', '1m', klines_to_columns(mock_klines), orders)
+    # no candles at all
+    assert ChartCache.func_make_key('ETHUSDT', '1 hour ago UTC', '1m', klines_to_columns([]), []) != key
+
+
+@pytest.mark.unit
+def test_unit_chart_cache_memory(make_config):
+    chart_cache = ChartCache(max_items=2, ttl_seconds=60)
+
+    chart_cache.put('a', b'png-a')
+    chart_cache.put('b', b'png-b')
+    assert chart_cache.get('a') == b'png-a'
+    # 'b' is the least recently used one
+    chart_cache.put('c', b'png-c')
+    assert chart_cache.get('b') is None
+    assert chart_cache.get('a') == b'png-a'
+    assert chart_cache.get('c') == b'png-c'
+
+    # expired
+    chart_cache.ttl_seconds = 0
+    assert chart_cache.get('a') is None
+
+
+@pytest.mark.unit
+def test_unit_chart_cache_disk(make_config, tmp_path):
+    chart_cache = ChartCache(max_items=2, ttl_seconds=60, cache_dir=str(tmp_path))
+    chart_cache.put('ETHUSDT:1 hour ago UTC:1m:1:hash', b'png')
+
+    # another process (another instance) finds the chart on the disk
+    other_chart_cache = ChartCache(max_items=2, ttl_seconds=60, cache_dir=str(tmp_path))
+    assert other_chart_cache.get('ETHUSDT:1 hour ago UTC:1m:1:hash') == b'png'
+    assert other_chart_cache.get('ETHUSDT:1 hour ago UTC:1m:2:hash') is None
+
+    other_chart_cache.clear()
+    other_chart_cache.ttl_seconds = 0
+    assert other_chart_cache.get('ETHUSDT:1 hour ago UTC:1m:1:hash') is None
+
+
+@pytest.mark.unit
+def test_unit_chart_cache_disk_prune(make_config, tmp_path):
+    chart_cache = ChartCache(max_items=2, ttl_seconds=60, cache_dir=str(tmp_path))
+    chart_cache.put('ETHUSDT:1 hour ago UTC:1m:1:hash', b'png-1')
+    chart_cache.put('ETHUSDT:1 hour ago UTC:1m:2:hash', b'png-2')
+    old_path = chart_cache._func_get_path('ETHUSDT:1 hour ago UTC:1m:1:hash')
+    expired_at = time.time() - 61
+    os.utime(old_path, (expired_at, expired_at))
+    # a leftover of an interrupted write
+    (tmp_path / 'leftover.png.1.1.tmp').write_bytes(b'png')
+    os.utime(tmp_path / 'leftover.png.1.1.tmp', (expired_at, expired_at))
+
+    # the next candle: the expired files are deleted, the actual ones are kept
+    chart_cache.put('ETHUSDT:1 hour ago UTC:1m:3:hash', b'png-3')
+    assert sorted(os.listdir(tmp_path)) == sorted([
+        os.path.basename(chart_cache._func_get_path('ETHUSDT:1 hour ago UTC:1m:2:hash')),
+        os.path.basename(chart_cache._func_get_path('ETHUSDT:1 hour ago UTC:1m:3:hash')),
+    ])
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from cryptobot.components import ChartRenderer
+from cryptobot.helpers.klines import klines_to_columns
+from tests.mocks.binance.historical_klines import get_mock_historical_klines
+from tests.mocks.binance.orders import get_mock_orders
+
+
+@pytest.mark.unit
+
+def test_unit_chart_renderer_reuses_figure(make_config):
+    klines = klines_to_columns(get_mock_historical_klines()['ETHUSDT:1_hour_ago_UTC:1m'])
+    orders = [order for order in get_mock_orders() if order['status'] == 'NEW']
+    dates = klines['open_time'].astype('datetime64[ms]')
+
+    chart_renderer = ChartRenderer.create()
+    png = chart_renderer.render_price_chart(dates, klines['low_price'], klines['high_price'], klines['close_price'], orders, 'title', 'Price (ETHUSDT)')
+    assert png.startswith(b'\x89PNG')
+
+    figure = chart_renderer._figure
+    lines_count = len(chart_renderer._axes.lines)
+    texts_count = len(chart_renderer._axes.texts)
+
+    # the same figure is reused, the current price / orders lines of the previous render are gone
+    png = chart_renderer.render_price_chart(dates[:-1], klines['low_price'][:-1], klines['high_price'][:-1], klines['close_price'][:-1], [], 'title', 'Price (ETHUSDT)')
+    assert png.startswith(b'\x89PNG')
+    assert chart_renderer._figure is figure
+    assert len(chart_renderer._axes.lines) == lines_count
+    assert len(chart_renderer._axes.texts) == texts_count
+
+    # the axes follow the new data
+    assert chart_renderer._axes.get_ylim()[1] >= float(np.max(klines['high_price'][:-1]))
+
+    chart_renderer.close()
+    assert chart_renderer._figure is None
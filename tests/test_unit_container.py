@@ -0,0 +1,84 @@
+from argparse import Namespace
+
+import pytest
+
+from cryptobot.components import Container, BinanceClientAdapter, dispatch
+
+
+@pytest.mark.unit
+
+def test_unit_container_builds_on_first_access(make_config):
+    built = []
+
+    def create_db(di: Container):
+        built.append('db')
+        return object()
+
+    def create_service_component(di: Container):
+        built.append('service_component')
+        return ('service', di['db'])
+
+    di = Container(
+        {
+            'db': create_db,
+            'service_component': create_service_component,
+            'chart_renderer': lambda di: built.append('chart_renderer'),
+        },
+        config=make_config,
+    )
+
+    assert built == []
+    assert di['config'] is make_config
+    assert 'chart_renderer' in di and not di.func_is_built('chart_renderer')
+
+    service_component = di['service_component']
+    # the deps of a dependency are taken from the container as well, everything once
+    assert service_component is di['service_component']
+    assert service_component[1] is di['db']
+    assert built == ['service_component', 'db']
+
+    assert di.get('unknown') is None
+    with pytest.raises(KeyError):
+        _ = di['unknown']
+
+
+@pytest.mark.unit
+def test_unit_container_dispatch_builds_only_command_deps(make_config):
+    built = []
+
+    def factory(name: str):
+        def create(di: Container):
+            built.append(name)
+            return object()
+        return create
+
+    di = Container(
+        {name: factory(name) for name in ('view', 'db', 'service_component', 'chart_renderer', 'binance_user_stream_adapter')},
+        config=make_config,
+    )
+
+    err, command = dispatch(di, Namespace(command='cron'))
+    assert err is None and command is not None
+    assert sorted(built) == ['service_component', 'view']
+
+
+@pytest.mark.unit
+def test_unit_binance_client_adapter_creates_client_lazily():
+    created = []
+
+    class ClientStub:
+        def get_open_orders(self):
+            return []
+
+    def binance_client_factory():
+        created.append(1)
+        return ClientStub()
+
+    binance_client_adapter = BinanceClientAdapter(binance_client_factory=binance_client_factory)
+    assert created == []
+    assert binance_client_adapter.get_open_orders() == []
+    assert binance_client_adapter.get_open_orders() == []
+    assert created == [1]
+
+    with pytest.raises(ValueError):
+        BinanceClientAdapter()
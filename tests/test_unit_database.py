@@ -0,0 +1,44 @@
+import pytest
+from peewee import OperationalError
+
+from cryptobot.models import ReconnectPooledMySQLDatabase
+
+
+def _create_database(make_config, reconnect_attempts: int) -> ReconnectPooledMySQLDatabase:
+    db_config: dict = dict(make_config['db'])
+    db_config['reconnect_attempts'] = reconnect_attempts
+    db_config['reconnect_delay_seconds'] = 0.0
+    return ReconnectPooledMySQLDatabase.create(db_config)
+
+@pytest.mark.unit
+
+def test_unit_database_reconnect_policy(make_config):
+    db = _create_database(make_config, reconnect_attempts=2)
+    assert db._max_connections == make_config['db']['max_connections']
+
+    calls: list[int] = []
+    def gone_away_twice():
+        calls.append(1)
+        if len(calls) <= 2:
+            raise OperationalError(2006, 'MySQL server has gone away')
+        return 'ok'
+
+    # the call is repeated on a fresh connection
+    assert db._reconnect(gone_away_twice) == 'ok'
+    assert len(calls) == 3
+
+    # not more than reconnect_attempts retries
+    calls.clear()
+    db = _create_database(make_config, reconnect_attempts=1)
+    with pytest.raises(OperationalError):
+        db._reconnect(gone_away_twice)
+    assert len(calls) == 2
+
+    # other errors are not retried
+    calls.clear()
+    def syntax_error():
+        calls.append(1)
+        raise OperationalError(1064, 'You have an error in your SQL syntax')
+    with pytest.raises(OperationalError):
+        db._reconnect(syntax_error)
+    assert len(calls) == 1
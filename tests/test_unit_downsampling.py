@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from cryptobot.helpers.downsampling import downsample_price_columns
+
+
+@pytest.mark.unit
+
+def test_unit_downsampling_price_columns(make_config):
+    # a week of 1m candles
+    length = 7 * 24 * 60
+    dates = (np.arange(length, dtype=np.int64) * 60_000 + 1_700_000_000_000).astype('datetime64[ms]')
+    close_prices = 3000 + 100 * np.sin(np.arange(length) / 500)
+    close_prices[5000] = 5000.0 # a spike
+    low_prices = close_prices - 10
+    high_prices = close_prices + 10
+    low_prices[7000] = 1000.0 # a wick
+
+    ds_dates, ds_low, ds_high, ds_close = downsample_price_columns(dates, low_prices, high_prices, close_prices, 1000)
+
+    assert len(ds_dates) == len(ds_low) == len(ds_high) == len(ds_close) == 1000
+    # the first and the last (current price) points are kept
+    assert ds_dates[0] == dates[0] and ds_close[0] == close_prices[0]
+    assert ds_dates[-1] == dates[-1] and ds_close[-1] == close_prices[-1]
+    assert np.all(np.diff(ds_dates.astype(np.int64)) > 0)
+    # the spike survives the LTTB, the wick survives the envelope
+    assert ds_close.max() == 5000.0
+    assert ds_low.min() == 1000.0
+    assert ds_high.max() == high_prices.max()
+    # the band still contains the line
+    assert np.all(ds_low <= ds_close) and np.all(ds_close <= ds_high)
+
+    # short ranges are plotted as they are
+    short = downsample_price_columns(dates[:500], low_prices[:500], high_prices[:500], close_prices[:500], 1000)
+    assert len(short[0]) == 500
+    assert np.array_equal(short[3], close_prices[:500])
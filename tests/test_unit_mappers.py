@@ -0,0 +1,51 @@
+import pytest
+
+from cryptobot.mappers.balance_mapper import BalanceMapper
+from cryptobot.mappers.order_mapper import OrderMapper
+
+
+@pytest.mark.unit
+
+def test_unit_mappers_map_and_remap():
+    for mapping, remapping, map_func, remap_func in (
+        (OrderMapper.type_mapping, OrderMapper.type_remapping, OrderMapper.map_type, OrderMapper.remap_type),
+        (OrderMapper.status_mapping, OrderMapper.status_remapping, OrderMapper.map_status, OrderMapper.remap_status),
+        (OrderMapper.side_mapping, OrderMapper.side_remapping, OrderMapper.map_side, OrderMapper.remap_side),
+        (OrderMapper.symbol_mapping, OrderMapper.symbol_remapping, OrderMapper.map_symbol, OrderMapper.remap_symbol),
+        (BalanceMapper.asset_mapping, BalanceMapper.asset_remapping, BalanceMapper.map_asset, BalanceMapper.remap_asset),
+    ):
+        assert len(remapping) == len(mapping)
+        for name, value in mapping.items():
+            assert map_func(name.lower()) == value
+            assert remap_func(value) == name
+
+    assert OrderMapper.map_type('LIMIT_MAKER') == OrderMapper.TYPE_LIMIT_MAKER
+    assert OrderMapper.remap_type(OrderMapper.TYPE_LIMIT_MAKER) == 'LIMIT_MAKER'
+    assert OrderMapper.map_symbol('BTCUSDT') == OrderMapper.SYMBOL_UNKNOWN
+    assert OrderMapper.map_status(None) == OrderMapper.STATUS_UNKNOWN
+    assert OrderMapper.remap_side(OrderMapper.SIDE_UNKNOWN) is None
+    assert OrderMapper.remap_status(100) is None
+
+
+@pytest.mark.unit
+def test_unit_mappers_register(monkeypatch):
+    monkeypatch.setattr(OrderMapper, 'symbol_mapping', dict(OrderMapper.symbol_mapping))
+    monkeypatch.setattr(OrderMapper, 'symbol_remapping', dict(OrderMapper.symbol_remapping))
+    monkeypatch.setattr(BalanceMapper, 'asset_mapping', dict(BalanceMapper.asset_mapping))
+    monkeypatch.setattr(BalanceMapper, 'asset_remapping', dict(BalanceMapper.asset_remapping))
+
+    OrderMapper.register_symbol('btcusdt', 2)
+    # the same registration again is fine
+    OrderMapper.register_symbol('BTCUSDT', 2)
+    assert OrderMapper.map_symbol('BTCUSDT') == 2
+    assert OrderMapper.remap_symbol(2) == 'BTCUSDT'
+    with pytest.raises(ValueError):
+        OrderMapper.register_symbol('BNBUSDT', OrderMapper.SYMBOL_ETHUSDT)
+    with pytest.raises(ValueError):
+        OrderMapper.register_symbol('ETHUSDT', 3)
+
+    BalanceMapper.register_asset('BTC', 3)
+    assert BalanceMapper.map_asset('btc') == 3
+    assert 'BTC' in BalanceMapper.get_assets()
+    with pytest.raises(ValueError):
+        BalanceMapper.register_asset('BNB', BalanceMapper.ASSET_ETH)
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from cryptobot.components import Container
+from cryptobot.startup_profiler import StartupProfiler, func_is_profiling_requested
+
+
+@pytest.mark.unit
+
+def test_unit_startup_profiler_measures_imports(tmp_path, monkeypatch):
+    (tmp_path / "startup_profiler_slow_module.py").write_text(
+        "import time\nimport startup_profiler_nested_module\ntime.sleep(0.05)\n"
+    )
+    (tmp_path / "startup_profiler_nested_module.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    profiler = StartupProfiler.start()
+    try:
+        import startup_profiler_slow_module
+    finally:
+        profiler.proc_stop()
+        sys.modules.pop("startup_profiler_slow_module", None)
+        sys.modules.pop("startup_profiler_nested_module", None)
+
+    self_seconds, total_seconds = profiler.imports["startup_profiler_slow_module"]
+    nested_self_seconds, nested_total_seconds = profiler.imports["startup_profiler_nested_module"]
+    # the nested import is in the cumulative time of the outer module only
+    assert self_seconds >= 0.05 and total_seconds >= self_seconds + 0.02
+    assert nested_self_seconds == pytest.approx(nested_total_seconds) and nested_total_seconds >= 0.02
+
+    report = profiler.func_report("cron", budget_ms=60000)
+    lines = report.splitlines()
+    assert lines[0].startswith("Startup profile of 'cron'")
+    # ranked by self time
+    assert lines.index(next(l for l in lines if l.endswith("startup_profiler_slow_module"))) \
+        < lines.index(next(l for l in lines if l.endswith("startup_profiler_nested_module")))
+    assert lines[-1] == "Budget for 'cron': 60000 ms - OK"
+
+
+@pytest.mark.unit
+def test_unit_startup_profiler_budget_and_dependencies():
+    def create_db(di: Container):
+        time.sleep(0.02)
+        return object()
+
+    def create_service_component(di: Container):
+        return di['db']
+
+    di = Container({'db': create_db, 'service_component': create_service_component})
+    profiler = StartupProfiler()
+    _ = di['service_component']
+    profiler.proc_stop()
+
+    build_seconds = di.func_get_build_seconds()
+    assert build_seconds['db'][0] >= 0.02
+    # the time of the nested dependency is in the cumulative time only
+    assert build_seconds['service_component'][0] < 0.02 <= build_seconds['service_component'][1]
+
+    assert not profiler.func_is_over_budget(0)
+    assert profiler.func_is_over_budget(1)
+    report = profiler.func_report("hook", build_seconds, budget_ms=1)
+    assert "service_component" in report and "db" in report
+    assert "Budget for 'hook': 1 ms - EXCEEDED" in report.splitlines()[-1]
+
+    assert func_is_profiling_requested(["cryptobot", "--profile-startup", "cron"], {})
+    assert func_is_profiling_requested(["cryptobot", "cron"], {"CRYPTOBOT_PROFILE_STARTUP": "1"})
+    assert not func_is_profiling_requested(["cryptobot", "cron"], {})
+
+
+@pytest.mark.unit
+def test_unit_startup_profiler_command_budgets_are_case_insensitive():
+    from cryptobot.__main__ import func_get_startup_budget_ms
+
+    config = {"startup": {"budget_ms": 0, "command_budgets_ms": {"Cron": 700, "hook": 500}}}
+    assert func_get_startup_budget_ms(config, "cron") == 700
+    assert func_get_startup_budget_ms(config, "HOOK") == 500
+    assert func_get_startup_budget_ms(config, "scheduler") == 0
+
+
+@pytest.mark.unit
+def test_unit_startup_profiler_ports_are_leaf_imports():
+    # a fresh interpreter: the ports import neither numpy nor the components (and no import cycle through them)
+    code = (
+        "import sys\n"
+        "import cryptobot.ports.binance_gateway, cryptobot.ports.binance_client_adapter\n"
+        "assert 'numpy' not in sys.modules and 'cryptobot.components' not in sys.modules, sorted(sys.modules)\n"
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", code], cwd=project_root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
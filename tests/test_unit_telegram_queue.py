@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+from cryptobot.components import TelegramComponent, QueuedTelegramComponent
+from tests.components.telegram_http_transport_mock import TelegramHttpTransportMockComponent
+
+
+def _create_queued_telegram_component(make_config, per_chat_interval_seconds: float = 0.0, max_retries: int = 3) -> tuple[QueuedTelegramComponent, TelegramHttpTransportMockComponent]:
+    tlg_transport = TelegramHttpTransportMockComponent()
+    telegram_component = TelegramComponent.create(make_config['telegram'], tlg_transport)
+    queued_telegram_component = QueuedTelegramComponent(
+        telegram_component=telegram_component,
+        per_chat_interval_seconds=per_chat_interval_seconds,
+        global_per_second=30,
+        max_retries=max_retries,
+    )
+    return queued_telegram_component, tlg_transport
+
+@pytest.mark.unit
+
+def test_unit_telegram_queue_merges_consecutive_messages(make_config):
+    queued_telegram_component, tlg_transport = _create_queued_telegram_component(make_config)
+
+    # the worker is kept busy by the first message, so the following ones are piled up in the queue
+    tlg_transport.seed_responses([(429, {'ok': False, 'parameters': {'retry_after': 0.2}})])
+    queued_telegram_component.send_telegram_message(1, 'first')
+    time.sleep(0.05)
+    queued_telegram_component.send_telegram_message(1, 'second')
+    queued_telegram_component.send_telegram_message(1, 'third')
+    queued_telegram_component.send_telegram_message(2, 'other chat')
+    queued_telegram_component.send_telegram_message(2, 'with buttons', [[{'text': 'ok', 'callback_data': 'ok'}]])
+    queued_telegram_component.send_telegram_message(2, 'after buttons')
+
+    assert queued_telegram_component.flush(timeout=5)
+    queued_telegram_component.close()
+
+    texts = [message.data['text'] for message in tlg_transport.messages]
+    # 429 is retried with the same text
+    assert texts[0:2] == ['first', 'first']
+    # consecutive plain messages to the same chat are merged, messages with buttons are not
+    assert texts[2:] == ['second\nthird', 'other chat', 'with buttons', 'after buttons']
+
+
+@pytest.mark.unit
+def test_unit_telegram_queue_respects_limits(make_config):
+    queued_telegram_component, tlg_transport = _create_queued_telegram_component(
+        make_config,
+        per_chat_interval_seconds=0.3,
+        max_retries=1,
+    )
+
+    # too long to be merged
+    long_text = 'x' * 3000
+    started_at = time.monotonic()
+    queued_telegram_component.send_telegram_message(1, long_text)
+    queued_telegram_component.send_telegram_message(1, long_text)
+    assert queued_telegram_component.flush(timeout=5)
+    # the second message to the same chat waited for the per-chat interval
+    assert time.monotonic() - started_at >= 0.3
+    assert tlg_transport.memory_length() == 2
+
+    # the message is dropped after max_retries, the queue is not stuck
+    tlg_transport.clear()
+    tlg_transport.seed_responses([
+        (429, {'ok': False, 'parameters': {'retry_after': 0.01}}),
+        (429, {'ok': False, 'parameters': {'retry_after': 0.01}}),
+    ])
+    queued_telegram_component.send_telegram_message(2, 'dropped')
+    queued_telegram_component.send_telegram_message(3, 'delivered')
+    assert queued_telegram_component.flush(timeout=5)
+    queued_telegram_component.close()
+
+    assert [message.data['text'] for message in tlg_transport.messages] == ['dropped', 'dropped', 'delivered']
@@ -0,0 +1,31 @@
+import pytest
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+from cryptobot.views.view import View
+
+
+def _create_view(views_dir, cache_dir) -> View:
+    return View(Environment(
+        loader=FileSystemLoader(str(views_dir)),
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+    ))
+
+@pytest.mark.unit
+
+def test_unit_view_preloads_templates_into_bytecode_cache(tmp_path):
+    views_dir = tmp_path / 'views'
+    (views_dir / 'telegram').mkdir(parents=True)
+    (views_dir / 'telegram' / 'price.j2').write_text('{{ symbol }}: {{ price }}')
+    (views_dir / 'telegram' / 'notes.txt').write_text('not a template')
+    cache_dir = tmp_path / 'cache'
+    cache_dir.mkdir()
+
+    assert _create_view(views_dir, cache_dir).preload_templates() == ['telegram/price.j2']
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # another process takes the compiled template from the cache
+    view = _create_view(views_dir, cache_dir)
+    def compile_template(*args, **kwargs):
+        raise AssertionError('the template must not be compiled again')
+    view._environment.compile = compile_template
+    assert view.render('telegram/price.j2', {'symbol': 'ETHUSDT', 'price': 1}) == 'ETHUSDT: 1'